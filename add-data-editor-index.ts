@@ -1,12 +1,37 @@
- // add-data-editor-ids.js 
+ // add-data-editor-ids.js
+ // Usage: add-data-editor-index.ts [--watch]
+ //
+ // Files whose content hash matches the cache (including files this script
+ // just stamped) are skipped; the rest are parsed on a pool of worker
+ // threads. --watch keeps running and restamps each file as it changes.
  const fs = require('fs');
+ const os = require('os');
  const path = require('path');
+ const crypto = require('crypto');
+ const { isMainThread } = require('worker_threads');
+ const { createPool, serveJobs } = require('./scripts/worker-pool');
  const { parse } = require('@babel/parser');
  const traverse = require('@babel/traverse').default;
  const t = require('@babel/types');
  const generate = require('@babel/generator').default;
  const { glob } = require('glob');
- 
+
+ // Content hashes of files that need no (further) stamping
+ const CACHE_FILE = path.join(process.cwd(), 'node_modules', '.cache', 'add-data-editor-index.json');
+ // Bump when the transform changes to invalidate every cached entry
+ const TRANSFORM_VERSION = 1;
+
+ const IGNORED_DIRS = ['node_modules', '.git', '.next', 'dist', 'build'];
+ // Editors often save in several writes; wait for the file to settle
+ const WATCH_DEBOUNCE_MS = 100;
+
+ function hashSource(source) {
+   return crypto.createHash('sha256')
+     .update(`${TRANSFORM_VERSION}\0`)
+     .update(source)
+     .digest('hex');
+ }
+
  class EditorIdTransformer {
    constructor() {
      this.rootDir = process.cwd();
@@ -18,114 +43,210 @@
        'src/**/*.{tsx,jsx}',
      ];
    }
- 
+
    isLowerCaseHtmlTag(name) {
      if (!t.isJSXIdentifier(name)) return false;
      const n = name.name;
      return /^[a-z]/.test(n);
    }
- 
+
    hasAttribute(attrs, attrName) {
      return attrs.some(
        (a) => t.isJSXAttribute(a) && t.isJSXIdentifier(a.name) && a.name.name === attrName
      );
    }
- 
-   transformFile(filePath) {
+
+   // Returns the stamped code, or null when every element already has an ID
+   transformSource(source, filePath) {
+     const relPath = path.relative(this.rootDir, filePath).replace(/\\/g, '/');
+
+     // Parse the file
+     const ast = parse(source, {
+       sourceFilename: filePath,
+       sourceType: 'module',
+       plugins: ['typescript', 'jsx', 'decorators-legacy'],
+     });
+
+     let hasChanges = false;
+
+     traverse(ast, {
+       JSXOpeningElement: (path) => {
+         const opening = path.node;
+
+         // Only tag lowercase HTML elements (not React components)
+         const isHtml = this.isLowerCaseHtmlTag(opening.name);
+         if (!isHtml) return;
+
+         // Skip if already has the attribute
+         if (this.hasAttribute(opening.attributes, this.attributeName)) return;
+
+         // Get location info
+         const loc = opening.loc?.start;
+         const line = loc?.line ?? 0;
+         const column = (loc?.column ?? 0) + 1;
+
+         const idValue = `${relPath}:${line}:${column}`;
+
+         const attr = t.jsxAttribute(
+           t.jsxIdentifier(this.attributeName),
+           t.stringLiteral(idValue)
+         );
+
+         // Add the attribute as the first attribute
+         opening.attributes.unshift(attr);
+         hasChanges = true;
+       },
+     });
+
+     if (!hasChanges) return null;
+
+     // Generate the modified code
+     return generate(ast, {
+       retainLines: true,
+       compact: false,
+     }).code;
+   }
+
+   // Stamps one file in this thread; returns whether it was rewritten
+   transformFile(filePath, cache) {
+     const relPath = path.relative(this.rootDir, filePath).replace(/\\/g, '/');
      try {
        const source = fs.readFileSync(filePath, 'utf-8');
-       const relPath = path.relative(this.rootDir, filePath).replace(/\\/g, '/');
- 
-       // Parse the file
-       const ast = parse(source, {
-         sourceFilename: filePath,
-         sourceType: 'module',
-         plugins: ['typescript', 'jsx', 'decorators-legacy'],
-       });
- 
-       let hasChanges = false;
- 
-       traverse(ast, {
-         JSXOpeningElement: (path) => {
-           const opening = path.node;
- 
-           // Only tag lowercase HTML elements (not React components)
-           const isHtml = this.isLowerCaseHtmlTag(opening.name);
-           if (!isHtml) return;
- 
-           // Skip if already has the attribute
-           if (this.hasAttribute(opening.attributes, this.attributeName)) return;
- 
-           // Get location info
-           const loc = opening.loc?.start;
-           const line = loc?.line ?? 0;
-           const column = (loc?.column ?? 0) + 1;
- 
-           const idValue = `${relPath}:${line}:${column}`;
- 
-           const attr = t.jsxAttribute(
-             t.jsxIdentifier(this.attributeName),
-             t.stringLiteral(idValue)
-           );
- 
-           // Add the attribute as the first attribute
-           opening.attributes.unshift(attr);
-           hasChanges = true;
-         },
-       });
- 
-       if (hasChanges) {
-         // Generate the modified code
-         const output = generate(ast, {
-           retainLines: true,
-           compact: false,
-         });
- 
+       const hash = hashSource(source);
+       if (cache[relPath] === hash) return false;
+
+       const code = this.transformSource(source, filePath);
+       if (code !== null) {
          // Write back to the file
-         fs.writeFileSync(filePath, output.code, 'utf-8');
+         fs.writeFileSync(filePath, code, 'utf-8');
          console.log(`✓ Added editor IDs to: ${relPath}`);
-         return true;
        }
- 
-       return false;
+       cache[relPath] = hashSource(code ?? source);
+       return code !== null;
      } catch (error) {
        console.error(`Error processing ${filePath}:`, error.message);
        return false;
      }
    }
- 
-   run() {
-     console.log('🔄 Adding data-editor-id attributes to HTML elements...');
-     
-     let totalFiles = 0;
-     let modifiedFiles = 0;
- 
+
+   listFiles() {
+     const files = new Set();
      this.watchPatterns.forEach(pattern => {
-       const files = glob.sync(pattern, {
-         ignore: [
-           '**/node_modules/**',
-           '**/.git/**',
-           '**/.next/**',
-           '**/dist/**',
-           '**/build/**',
-         ]
+       glob.sync(pattern, {
+         ignore: IGNORED_DIRS.map(dir => `**/${dir}/**`),
+       }).forEach((filePath) => {
+         if (filePath.match(/\.(tsx|jsx)$/)) files.add(filePath);
        });
- 
-       files.forEach((filePath) => {
-         if (filePath.match(/\.(tsx|jsx)$/)) {
-           totalFiles++;
-           if (this.transformFile(filePath)) {
-             modifiedFiles++;
+     });
+     return [...files].sort();
+   }
+
+   async run() {
+     console.log('🔄 Adding data-editor-id attributes to HTML elements...');
+
+     const cache = loadCache();
+     const nextCache = {};
+     const files = this.listFiles();
+
+     // Only files whose content changed since the last run go to the workers
+     const pending = [];
+     for (const filePath of files) {
+       const relPath = path.relative(this.rootDir, filePath).replace(/\\/g, '/');
+       const source = fs.readFileSync(filePath, 'utf-8');
+       const hash = hashSource(source);
+       if (cache[relPath] === hash) {
+         nextCache[relPath] = hash;
+       } else {
+         pending.push({ filePath, relPath, source });
+       }
+     }
+
+     let modifiedFiles = 0;
+     if (pending.length > 0) {
+       const poolSize = Math.min(pending.length, os.availableParallelism ? os.availableParallelism() : os.cpus().length);
+       const pool = createPool(poolSize, __filename);
+       try {
+         await Promise.all(pending.map(async ({ filePath, relPath, source }) => {
+           try {
+             const code = await pool.run({ filePath, source });
+             if (code !== null) {
+               // Write back to the file
+               fs.writeFileSync(filePath, code, 'utf-8');
+               console.log(`✓ Added editor IDs to: ${relPath}`);
+               modifiedFiles++;
+             }
+             nextCache[relPath] = hashSource(code ?? source);
+           } catch (error) {
+             console.error(`Error processing ${filePath}:`, error.message);
            }
+         }));
+       } finally {
+         await pool.close();
+       }
+     }
+     writeCache(nextCache);
+
+     console.log(`\n✅ Complete! Processed ${files.length} files (${files.length - pending.length} unchanged), modified ${modifiedFiles} files.`);
+     return nextCache;
+   }
+
+   watch(cache) {
+     const roots = [...new Set(this.watchPatterns.map(pattern => pattern.split('/')[0]))]
+       .filter(root => fs.existsSync(path.join(this.rootDir, root)));
+     const timers = new Map();
+
+     const onChange = (filePath) => {
+       clearTimeout(timers.get(filePath));
+       timers.set(filePath, setTimeout(() => {
+         timers.delete(filePath);
+         if (!fs.existsSync(filePath)) {
+           delete cache[path.relative(this.rootDir, filePath).replace(/\\/g, '/')];
+           return;
          }
+         // Our own write hashes to the cached value and is skipped here
+         if (this.transformFile(filePath, cache)) writeCache(cache);
+       }, WATCH_DEBOUNCE_MS));
+     };
+
+     for (const root of roots) {
+       fs.watch(path.join(this.rootDir, root), { recursive: true }, (event, name) => {
+         if (!name || !/\.(tsx|jsx)$/.test(name)) return;
+         if (name.split(path.sep).some(part => IGNORED_DIRS.includes(part))) return;
+         onChange(path.join(this.rootDir, root, name));
        });
-     });
- 
-     console.log(`\n✅ Complete! Processed ${totalFiles} files, modified ${modifiedFiles} files.`);
+     }
+     console.log(`👀 Watching ${roots.join(', ')} for changes...`);
+   }
+ }
+
+ function loadCache() {
+   try {
+     return JSON.parse(fs.readFileSync(CACHE_FILE, 'utf8'));
+   } catch {
+     return {};
    }
  }
- 
- // Run the transformer
- const transformer = new EditorIdTransformer();
- transformer.run();
- 
\ No newline at end of file
+
+ function writeCache(cache) {
+   fs.mkdirSync(path.dirname(CACHE_FILE), { recursive: true });
+   const tempPath = `${CACHE_FILE}.${process.pid}.tmp`;
+   fs.writeFileSync(tempPath, JSON.stringify(cache, null, 2) + '\n');
+   fs.renameSync(tempPath, CACHE_FILE);
+ }
+
+ if (isMainThread) {
+   // Run the transformer
+   const transformer = new EditorIdTransformer();
+   transformer.run()
+     .then((cache) => {
+       if (process.argv.includes('--watch')) transformer.watch(cache);
+     })
+     .catch((error) => {
+       console.error(error);
+       process.exitCode = 1;
+     });
+ } else {
+   // Workers only parse, traverse and generate; the main thread writes files
+   const transformer = new EditorIdTransformer();
+   serveJobs((job) => transformer.transformSource(job.source, job.filePath));
+ }
@@ -0,0 +1,103 @@
+import nodemailer, { type Transporter } from 'nodemailer';
+import { renderBookingEmail, type BookingDetails } from './template';
+
+// Pooled SMTP delivery for booking notifications.
+//
+// The transporter is created once per server instance and keeps a small pool
+// of authenticated SMTP connections open, so a booking only pays for the
+// handshake the first time (or after the server closes an idle connection).
+
+const SENDER = `"Brotherhood Barbershop" <kamalrajawi38@gmail.com>`;
+
+const MAX_CONNECTIONS = parseInt(process.env.BOOKING_SMTP_MAX_CONNECTIONS || '3');
+const MAX_MESSAGES = parseInt(process.env.BOOKING_SMTP_MAX_MESSAGES || '100');
+
+export interface SmtpConfig {
+  host: string;
+  port: number;
+  user: string;
+  password: string;
+  ownerEmail: string;
+}
+
+export type SmtpConfigResult =
+  | { config: SmtpConfig; missing?: undefined }
+  | { config?: undefined; missing: string[] };
+
+// Read the SMTP configuration from environment variables
+export function getSmtpConfig(): SmtpConfigResult {
+  const smtpHost = process.env.BREVO_SMTP_HOST;
+  const smtpPort = process.env.BREVO_SMTP_PORT;
+  const smtpUser = process.env.BREVO_SMTP_USER;
+  const smtpPassword = process.env.BREVO_SMTP_PASSWORD;
+  const ownerEmail = process.env.BARBERSHOP_OWNER_EMAIL;
+
+  if (!smtpHost || !smtpPort || !smtpUser || !smtpPassword || !ownerEmail) {
+    const missingVars = [];
+    if (!smtpHost) missingVars.push('BREVO_SMTP_HOST');
+    if (!smtpPort) missingVars.push('BREVO_SMTP_PORT');
+    if (!smtpUser) missingVars.push('BREVO_SMTP_USER');
+    if (!smtpPassword) missingVars.push('BREVO_SMTP_PASSWORD');
+    if (!ownerEmail) missingVars.push('BARBERSHOP_OWNER_EMAIL');
+    return { missing: missingVars };
+  }
+
+  return {
+    config: {
+      host: smtpHost,
+      port: parseInt(smtpPort),
+      user: smtpUser,
+      password: smtpPassword,
+      ownerEmail,
+    },
+  };
+}
+
+let transporter: Transporter | null = null;
+let transporterKey = '';
+
+// Reuse the pooled transporter unless the SMTP settings have changed
+function getTransporter(config: SmtpConfig): Transporter {
+  const key = `${config.host}:${config.port}:${config.user}:${config.password}`;
+  if (transporter && transporterKey === key) {
+    return transporter;
+  }
+
+  transporter?.close();
+  transporter = nodemailer.createTransport({
+    pool: true,
+    maxConnections: MAX_CONNECTIONS,
+    maxMessages: MAX_MESSAGES,
+    host: config.host,
+    port: config.port,
+    secure: false, // Use TLS
+    auth: {
+      user: config.user,
+      pass: config.password,
+    },
+  });
+  transporterKey = key;
+  return transporter;
+}
+
+// Render and send the owner notification for a booking
+export async function sendBookingEmail(booking: BookingDetails, config: SmtpConfig) {
+  const { subject, html, text } = renderBookingEmail(booking);
+
+  const info = await getTransporter(config).sendMail({
+    from: SENDER,
+    to: config.ownerEmail,
+    replyTo: booking.email,
+    subject,
+    text,
+    html,
+  });
+
+  console.log('Booking email sent:', {
+    messageId: info.messageId,
+    accepted: info.accepted,
+    rejected: info.rejected,
+  });
+
+  return info;
+}
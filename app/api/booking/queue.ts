@@ -0,0 +1,207 @@
+import { randomUUID } from 'crypto';
+import { mkdir, readdir, readFile, rename, unlink, writeFile } from 'fs/promises';
+import { join } from 'path';
+import { getSmtpConfig, sendBookingEmail } from './mailer';
+import type { BookingDetails } from './template';
+
+// Durable local queue for booking notifications.
+//
+// Each accepted booking is written to its own JSON file before the API
+// responds, then delivered in the background with exponential backoff. Jobs
+// survive restarts and are claimed by atomic rename, so several server
+// processes can share one queue directory without sending an email twice.
+
+const QUEUE_DIR = process.env.BOOKING_QUEUE_DIR || join(process.cwd(), '.booking-queue');
+const PENDING_DIR = join(QUEUE_DIR, 'pending');
+const FAILED_DIR = join(QUEUE_DIR, 'failed');
+
+const MAX_ATTEMPTS = 8;
+const BASE_RETRY_MS = 5 * 1000; // 5 seconds
+const MAX_RETRY_MS = 5 * 60 * 1000; // 5 minutes
+
+const CLAIM_SUFFIX = `.${process.pid}.sending`;
+
+interface BookingJob {
+  id: string;
+  booking: BookingDetails;
+  attempts: number;
+  createdAt: string;
+  nextAttemptAt: number;
+  lastError?: string;
+}
+
+let started = false;
+let recovered = false;
+let draining = false;
+let drainRequested = false;
+let timer: ReturnType<typeof setTimeout> | null = null;
+let timerAt = Infinity;
+
+// Write a job via a temporary file so readers never see a partial job
+async function writeJob(dir: string, job: BookingJob) {
+  const tmpPath = join(dir, `.${job.id}.tmp`);
+  await writeFile(tmpPath, JSON.stringify(job));
+  await rename(tmpPath, join(dir, `${job.id}.json`));
+}
+
+function retryDelay(attempts: number): number {
+  return Math.min(BASE_RETRY_MS * 2 ** (attempts - 1), MAX_RETRY_MS);
+}
+
+function isAlive(pid: number): boolean {
+  try {
+    process.kill(pid, 0);
+    return true;
+  } catch (error) {
+    return (error as NodeJS.ErrnoException).code === 'EPERM';
+  }
+}
+
+// Return jobs claimed by a process that died mid-delivery to the queue
+async function recoverClaims() {
+  for (const file of await readdir(PENDING_DIR)) {
+    const match = file.match(/^(.+\.json)\.(\d+)\.sending$/);
+    if (match && !isAlive(parseInt(match[2]))) {
+      await rename(join(PENDING_DIR, file), join(PENDING_DIR, match[1])).catch(() => {});
+    }
+  }
+}
+
+function scheduleDrain(delay: number) {
+  const at = Date.now() + delay;
+  if (timer && timerAt <= at) {
+    return;
+  }
+  if (timer) {
+    clearTimeout(timer);
+  }
+  timerAt = at;
+  timer = setTimeout(() => {
+    timer = null;
+    timerAt = Infinity;
+    void drain();
+  }, Math.max(delay, 0));
+}
+
+// Deliver one claimed job; returns when its next attempt is due, if any
+async function deliver(file: string, job: BookingJob): Promise<number | null> {
+  const claimedPath = join(PENDING_DIR, file + CLAIM_SUFFIX);
+  const { config } = getSmtpConfig();
+
+  try {
+    if (!config) {
+      throw new Error('SMTP configuration missing');
+    }
+    await sendBookingEmail(job.booking, config);
+    await unlink(claimedPath);
+    return null;
+  } catch (error) {
+    job.attempts += 1;
+    job.lastError = error instanceof Error ? error.message : 'Unknown error';
+
+    if (job.attempts >= MAX_ATTEMPTS) {
+      console.error(`Booking ${job.id} failed after ${job.attempts} attempts:`, job.lastError);
+      await writeJob(FAILED_DIR, job);
+      await unlink(claimedPath);
+      return null;
+    }
+
+    job.nextAttemptAt = Date.now() + retryDelay(job.attempts);
+    console.error(`Booking ${job.id} delivery failed (attempt ${job.attempts}), retrying:`, job.lastError);
+    await writeJob(PENDING_DIR, job);
+    await unlink(claimedPath);
+    return job.nextAttemptAt;
+  }
+}
+
+async function drain() {
+  if (draining) {
+    drainRequested = true;
+    return;
+  }
+  draining = true;
+
+  try {
+    await mkdir(PENDING_DIR, { recursive: true });
+    await mkdir(FAILED_DIR, { recursive: true });
+    if (!recovered) {
+      await recoverClaims();
+      recovered = true;
+    }
+
+    const now = Date.now();
+    let nextAttemptAt = Infinity;
+    const deliveries: Promise<number | null>[] = [];
+
+    for (const file of (await readdir(PENDING_DIR)).filter((name) => name.endsWith('.json')).sort()) {
+      const path = join(PENDING_DIR, file);
+      let job: BookingJob;
+      try {
+        job = JSON.parse(await readFile(path, 'utf8'));
+      } catch {
+        continue; // Claimed by another process in the meantime
+      }
+
+      if (job.nextAttemptAt > now) {
+        nextAttemptAt = Math.min(nextAttemptAt, job.nextAttemptAt);
+        continue;
+      }
+
+      // Claim the job; losing the rename means another process owns it
+      try {
+        await rename(path, path + CLAIM_SUFFIX);
+      } catch {
+        continue;
+      }
+      deliveries.push(deliver(file, job));
+    }
+
+    // The pooled transporter caps concurrent SMTP connections itself
+    for (const retryAt of await Promise.all(deliveries)) {
+      if (retryAt !== null) {
+        nextAttemptAt = Math.min(nextAttemptAt, retryAt);
+      }
+    }
+
+    if (nextAttemptAt < Infinity) {
+      scheduleDrain(nextAttemptAt - Date.now());
+    }
+  } catch (error) {
+    console.error('Error draining booking queue:', error);
+    scheduleDrain(BASE_RETRY_MS);
+  } finally {
+    draining = false;
+    if (drainRequested) {
+      drainRequested = false;
+      scheduleDrain(0);
+    }
+  }
+}
+
+// Persist a booking for background delivery and return its job id
+export async function enqueueBooking(booking: BookingDetails): Promise<string> {
+  await mkdir(PENDING_DIR, { recursive: true });
+
+  const job: BookingJob = {
+    id: `${Date.now()}-${randomUUID()}`,
+    booking,
+    attempts: 0,
+    createdAt: new Date().toISOString(),
+    nextAttemptAt: 0,
+  };
+  await writeJob(PENDING_DIR, job);
+
+  scheduleDrain(0);
+  return job.id;
+}
+
+// Pick up jobs left behind by a previous process (pending retries and claims
+// of a crashed sender) without waiting for the next booking to arrive. Only
+// called in queue mode, so other modes never touch the queue directory.
+export function startQueue() {
+  if (started) {
+    return;
+  }
+  started = true;
+  scheduleDrain(0);
+}
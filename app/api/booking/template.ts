@@ -0,0 +1,241 @@
+// Booking notification email, compiled once per server instance.
+//
+// The layouts below are split into static chunks and field slots when the
+// module loads, so rendering a booking is a single join over pre-built
+// strings instead of re-interpolating the whole document on every request.
+
+export interface BookingDetails {
+  name: string;
+  phone: string;
+  email: string;
+  preferredDate?: string;
+  preferredTime?: string;
+  service?: string;
+  notes?: string;
+}
+
+export interface RenderedEmail {
+  subject: string;
+  html: string;
+  text: string;
+}
+
+interface CompiledTemplate {
+  chunks: string[];
+  slots: string[];
+}
+
+function compile(template: string): CompiledTemplate {
+  const parts = template.split(/\{\{(\w+)\}\}/);
+  return {
+    chunks: parts.filter((_, i) => i % 2 === 0),
+    slots: parts.filter((_, i) => i % 2 === 1),
+  };
+}
+
+function render({ chunks, slots }: CompiledTemplate, values: Record<string, string>): string {
+  let out = chunks[0];
+  for (let i = 0; i < slots.length; i++) {
+    out += values[slots[i]] + chunks[i + 1];
+  }
+  return out;
+}
+
+const HTML_ESCAPES: Record<string, string> = {
+  '&': '&amp;',
+  '<': '&lt;',
+  '>': '&gt;',
+  '"': '&quot;',
+  "'": '&#39;',
+};
+
+// Request bodies are untyped JSON, so fields may arrive as numbers or null
+function escapeHtml(value: unknown): string {
+  return String(value ?? '').replace(/[&<>"']/g, (char) => HTML_ESCAPES[char]);
+}
+
+const HTML_TEMPLATE = compile(`
+      <!DOCTYPE html>
+      <html>
+        <head>
+          <meta charset="utf-8">
+          <meta name="viewport" content="width=device-width, initial-scale=1.0">
+          <title>New Booking Request</title>
+        </head>
+        <body style="margin: 0; padding: 0; font-family: Arial, sans-serif; background-color: #f4f4f4;">
+          <table role="presentation" style="width: 100%; border-collapse: collapse;">
+            <tr>
+              <td align="center" style="padding: 40px 0;">
+                <table role="presentation" style="width: 600px; border-collapse: collapse; background-color: #ffffff; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+                  <!-- Header -->
+                  <tr>
+                    <td style="padding: 40px 30px; background-color: #000000; text-align: center;">
+                      <h1 style="margin: 0; color: #ffffff; font-size: 28px; font-weight: bold;">New Booking Request</h1>
+                    </td>
+                  </tr>
+                  
+                  <!-- Content -->
+                  <tr>
+                    <td style="padding: 40px 30px;">
+                      <p style="margin: 0 0 20px; color: #333333; font-size: 16px; line-height: 1.5;">
+                        You have received a new booking request from your website:
+                      </p>
+                      
+                      <table role="presentation" style="width: 100%; border-collapse: collapse; margin: 20px 0;">
+                        <tr>
+                          <td style="padding: 12px; background-color: #f8f8f8; border-bottom: 1px solid #e0e0e0;">
+                            <strong style="color: #000000;">Name:</strong>
+                          </td>
+                          <td style="padding: 12px; background-color: #ffffff; border-bottom: 1px solid #e0e0e0; color: #333333;">
+                            {{name}}
+                          </td>
+                        </tr>
+                        <tr>
+                          <td style="padding: 12px; background-color: #f8f8f8; border-bottom: 1px solid #e0e0e0;">
+                            <strong style="color: #000000;">Phone:</strong>
+                          </td>
+                          <td style="padding: 12px; background-color: #ffffff; border-bottom: 1px solid #e0e0e0; color: #333333;">
+                            <a href="tel:{{phone}}" style="color: #0066cc; text-decoration: none;">{{phone}}</a>
+                          </td>
+                        </tr>
+                        <tr>
+                          <td style="padding: 12px; background-color: #f8f8f8; border-bottom: 1px solid #e0e0e0;">
+                            <strong style="color: #000000;">Email:</strong>
+                          </td>
+                          <td style="padding: 12px; background-color: #ffffff; border-bottom: 1px solid #e0e0e0; color: #333333;">
+                            <a href="mailto:{{email}}" style="color: #0066cc; text-decoration: none;">{{email}}</a>
+                          </td>
+                        </tr>
+                        <tr>
+                          <td style="padding: 12px; background-color: #f8f8f8; border-bottom: 1px solid #e0e0e0;">
+                            <strong style="color: #000000;">Preferred Date:</strong>
+                          </td>
+                          <td style="padding: 12px; background-color: #ffffff; border-bottom: 1px solid #e0e0e0; color: #333333;">
+                            {{formattedDate}}
+                          </td>
+                        </tr>
+                        <tr>
+                          <td style="padding: 12px; background-color: #f8f8f8; border-bottom: 1px solid #e0e0e0;">
+                            <strong style="color: #000000;">Preferred Time:</strong>
+                          </td>
+                          <td style="padding: 12px; background-color: #ffffff; border-bottom: 1px solid #e0e0e0; color: #333333;">
+                            {{formattedTime}}
+                          </td>
+                        </tr>
+                        <tr>
+                          <td style="padding: 12px; background-color: #f8f8f8; border-bottom: 1px solid #e0e0e0;">
+                            <strong style="color: #000000;">Service:</strong>
+                          </td>
+                          <td style="padding: 12px; background-color: #ffffff; border-bottom: 1px solid #e0e0e0; color: #333333;">
+                            {{service}}
+                          </td>
+                        </tr>
+                        {{notesRow}}
+                      </table>
+                      
+                      <p style="margin: 30px 0 0; color: #666666; font-size: 14px; line-height: 1.5;">
+                        Please contact the customer to confirm their appointment.
+                      </p>
+                    </td>
+                  </tr>
+                  
+                  <!-- Footer -->
+                  <tr>
+                    <td style="padding: 30px; background-color: #f8f8f8; text-align: center; border-top: 1px solid #e0e0e0;">
+                      <p style="margin: 0; color: #999999; font-size: 12px;">
+                        This email was sent from your Brotherhood Barbershop website booking form.
+                      </p>
+                    </td>
+                  </tr>
+                </table>
+              </td>
+            </tr>
+          </table>
+        </body>
+      </html>
+`);
+
+const NOTES_ROW_TEMPLATE = compile(`
+                        <tr>
+                          <td style="padding: 12px; background-color: #f8f8f8;">
+                            <strong style="color: #000000;">Additional Notes:</strong>
+                          </td>
+                          <td style="padding: 12px; background-color: #ffffff; color: #333333;">
+                            {{notes}}
+                          </td>
+                        </tr>
+                        `);
+
+const TEXT_TEMPLATE = compile(`New Booking Request
+
+You have received a new booking request from your website:
+
+Name: {{name}}
+Phone: {{phone}}
+Email: {{email}}
+Preferred Date: {{formattedDate}}
+Preferred Time: {{formattedTime}}
+Service: {{service}}
+{{notesLine}}
+
+Please contact the customer to confirm their appointment.
+
+---
+This email was sent from your Brotherhood Barbershop website booking form.`);
+
+// Format an "HH:MM" hour as a 12-hour clock time
+function formatHourForMessage(hourStr: string): string {
+  const [hours, minutes] = hourStr.split(':');
+  const hour = parseInt(hours);
+  if (hour === 0) return '12:00 AM';
+  if (hour === 12) return '12:00 PM';
+  if (hour < 12) return `${hour}:${minutes} AM`;
+  return `${hour - 12}:${minutes} PM`;
+}
+
+export function formatBookingDate(preferredDate?: string): string {
+  return preferredDate
+    ? new Date(preferredDate).toLocaleDateString('en-US', {
+      weekday: 'long',
+      year: 'numeric',
+      month: 'long',
+      day: 'numeric',
+    })
+    : 'Not specified';
+}
+
+export function formatBookingTime(preferredTime?: string): string {
+  return preferredTime
+    ? preferredTime.split('-').map(formatHourForMessage).join(' - ')
+    : 'Not specified';
+}
+
+export function renderBookingEmail(booking: BookingDetails): RenderedEmail {
+  const fields: Record<string, string> = {
+    name: booking.name,
+    phone: booking.phone,
+    email: booking.email,
+    formattedDate: formatBookingDate(booking.preferredDate),
+    formattedTime: formatBookingTime(booking.preferredTime),
+    service: booking.service || 'Not specified',
+    notes: booking.notes || '',
+  };
+
+  // User input is escaped in the HTML body; the text part is sent as-is
+  const escaped: Record<string, string> = {};
+  for (const [key, value] of Object.entries(fields)) {
+    escaped[key] = escapeHtml(value);
+  }
+
+  return {
+    subject: `New Booking Request from ${booking.name}`,
+    html: render(HTML_TEMPLATE, {
+      ...escaped,
+      notesRow: booking.notes ? render(NOTES_ROW_TEMPLATE, escaped) : '',
+    }),
+    text: render(TEXT_TEMPLATE, {
+      ...fields,
+      notesLine: booking.notes ? `Additional Notes: ${booking.notes}` : '',
+    }),
+  };
+}
@@ -0,0 +1,154 @@
+import { createHash } from 'crypto';
+import { watch, type FSWatcher } from 'fs';
+import { readdir, readFile, stat } from 'fs/promises';
+import { join } from 'path';
+
+// In-memory gallery index, loaded lazily on the first request.
+//
+// Production reads public/gallery/manifest.json, written by
+// `npm run gallery-manifest` before every build, and falls back to listing
+// the directory once. The serialized body and its ETag are computed when the
+// index changes, not per request. In development a watcher patches the
+// index as images are added or removed, so no TTL is needed.
+
+export interface GalleryImageSource {
+  type: string;
+  srcSet: string;
+}
+
+// Dimensions, placeholder and variants are only present in the manifest
+export interface GalleryImage {
+  src: string;
+  alt: string;
+  width?: number;
+  height?: number;
+  color?: string;
+  blurDataURL?: string;
+  sources?: GalleryImageSource[];
+}
+
+export interface GalleryIndex {
+  images: GalleryImage[];
+  body: string;
+  etag: string;
+}
+
+const GALLERY_PATH = join(process.cwd(), 'public', 'gallery');
+const MANIFEST_FILE = 'manifest.json';
+
+const IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.webp', '.gif'] as const;
+
+let indexPromise: Promise<GalleryIndex> | null = null;
+let watching = false;
+
+// Survives module reloads in dev so the previous module's watcher is closed
+const watcherStore = globalThis as typeof globalThis & { __galleryWatcher?: FSWatcher };
+
+function isImageFile(file: string): boolean {
+  const ext = file.toLowerCase().substring(file.lastIndexOf('.'));
+  return IMAGE_EXTENSIONS.includes(ext as typeof IMAGE_EXTENSIONS[number]);
+}
+
+function toGalleryImage(file: string): GalleryImage {
+  return {
+    src: `/gallery/${file}`,
+    alt: `Gallery image ${file.replace(/\.[^/.]+$/, '')}` // Remove extension for alt text
+  };
+}
+
+function buildIndex(images: GalleryImage[]): GalleryIndex {
+  const body = JSON.stringify({ images });
+  const etag = `"${createHash('sha1').update(body).digest('base64url')}"`;
+  return { images, body, etag };
+}
+
+async function readManifest(): Promise<GalleryImage[] | null> {
+  try {
+    const manifest = JSON.parse(await readFile(join(GALLERY_PATH, MANIFEST_FILE), 'utf8'));
+    return Array.isArray(manifest.images) ? manifest.images : null;
+  } catch {
+    return null;
+  }
+}
+
+async function loadIndex(): Promise<GalleryIndex> {
+  // Prefer the build-time manifest; fall back to listing the directory
+  const manifestImages = await readManifest();
+  if (manifestImages) {
+    return buildIndex(manifestImages);
+  }
+
+  const files = await readdir(GALLERY_PATH);
+  return buildIndex(
+    files
+      .filter(isImageFile)
+      .sort() // Sort alphabetically for consistent ordering
+      .map(toGalleryImage)
+  );
+}
+
+// Apply one watcher event to the current index instead of rescanning
+async function applyChange(file: string) {
+  if (file === MANIFEST_FILE) {
+    indexPromise = loadIndex();
+    return;
+  }
+  if (!isImageFile(file) || !indexPromise) {
+    return;
+  }
+
+  const current = await indexPromise.catch(() => null);
+  if (!current) {
+    indexPromise = null;
+    return;
+  }
+
+  const src = `/gallery/${file}`;
+  const exists = await stat(join(GALLERY_PATH, file)).then(() => true, () => false);
+  const previous = current.images.find((image) => image.src === src);
+  const images = current.images.filter((image) => image.src !== src);
+  if (exists) {
+    images.push(previous ?? toGalleryImage(file));
+    images.sort((a, b) => (a.src < b.src ? -1 : a.src > b.src ? 1 : 0));
+  }
+  indexPromise = Promise.resolve(buildIndex(images));
+}
+
+function watchGallery() {
+  watcherStore.__galleryWatcher?.close();
+  watching = true;
+  try {
+    const watcher = watch(GALLERY_PATH, (_event, filename) => {
+      if (!filename) {
+        indexPromise = null; // Platform gave no file name; rebuild on demand
+        return;
+      }
+      void applyChange(filename.toString());
+    });
+    watcher.on('error', () => {
+      watcher.close();
+      indexPromise = null;
+    });
+    watcherStore.__galleryWatcher = watcher;
+  } catch (error) {
+    console.error('Could not watch the gallery directory:', error);
+  }
+}
+
+export function getGalleryIndex(): Promise<GalleryIndex> {
+  if (!indexPromise) {
+    const loading = loadIndex();
+    indexPromise = loading;
+    // Retry on the next request instead of caching the failure
+    loading.catch(() => {
+      if (indexPromise === loading) {
+        indexPromise = null;
+      }
+    });
+
+    if (process.env.NODE_ENV === 'development' && !watching) {
+      watchGallery();
+    }
+  }
+  return indexPromise;
+}
@@ -1,66 +1,40 @@
-import { NextResponse } from 'next/server';
-import { readdir } from 'fs/promises';
-import { join } from 'path';
+import { NextRequest, NextResponse } from 'next/server';
+import { getGalleryIndex } from './gallery-index';
 
-interface GalleryImage {
-  src: string;
-  alt: string;
-}
-
-// Cache the gallery images list for 1 hour
-let cachedImages: GalleryImage[] | null = null;
-let cacheTimestamp = 0;
-const CACHE_DURATION = 60 * 60 * 1000; // 1 hour in milliseconds
+// Browsers revalidate every time and get a 304 while the gallery is
+// unchanged; CDNs may serve a copy for a minute
+const CACHE_CONTROL = 'public, max-age=0, s-maxage=60, stale-while-revalidate=3600';
 
-const IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.webp', '.gif'] as const;
+// If-None-Match may list several tags or be weakened by a proxy (W/"...")
+function matchesETag(ifNoneMatch: string | null, etag: string): boolean {
+  if (!ifNoneMatch) {
+    return false;
+  }
+  return ifNoneMatch
+    .split(',')
+    .map((tag) => tag.trim().replace(/^W\//, ''))
+    .some((tag) => tag === '*' || tag === etag);
+}
 
-export async function GET(): Promise<NextResponse<{ images: GalleryImage[] }>> {
+export async function GET(request: NextRequest): Promise<NextResponse> {
   try {
-    const now = Date.now();
-    
-    // Return cached data if still valid
-    if (cachedImages && (now - cacheTimestamp) < CACHE_DURATION) {
-      return NextResponse.json(
-        { images: cachedImages },
-        {
-          headers: {
-            'Cache-Control': 'public, s-maxage=3600, stale-while-revalidate=86400',
-          },
-        }
-      );
+    const index = await getGalleryIndex();
+    const headers = {
+      'Cache-Control': CACHE_CONTROL,
+      ETag: index.etag,
+    };
+
+    // Repeat visitors already hold this exact list
+    if (matchesETag(request.headers.get('if-none-match'), index.etag)) {
+      return new NextResponse(null, { status: 304, headers });
     }
-    
-    // Path to the public/gallery folder
-    const galleryPath = join(process.cwd(), 'public', 'gallery');
-    
-    // Read all files from the gallery directory
-    const files = await readdir(galleryPath);
-    
-    // Filter for image files (jpg, jpeg, png, webp, gif)
-    const imageFiles: GalleryImage[] = files
-      .filter((file): boolean => {
-        const ext = file.toLowerCase().substring(file.lastIndexOf('.'));
-        return IMAGE_EXTENSIONS.includes(ext as typeof IMAGE_EXTENSIONS[number]);
-      })
-      .filter((file): boolean => !file.includes('.backup')) // Exclude backup files
-      .sort() // Sort alphabetically for consistent ordering
-      .map((file): GalleryImage => ({
-        src: `/gallery/${file}`,
-        alt: `Gallery image ${file.replace(/\.[^/.]+$/, '')}` // Remove extension for alt text
-      }));
-    
-    // Update cache
-    cachedImages = imageFiles;
-    cacheTimestamp = now;
-    
-    return NextResponse.json(
-      { images: imageFiles },
-      {
-        headers: {
-          'Cache-Control': 'public, s-maxage=3600, stale-while-revalidate=86400',
-        },
-      }
-    );
+
+    return new NextResponse(index.body, {
+      headers: {
+        ...headers,
+        'Content-Type': 'application/json',
+      },
+    });
   } catch (error) {
     console.error('Error reading gallery directory:', error);
     // Return empty array if directory doesn't exist or can't be read
@@ -75,4 +49,3 @@ export async function GET(): Promise<NextResponse<{ images: GalleryImage[] }>> {
     );
   }
 }
-
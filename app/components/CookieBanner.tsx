@@ -1,20 +1,18 @@
 "use client";
 
 import React from "react";
+import dynamic from "next/dynamic";
 import { motion } from "framer-motion";
 import { FaCookie, FaCheck, FaTimes, FaShieldAlt, FaChartLine, FaTachometerAlt } from "react-icons/fa";
-import PolicyModal from "@/app/components/PolicyModal";
+import { migrateStoredConsent, saveConsent, type CookiePreferences } from "@/app/utils/consent";
+
+// Fetched the first time the visitor opens the privacy policy
+const PolicyModal = dynamic(() => import("@/app/components/PolicyModal"), { ssr: false });
 
 export interface CookieBannerProps {
   message?: string;
 }
 
-export interface CookiePreferences {
-  essential: boolean;
-  analytics: boolean;
-  performance: boolean;
-}
-
 const COOKIE_CATEGORIES = {
   essential: {
     name: "Essential Cookies",
@@ -37,9 +35,11 @@ const COOKIE_CATEGORIES = {
 };
 
 export default function CookieBanner({ message = "We use cookies to enhance your experience, analyze site performance, and assist with booking services. You can customize your cookie preferences below." }: CookieBannerProps) {
-  const [visible, setVisible] = React.useState(false);
-  const [mounted, setMounted] = React.useState(false);
+  // Rendered by the layout only when the consent cookie is missing, so the
+  // banner is in the server HTML and visible from the first paint
+  const [visible, setVisible] = React.useState(true);
   const [showPrivacyModal, setShowPrivacyModal] = React.useState(false);
+  const [policyRequested, setPolicyRequested] = React.useState(false);
   const [preferences, setPreferences] = React.useState<CookiePreferences>({
     essential: true, // Always required
     analytics: false,
@@ -47,35 +47,14 @@ export default function CookieBanner({ message = "We use cookies to enhance your
   });
 
   React.useEffect(() => {
-    setMounted(true);
-    try {
-      const consent = window.localStorage.getItem("cookie-consent");
-      if (!consent) {
-        setVisible(true);
-        // Load saved preferences if they exist
-        const savedPrefs = window.localStorage.getItem("cookie-preferences");
-        if (savedPrefs) {
-          try {
-            const parsed = JSON.parse(savedPrefs);
-            // Remove marketing if it exists (for backward compatibility)
-            // eslint-disable-next-line @typescript-eslint/no-unused-vars
-            const { marketing, ...cleanPrefs } = parsed;
-            setPreferences({ ...cleanPrefs, essential: true }); // Always keep essential on
-          } catch {
-            // Invalid JSON, use defaults
-          }
-        }
-      }
-    } catch {
-      setVisible(true);
-    }
+    // Consent given before it was kept in a cookie
+    if (migrateStoredConsent()) setVisible(false);
   }, []);
 
   const savePreferences = (prefs: CookiePreferences) => {
     try {
-      window.localStorage.setItem("cookie-consent", "accepted");
-      window.localStorage.setItem("cookie-preferences", JSON.stringify(prefs));
-      
+      saveConsent(prefs);
+
       // Trigger custom event for other components to listen to
       window.dispatchEvent(new CustomEvent("cookiePreferencesUpdated", { detail: prefs }));
     } catch (error) {
@@ -150,13 +129,13 @@ export default function CookieBanner({ message = "We use cookies to enhance your
     </div>
   );
 
-  if (!mounted || !visible) return null;
+  if (!visible) return null;
 
   return (
     <div className="fixed bottom-0 right-0 z-[100] flex items-end justify-end p-2 sm:p-3 md:p-4 lg:p-5 pointer-events-none">
       {/* Cookie Banner */}
       <motion.div
-        initial={{ opacity: 0, y: 100, x: 20 }}
+        initial={false}
         animate={{ opacity: 1, y: 0, x: 0 }}
         exit={{ opacity: 0, y: 100, x: 20 }}
         transition={{ duration: 0.4, ease: [0.22, 1, 0.36, 1] }}
@@ -276,6 +255,7 @@ export default function CookieBanner({ message = "We use cookies to enhance your
                   className="text-white/80 hover:text-white underline underline-offset-1 transition-colors cursor-pointer"
                   onClick={(e) => {
                     e.preventDefault();
+                    setPolicyRequested(true);
                     setShowPrivacyModal(true);
                   }}
                 >
@@ -287,14 +267,16 @@ export default function CookieBanner({ message = "We use cookies to enhance your
         </div>
       </motion.div>
 
-      {/* Privacy Policy Modal */}
-      <PolicyModal
-        isOpen={showPrivacyModal}
-        onClose={() => setShowPrivacyModal(false)}
-        type="privacy"
-        title="Privacy Policy"
-        content={privacyContent}
-      />
+      {/* Privacy Policy Modal; stays mounted once loaded so it can animate out */}
+      {policyRequested && (
+        <PolicyModal
+          isOpen={showPrivacyModal}
+          onClose={() => setShowPrivacyModal(false)}
+          type="privacy"
+          title="Privacy Policy"
+          content={privacyContent}
+        />
+      )}
     </div>
   );
 }
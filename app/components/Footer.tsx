@@ -1,13 +1,16 @@
 "use client";
 
 import React from "react";
+import dynamic from "next/dynamic";
 import Image from "next/image";
 import { FaInstagram, FaFacebook, FaYoutube, FaMapMarkerAlt, FaPhone, FaEnvelope } from "react-icons/fa";
 import { handleScrollClick } from "@/app/utils/scroll";
-import PolicyModal from "@/app/components/PolicyModal";
 
 import type { IconType } from "react-icons";
 
+// Fetched the first time a visitor opens one of the policies
+const PolicyModal = dynamic(() => import("@/app/components/PolicyModal"), { ssr: false });
+
 export interface FooterProps {
   address?: string;
   phone?: string;
@@ -28,6 +31,12 @@ export default function Footer({
   ] 
 }: FooterProps) {
   const [openModal, setOpenModal] = React.useState<"privacy" | "terms" | null>(null);
+  const [policiesRequested, setPoliciesRequested] = React.useState(false);
+
+  const openPolicy = (type: "privacy" | "terms") => {
+    setPoliciesRequested(true);
+    setOpenModal(type);
+  };
 
   const privacyContent = (
     <div className="space-y-4 sm:space-y-6 text-neutral-200">
@@ -238,14 +247,14 @@ export default function Footer({
           <p className="text-xs sm:text-xs text-neutral-400 font-medium text-center sm:text-left" suppressHydrationWarning>&copy; {CURRENT_YEAR} BROTHRHOOD. All rights reserved.</p>
             <div className="flex items-center gap-4 sm:gap-4" suppressHydrationWarning>
             <button 
-              onClick={() => setOpenModal("privacy")}
+              onClick={() => openPolicy("privacy")}
               className="text-xs sm:text-xs text-neutral-400 hover:text-white active:scale-95 transition-all cursor-pointer font-medium py-1 min-h-[32px]"
             >
               Privacy
             </button>
             <span className="text-neutral-600 text-xs">|</span>
             <button 
-              onClick={() => setOpenModal("terms")}
+              onClick={() => openPolicy("terms")}
               className="text-xs sm:text-xs text-neutral-400 hover:text-white active:scale-95 transition-all cursor-pointer font-medium py-1 min-h-[32px]"
             >
               Terms
@@ -254,23 +263,26 @@ export default function Footer({
         </div>
       </div>
 
-      {/* Privacy Modal */}
-      <PolicyModal
-        isOpen={openModal === "privacy"}
-        onClose={() => setOpenModal(null)}
-        type="privacy"
-        title="Privacy Policy"
-        content={privacyContent}
-      />
+      {/* Policy modals; stay mounted once loaded so they can animate out */}
+      {policiesRequested && (
+        <>
+          <PolicyModal
+            isOpen={openModal === "privacy"}
+            onClose={() => setOpenModal(null)}
+            type="privacy"
+            title="Privacy Policy"
+            content={privacyContent}
+          />
 
-      {/* Terms Modal */}
-      <PolicyModal
-        isOpen={openModal === "terms"}
-        onClose={() => setOpenModal(null)}
-        type="terms"
-        title="Terms & Conditions"
-        content={termsContent}
-      />
+          <PolicyModal
+            isOpen={openModal === "terms"}
+            onClose={() => setOpenModal(null)}
+            type="terms"
+            title="Terms & Conditions"
+            content={termsContent}
+          />
+        </>
+      )}
     </footer>
   );
 }
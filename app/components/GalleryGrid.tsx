@@ -4,10 +4,10 @@ import React, { memo } from "react";
 import { motion } from "framer-motion";
 import Image from "next/image";
 import { FaInstagram } from "react-icons/fa";
+import type { GalleryImage as IndexedGalleryImage } from "@/app/api/gallery/gallery-index";
 
-export interface GalleryImage {
-  src: string;
-  alt: string;
+// An image as /api/gallery lists it, optionally linked to its Instagram post
+export interface GalleryImage extends IndexedGalleryImage {
   instagramUrl?: string;
 }
 
@@ -16,6 +16,9 @@ export interface GalleryGridProps {
   defaultInstagramUrl?: string;
 }
 
+const TILE_SIZES = "(max-width: 640px) 50vw, (max-width: 1024px) 33vw, 20vw";
+const TILE_IMAGE_CLASS = "object-cover border border-white/10 transition-transform duration-500 group-hover:scale-110 group-active:scale-105";
+
 function GalleryGrid({ images, defaultInstagramUrl = "https://instagram.com" }: GalleryGridProps) {
   return (
     <div suppressHydrationWarning>
@@ -33,16 +36,38 @@ function GalleryGrid({ images, defaultInstagramUrl = "https://instagram.com" }:
               transition={{ duration: 0.3, delay: i * 0.05 }}
               className="group relative aspect-square focus:outline-none overflow-hidden rounded-xl sm:rounded-2xl focus-visible:ring-2 focus-visible:ring-white focus-visible:ring-offset-2 focus-visible:ring-offset-neutral-900 active:scale-95 transition-transform" 
               aria-label={`View ${img.alt} on Instagram`}
+              style={{ backgroundColor: img.color }}
             >
-              <Image 
-                src={img.src} 
-                alt={img.alt} 
-                fill
-                loading="lazy"
-                quality={85}
-                className="object-cover border border-white/10 transition-transform duration-500 group-hover:scale-110 group-active:scale-105" 
-                sizes="(max-width: 640px) 50vw, (max-width: 1024px) 33vw, 20vw"
-              />
+              {img.sources ? (
+                // Serve the prebuilt AVIF/WebP variants directly, over the
+                // blurred placeholder, instead of resizing on request
+                <picture>
+                  {img.sources.map((source) => (
+                    <source key={source.type} type={source.type} srcSet={source.srcSet} sizes={TILE_SIZES} />
+                  ))}
+                  {/* eslint-disable-next-line @next/next/no-img-element */}
+                  <img
+                    src={img.src}
+                    alt={img.alt}
+                    width={img.width}
+                    height={img.height}
+                    loading="lazy"
+                    decoding="async"
+                    className={`absolute inset-0 h-full w-full bg-cover bg-center ${TILE_IMAGE_CLASS}`}
+                    style={img.blurDataURL ? { backgroundImage: `url(${img.blurDataURL})` } : undefined}
+                  />
+                </picture>
+              ) : (
+                <Image 
+                  src={img.src} 
+                  alt={img.alt} 
+                  fill
+                  loading="lazy"
+                  quality={85}
+                  className={TILE_IMAGE_CLASS} 
+                  sizes={TILE_SIZES}
+                />
+              )}
               <div className="absolute inset-0 bg-gradient-to-t from-black/60 via-black/30 to-transparent opacity-0 group-hover:opacity-100 group-active:opacity-70 transition-opacity duration-300"></div>
               <div className="absolute inset-0 flex items-center justify-center opacity-0 group-hover:opacity-100 group-active:opacity-80 transition-all duration-300 group-hover:scale-110">
                 <div className="p-3.5 sm:p-4 rounded-full bg-white/20 backdrop-blur-md border border-white/30 shadow-xl">
@@ -3,6 +3,7 @@
 import React, { useMemo, useCallback, memo } from "react";
 import { motion, AnimatePresence } from "framer-motion";
 import { FaStar, FaChevronLeft, FaChevronRight } from "react-icons/fa";
+import { REVIEW_AVATARS } from "@/app/constants/reviewAvatars";
 
 export interface Review {
   name: string;
@@ -16,6 +17,65 @@ export interface ReviewsCarouselProps {
   reviews: Review[];
 }
 
+// Must match avatarKey() in scripts/review-avatars.js; an empty avatarId
+// falls back to the name, as it does for the avatar seed
+function avatarKey(review: Review) {
+  return review.avatarId || review.name.toLowerCase().replace(/[^a-z0-9]+/g, "-");
+}
+
+// One optimized file per avatar, listed by scripts/review-avatars.js
+function avatarSrc(review: Review) {
+  const key = avatarKey(review);
+  return REVIEW_AVATARS[key] ?? `/avatars/${key}.webp`;
+}
+
+// First index of the page after the one starting at startIndex; wraps to 0
+// after the last page
+function nextStartIndex(startIndex: number, cardsPerView: number, reviewsLength: number) {
+  const nextIndex = startIndex + cardsPerView;
+  const maxIndex = Math.max(0, reviewsLength - cardsPerView);
+  return nextIndex >= reviewsLength ? 0 : Math.min(nextIndex, maxIndex);
+}
+
+const ReviewCard = memo(function ReviewCard({ review }: { review: Review }) {
+  const rating = review.rating || 5;
+  return (
+    <div className="relative z-10" suppressHydrationWarning>
+      {/* Avatar and Name */}
+      <div className="flex items-center gap-4 sm:gap-5 mb-4 sm:mb-5" suppressHydrationWarning>
+        <motion.img
+          src={avatarSrc(review)}
+          alt={`${review.name} avatar`}
+          width={64}
+          height={64}
+          className="h-14 w-14 sm:h-16 sm:w-16 rounded-full border-2 border-white/30 object-cover shadow-lg flex-shrink-0"
+          loading="lazy"
+          decoding="async"
+          whileHover={{ scale: 1.1 }}
+          transition={{ duration: 0.3 }}
+        />
+        <div className="flex-1 min-w-0" suppressHydrationWarning>
+          <p className="text-base sm:text-base font-bold text-white mb-1.5 truncate">{review.name}</p>
+          {review.role && <p className="text-sm sm:text-sm text-neutral-300 mb-2.5 truncate">{review.role}</p>}
+          <div className="flex items-center gap-1" suppressHydrationWarning>
+            {[...Array(5)].map((_, i) => (
+              <FaStar
+                key={i}
+                className={`h-4 w-4 sm:h-4 sm:w-4 ${i < rating ? 'text-yellow-400' : 'text-neutral-600'}`}
+              />
+            ))}
+          </div>
+        </div>
+      </div>
+
+      {/* Review Text */}
+      <p className="text-sm sm:text-sm md:text-sm text-neutral-100 leading-relaxed font-light line-clamp-4">
+        &ldquo;{review.text}&rdquo;
+      </p>
+    </div>
+  );
+});
+
 function ReviewsCarousel({ reviews }: ReviewsCarouselProps) {
   const [startIndex, setStartIndex] = React.useState(0);
   
@@ -55,11 +115,7 @@ function ReviewsCarousel({ reviews }: ReviewsCarouselProps) {
 
   const next = useCallback(() => {
     if (reviewsLength === 0) return;
-    setStartIndex((i) => {
-      const nextIndex = i + cardsPerView;
-      const maxIndex = Math.max(0, reviewsLength - cardsPerView);
-      return nextIndex >= reviewsLength ? 0 : Math.min(nextIndex, maxIndex);
-    });
+    setStartIndex((i) => nextStartIndex(i, cardsPerView, reviewsLength));
   }, [reviewsLength, cardsPerView]);
 
   const prev = useCallback(() => {
@@ -86,11 +142,22 @@ function ReviewsCarousel({ reviews }: ReviewsCarouselProps) {
     }
   }, [cardsPerView, reviewsLength, startIndex]);
 
-  // Get current page of reviews (memoized) - must be before early return
+  // Only the visible page is rendered; the avatars of the page auto-rotation
+  // shows next are fetched ahead so its cards appear with their images
   const currentReviews = useMemo(
     () => safeReviews.slice(startIndex, startIndex + cardsPerView),
     [safeReviews, startIndex, cardsPerView]
   );
+  const prefetchStart = nextStartIndex(startIndex, cardsPerView, reviewsLength);
+  const prefetchedReviews = useMemo(
+    () => prefetchStart === startIndex ? [] : safeReviews.slice(prefetchStart, prefetchStart + cardsPerView),
+    [safeReviews, prefetchStart, startIndex, cardsPerView]
+  );
+  React.useEffect(() => {
+    prefetchedReviews.forEach((review) => {
+      new Image().src = avatarSrc(review);
+    });
+  }, [prefetchedReviews]);
   const totalPages = useMemo(
     () => Math.ceil(reviewsLength / cardsPerView),
     [reviewsLength, cardsPerView]
@@ -100,52 +167,6 @@ function ReviewsCarousel({ reviews }: ReviewsCarouselProps) {
     [startIndex, cardsPerView]
   );
 
-  // Create a memoized mapping of review index to unique portrait ID
-  // This ensures each review gets a different male avatar (ages 20-40) with no duplicates
-  const avatarMapping = useMemo(() => {
-    const mapping = new Map<number, number>();
-    const usedIds = new Set<number>();
-    
-    // Generate unique portrait IDs for each review index (1-99 range)
-    safeReviews.forEach((review, index) => {
-      // Generate a unique seed from avatarId or name
-      let seed: number;
-      if (review.avatarId) {
-        seed = review.avatarId.split('').reduce((acc, char) => acc + char.charCodeAt(0), 0);
-      } else {
-        seed = review.name.split('').reduce((acc, char) => acc + char.charCodeAt(0), 0);
-      }
-      
-      // Start with a candidate portrait ID based on seed and index
-      let candidateId = ((seed + index * 97) % 99) + 1;
-      
-      // If already used, find the next available ID (wrap around if needed)
-      if (usedIds.has(candidateId)) {
-        // Find next available ID by cycling through 1-99
-        for (let offset = 1; offset < 99; offset++) {
-          candidateId = ((candidateId + offset - 1) % 99) + 1;
-          if (!usedIds.has(candidateId)) {
-            break;
-          }
-        }
-      }
-      
-      usedIds.add(candidateId);
-      mapping.set(index, candidateId);
-    });
-    
-    return mapping;
-  }, [safeReviews]);
-
-  // Function to get unique men's avatar (ages 20-40) for each review
-  // Uses randomuser.me portraits with guaranteed unique IDs per review
-  const getMaleAvatar = (index: number) => {
-    // Get the unique portrait ID for this review index
-    const portraitId = avatarMapping.get(index) || ((index % 99) + 1);
-    // Return unique male portrait URL (men portraits 1-99 typically represent ages 20-40)
-    return `https://randomuser.me/api/portraits/men/${portraitId}.jpg`;
-  };
-
   return (
     <div className="relative" suppressHydrationWarning>
       {/* Navigation Arrows */}
@@ -180,10 +201,7 @@ function ReviewsCarousel({ reviews }: ReviewsCarouselProps) {
         <AnimatePresence mode="wait">
           {currentReviews.map((review, idx) => {
             const globalIndex = startIndex + idx;
-            const rating = review.rating || 5;
-            // Use globalIndex to get the unique avatar for this review
-            const uniqueAvatarUrl = getMaleAvatar(globalIndex);
-            
+
             return (
               <motion.div
                 key={`${startIndex}-${globalIndex}-${review.name}`}
@@ -195,42 +213,7 @@ function ReviewsCarousel({ reviews }: ReviewsCarouselProps) {
                 suppressHydrationWarning
               >
                 <div className="absolute inset-0 bg-gradient-to-br from-white/10 via-white/5 to-transparent opacity-0 group-hover:opacity-100 transition-opacity duration-500" suppressHydrationWarning></div>
-                
-                <div className="relative z-10" suppressHydrationWarning>
-                  {/* Avatar and Name */}
-                  <div className="flex items-center gap-4 sm:gap-5 mb-4 sm:mb-5" suppressHydrationWarning>
-                    <motion.img 
-                      src={uniqueAvatarUrl} 
-                      alt={`${review.name} avatar`} 
-                      className="h-14 w-14 sm:h-16 sm:w-16 rounded-full border-2 border-white/30 object-cover shadow-lg flex-shrink-0" 
-                      loading="lazy"
-                      whileHover={{ scale: 1.1 }}
-                      transition={{ duration: 0.3 }}
-                      onError={(e) => {
-                        // Fallback to a unique male avatar using the mapping
-                        const fallbackPortraitId = avatarMapping.get(globalIndex) || ((globalIndex % 99) + 1);
-                        (e.target as HTMLImageElement).src = `https://randomuser.me/api/portraits/men/${fallbackPortraitId}.jpg`;
-                      }}
-                    />
-                    <div className="flex-1 min-w-0" suppressHydrationWarning>
-                      <p className="text-base sm:text-base font-bold text-white mb-1.5 truncate">{review.name}</p>
-                      {review.role && <p className="text-sm sm:text-sm text-neutral-300 mb-2.5 truncate">{review.role}</p>}
-                      <div className="flex items-center gap-1" suppressHydrationWarning>
-                        {[...Array(5)].map((_, i) => (
-                          <FaStar 
-                            key={i} 
-                            className={`h-4 w-4 sm:h-4 sm:w-4 ${i < rating ? 'text-yellow-400' : 'text-neutral-600'}`} 
-                          />
-                        ))}
-                      </div>
-                    </div>
-                  </div>
-                  
-                  {/* Review Text */}
-                  <p className="text-sm sm:text-sm md:text-sm text-neutral-100 leading-relaxed font-light line-clamp-4">
-                    &ldquo;{review.text}&rdquo;
-                  </p>
-                </div>
+                <ReviewCard review={review} />
               </motion.div>
             );
           })}
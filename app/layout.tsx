@@ -1,9 +1,14 @@
 import type { Metadata } from "next";
+import dynamic from "next/dynamic";
+import { cookies } from "next/headers";
 import { Rye } from "next/font/google";
 import "./globals.css";
 import Header from "@/app/components/Header";
 import Footer from "@/app/components/Footer";
-import CookieBanner from "@/app/components/CookieBanner";
+import { CONSENT_COOKIE } from "@/app/utils/consent";
+
+// Its own chunk, only loaded by visitors who still see the banner
+const CookieBanner = dynamic(() => import("@/app/components/CookieBanner"));
 
 const primaryFont = Rye({
   weight: ["400"],
@@ -44,9 +49,13 @@ export const metadata: Metadata = {
   }
 };
 
-export default function RootLayout({
+export default async function RootLayout({
   children
 }: Readonly<{children: React.ReactNode;}>) {
+  // Decide on the banner here so it is part of the HTML (or absent) from the
+  // first paint instead of popping in after hydration
+  const hasConsent = (await cookies()).has(CONSENT_COOKIE);
+
   const jsonLd = {
     "@context": "https://schema.org",
     "@type": "LocalBusiness",
@@ -95,7 +104,7 @@ export default function RootLayout({
             suppressHydrationWarning
           />
         )}
-        <CookieBanner />
+        {!hasConsent && <CookieBanner />}
       </body>
     </html>);
 }
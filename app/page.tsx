@@ -9,6 +9,7 @@ import { FaBookOpen, FaStar, FaCut, FaArrowRight, FaCalendar, FaClock, FaUserChe
 import { GiMustache } from "react-icons/gi";
 import { handleScrollClick } from "@/app/utils/scroll";
 import type { Service } from "@/app/components/ServiceCategoryModal";
+import type { GalleryImage } from "@/app/components/GalleryGrid";
 import { REVIEWS } from "@/app/constants/reviews";
 import { SERVICE_CATEGORIES } from "@/app/constants/services";
 import { FAQS } from "@/app/constants/faqs";
@@ -24,12 +25,16 @@ const MapEmbed = dynamic(() => import("@/app/components/MapEmbed"), {
   ssr: true
 });
 
+// Same footprint as the loaded grid so the section does not shift when the
+// gallery arrives
+const GallerySkeleton = () => <div className="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5 gap-4 sm:gap-5 lg:gap-6">
+  {Array.from({ length: 10 }).map((_, i) => (
+    <div key={i} className="aspect-square animate-pulse bg-white/5 rounded-xl sm:rounded-2xl" />
+  ))}
+</div>;
+
 const GalleryGrid = dynamic(() => import("@/app/components/GalleryGrid"), {
-  loading: () => <div className="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5 gap-4">
-    {Array.from({ length: 10 }).map((_, i) => (
-      <div key={i} className="aspect-square animate-pulse bg-white/5 rounded-xl" />
-    ))}
-  </div>,
+  loading: GallerySkeleton,
   ssr: true
 });
 
@@ -70,7 +75,8 @@ export default function Home() {
     services: Service[];
   } | null>(null);
 
-  const [galleryImages, setGalleryImages] = React.useState<Array<{ src: string; alt: string }>>([]);
+  // null until the API answers, so the skeleton keeps the grid's space
+  const [galleryImages, setGalleryImages] = React.useState<GalleryImage[] | null>(null);
 
   // Fetch gallery images dynamically from the API
   React.useEffect(() => {
@@ -78,9 +84,7 @@ export default function Home() {
       try {
         const response = await fetch('/api/gallery');
         const data = await response.json();
-        if (data.images && Array.isArray(data.images)) {
-          setGalleryImages(data.images);
-        }
+        setGalleryImages(Array.isArray(data.images) ? data.images : []);
       } catch (error) {
         console.error('Error fetching gallery images:', error);
         // Fallback to empty array if API fails
@@ -303,7 +307,11 @@ export default function Home() {
             viewport={{ once: true, margin: "-100px" }}
             transition={{ duration: 0.3, delay: 0.1 }}
           >
-            <GalleryGrid images={galleryImages} defaultInstagramUrl="https://instagram.com" />
+            {galleryImages ? (
+              <GalleryGrid images={galleryImages} defaultInstagramUrl="https://instagram.com" />
+            ) : (
+              <GallerySkeleton />
+            )}
           </motion.div>
         </div>
       </section>
@@ -0,0 +1,50 @@
+/**
+ * Cookie consent storage, shared by the root layout (server) and CookieBanner
+ */
+
+// The layout reads this cookie to decide whether to render the banner at all
+export const CONSENT_COOKIE = "cookie-consent";
+export const PREFERENCES_COOKIE = "cookie-preferences";
+
+// Keep the choice for a year
+const CONSENT_MAX_AGE = 60 * 60 * 24 * 365;
+
+export interface CookiePreferences {
+  essential: boolean;
+  analytics: boolean;
+  performance: boolean;
+}
+
+function setCookie(name: string, value: string) {
+  const secure = window.location.protocol === "https:" ? "; Secure" : "";
+  document.cookie = `${name}=${encodeURIComponent(value)}; Path=/; Max-Age=${CONSENT_MAX_AGE}; SameSite=Lax${secure}`;
+}
+
+/**
+ * Store consent and the chosen categories where the server can read them
+ */
+export function saveConsent(prefs: CookiePreferences) {
+  setCookie(CONSENT_COOKIE, "accepted");
+  setCookie(PREFERENCES_COOKIE, JSON.stringify(prefs));
+}
+
+/**
+ * Move consent given before it was stored in cookies (localStorage) over to
+ * the cookies. Returns whether there was any.
+ */
+export function migrateStoredConsent(): boolean {
+  try {
+    if (!window.localStorage.getItem(CONSENT_COOKIE)) return false;
+    const saved = JSON.parse(window.localStorage.getItem(PREFERENCES_COOKIE) || "null");
+    saveConsent({
+      essential: true,
+      analytics: Boolean(saved?.analytics),
+      performance: Boolean(saved?.performance)
+    });
+    window.localStorage.removeItem(CONSENT_COOKIE);
+    window.localStorage.removeItem(PREFERENCES_COOKIE);
+    return true;
+  } catch {
+    return false;
+  }
+}
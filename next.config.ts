@@ -1,10 +1,18 @@
 import type { NextConfig } from "next";
 
+// The visual editor (public/editor.js, loaded by app/layout.tsx) needs the
+// data-editor-id attributes stamped by add-data-editor-index.ts. Keep them in
+// dev and editor builds only; production HTML ships without them.
+const editorProfile =
+  process.env.VISUAL_EDITOR_ACTIVE === 'true' || process.env.NODE_ENV !== 'production';
+
 const nextConfig: NextConfig = {
   output: "standalone",
   transpilePackages: ['framer-motion'],
   compress: true,
   poweredByHeader: false,
+  // Source maps for scripts/analyze-bundle.js to attribute chunk bytes to packages
+  productionBrowserSourceMaps: process.env.ANALYZE_BUNDLE === 'true',
   images: {
     unoptimized: false,
     formats: ['image/webp', 'image/avif'],
@@ -18,12 +26,6 @@ const nextConfig: NextConfig = {
         port: '',
         pathname: '/**',
       },
-      {
-        protocol: 'https',
-        hostname: 'i.pravatar.cc',
-        port: '',
-        pathname: '/**',
-      },
       {
         protocol: 'https',
         hostname: 'storage.googleapis.com',
@@ -32,6 +34,21 @@ const nextConfig: NextConfig = {
       },
     ],
   },
+  // Review avatars (scripts/review-avatars.js) keep a fixed URL, so cache
+  // them for a day and revalidate in the background after that
+  async headers() {
+    return [
+      {
+        source: '/avatars/:path*',
+        headers: [
+          { key: 'Cache-Control', value: 'public, max-age=86400, stale-while-revalidate=604800' },
+        ],
+      },
+    ];
+  },
+  compiler: {
+    reactRemoveProperties: editorProfile ? false : { properties: ['^data-editor-id$'] },
+  },
   // Optimize bundle
   experimental: {
     optimizePackageImports: ['react-icons', 'framer-motion'],
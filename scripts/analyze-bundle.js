@@ -1,52 +1,345 @@
 /**
- * Script to analyze bundle size and identify unused dependencies
- * Run with: node scripts/analyze-bundle.js
+ * Bundle analysis driven by the production build output
+ * Run with: node scripts/analyze-bundle.js [--json <path>] [--no-fail]
+ * Runs after every `npm run build` as the postbuild step.
+ *
+ * Reads the .next build manifests to find the JavaScript every route loads
+ * on first visit, measures it (raw and gzip, like `next build` reports
+ * "First Load JS"), attributes the bytes to npm packages through the chunks'
+ * source maps, and fails when a route exceeds its budget in
+ * scripts/bundle-budgets.json. Runtime dependencies that neither ship in a
+ * chunk nor are imported by server code are listed as unused.
+ *
+ * Source maps are only emitted when the build runs with ANALYZE_BUNDLE=true
+ * (see next.config.ts). Without them the sizes and budgets are still
+ * checked, only the per-package attribution is missing.
+ *
+ * The JSON report (testsprite_tests/tmp/bundle_report.json by default)
+ * carries the build id, so the Python perf suite can attach it to the Web
+ * Vitals it measured on the same build.
  */
 
 const fs = require('fs');
 const path = require('path');
+const zlib = require('zlib');
+const { execFileSync } = require('child_process');
 
-const packageJson = require('../package.json');
-const dependencies = { ...packageJson.dependencies, ...packageJson.devDependencies };
-
-// Dependencies that are likely unused based on codebase analysis
-const potentiallyUnused = [
-  'three',
-  '@react-three/fiber',
-  '@react-three/drei',
-  '@tiptap/react',
-  '@tiptap/starter-kit',
-  '@tiptap/extension-image',
-  '@tiptap/extension-task-item',
-  '@tiptap/extension-task-list',
-  '@tiptap/extension-text-align',
-  '@tiptap/extension-typography',
-  'playwright',
-  'cheerio',
-  'cobe',
-  '@iconify/react',
-  '@tabler/icons-react',
-  'react-syntax-highlighter',
-  'rehype-raw',
-  'remark-breaks',
-  'remark-gfm',
-  'react-markdown',
-];
-
-console.log('📦 Bundle Analysis\n');
-console.log('⚠️  Potentially Unused Dependencies:\n');
-
-let totalSize = 0;
-potentiallyUnused.forEach(dep => {
-  if (dependencies[dep]) {
-    console.log(`   - ${dep}@${dependencies[dep]}`);
-    // Rough estimate: each dependency adds ~100KB-500KB to bundle
-    totalSize += 200; // Average estimate
-  }
-});
-
-console.log(`\n💾 Estimated Bundle Size Reduction: ~${totalSize}KB`);
-console.log('\n💡 To remove unused dependencies:');
-console.log('   npm uninstall ' + potentiallyUnused.filter(dep => dependencies[dep]).join(' '));
-console.log('\n⚠️  Note: Verify these are not used before removing!');
+const ROOT = path.join(__dirname, '..');
+const NEXT_DIR = path.join(ROOT, '.next');
+const BUDGETS_FILE = path.join(__dirname, 'bundle-budgets.json');
+const DEFAULT_REPORT = path.join(ROOT, 'testsprite_tests', 'tmp', 'bundle_report.json');
 
+// Server-side code whose imports keep a dependency in use
+const SERVER_SOURCES = ['app', 'middleware.ts', 'sitemap.ts', 'next.config.ts'];
+const SOURCE_PATTERN = /\.(ts|tsx|js|jsx|mjs)$/;
+const IMPORT_PATTERN = /(?:from\s+|import\s*\(?\s*|require\(\s*)['"]([^'"./][^'"]*)['"]/g;
+
+const APP_SOURCE = '(app)';
+const UNMAPPED = '(webpack runtime / unmapped)';
+
+// ---------------------------------------------------------------------------
+// Build manifests
+// ---------------------------------------------------------------------------
+
+function readJson(file, fallback) {
+  try {
+    return JSON.parse(fs.readFileSync(file, 'utf-8'));
+  } catch {
+    return fallback;
+  }
+}
+
+// "/blog/[slug]/page" -> ["/layout", "/blog/layout", "/blog/[slug]/layout", "/blog/[slug]/page"]
+function entryChain(entry, entries) {
+  const segments = entry.split('/').filter(Boolean).slice(0, -1);
+  const chain = [];
+  for (let i = 0; i <= segments.length; i++) {
+    const layout = `/${[...segments.slice(0, i), 'layout'].join('/')}`;
+    if (entries[layout]) chain.push(layout);
+  }
+  chain.push(entry);
+  return chain;
+}
+
+/** Route path -> JS files loaded on first visit, relative to .next */
+function routeChunks() {
+  const buildManifest = readJson(path.join(NEXT_DIR, 'build-manifest.json'), null);
+  const appManifest = readJson(path.join(NEXT_DIR, 'app-build-manifest.json'), null);
+  if (!buildManifest || !appManifest) {
+    throw new Error('No production build found in .next; run `npm run build` first');
+  }
+  const routes = readJson(path.join(NEXT_DIR, 'app-path-routes-manifest.json'), {});
+  const entries = appManifest.pages || {};
+  const shared = buildManifest.rootMainFiles || [];
+
+  const result = {};
+  for (const entry of Object.keys(entries)) {
+    if (!entry.endsWith('/page')) continue; // layouts are folded in, route handlers ship no JS
+    const files = new Set(shared);
+    for (const part of entryChain(entry, entries)) {
+      entries[part].forEach((file) => files.add(file));
+    }
+    const js = [...files].filter((file) => file.endsWith('.js'));
+    if (js.length) result[routes[entry] || entry.replace(/\/page$/, '') || '/'] = js;
+  }
+  return result;
+}
+
+// ---------------------------------------------------------------------------
+// Source map attribution
+// ---------------------------------------------------------------------------
+
+const BASE64 = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/';
+const BASE64_VALUES = Object.fromEntries([...BASE64].map((char, index) => [char, index]));
+
+function decodeSegment(segment) {
+  const values = [];
+  let value = 0;
+  let shift = 0;
+  for (const char of segment) {
+    const digit = BASE64_VALUES[char];
+    value += (digit & 31) << shift;
+    if (digit & 32) {
+      shift += 5;
+    } else {
+      values.push(value & 1 ? -(value >>> 1) : value >>> 1);
+      value = 0;
+      shift = 0;
+    }
+  }
+  return values;
+}
+
+function packageOf(source) {
+  const parts = source.split('node_modules/');
+  if (parts.length === 1) {
+    return /(^|\/)\.?\/?(app|components|lib)\//.test(source) ? APP_SOURCE : UNMAPPED;
+  }
+  const [scope, name] = parts[parts.length - 1].split('/');
+  return scope.startsWith('@') ? `${scope}/${name}` : scope;
+}
+
+/** Package -> raw bytes of ``code`` that the source map assigns to it */
+function attribute(code, map) {
+  const owners = map.sources.map(packageOf);
+  const bytes = {};
+  const add = (owner, count) => {
+    if (count > 0) bytes[owner] = (bytes[owner] || 0) + count;
+  };
+  const lines = code.split('\n');
+  const mappings = map.mappings.split(';');
+  let source = 0;
+  lines.forEach((line, index) => {
+    const length = Buffer.byteLength(line) + (index < lines.length - 1 ? 1 : 0);
+    let column = 0;
+    let owner = UNMAPPED;
+    for (const segment of (mappings[index] || '').split(',')) {
+      if (!segment) continue;
+      // The generated column is relative to the previous segment on the line
+      const [generatedDelta, sourceDelta] = decodeSegment(segment);
+      // Columns are in UTF-16 units; minified chunks are ASCII in practice
+      add(owner, generatedDelta);
+      column += generatedDelta;
+      if (sourceDelta !== undefined) {
+        source += sourceDelta;
+        owner = owners[source] || UNMAPPED;
+      }
+    }
+    add(owner, length - column);
+  });
+  return bytes;
+}
+
+// ---------------------------------------------------------------------------
+// Chunks and routes
+// ---------------------------------------------------------------------------
+
+const chunkCache = new Map();
+
+function measureChunk(file) {
+  if (chunkCache.has(file)) return chunkCache.get(file);
+  const code = fs.readFileSync(path.join(NEXT_DIR, file));
+  const raw = code.length;
+  const gzip = zlib.gzipSync(code, { level: 9 }).length;
+  const map = readJson(path.join(NEXT_DIR, `${file}.map`), null);
+  let packages = null;
+  if (map && map.mappings) {
+    // Gzip bytes are shared out in proportion to raw bytes
+    packages = {};
+    for (const [name, bytes] of Object.entries(attribute(code.toString('utf-8'), map))) {
+      packages[name] = { raw: bytes, gzip: Math.round((bytes * gzip) / raw) };
+    }
+  }
+  const chunk = { file, raw, gzip, packages };
+  chunkCache.set(file, chunk);
+  return chunk;
+}
+
+function addPackages(total, packages) {
+  for (const [name, size] of Object.entries(packages || {})) {
+    total[name] = total[name] || { raw: 0, gzip: 0 };
+    total[name].raw += size.raw;
+    total[name].gzip += size.gzip;
+  }
+  return total;
+}
+
+function sortedBySize(packages) {
+  return Object.fromEntries(Object.entries(packages).sort((a, b) => b[1].gzip - a[1].gzip));
+}
+
+function analyzeRoutes() {
+  const routes = {};
+  const shipped = {};
+  let mapped = true;
+  for (const [route, files] of Object.entries(routeChunks())) {
+    const chunks = files.map(measureChunk);
+    mapped = mapped && chunks.every((chunk) => chunk.packages);
+    const packages = chunks.reduce((total, chunk) => addPackages(total, chunk.packages), {});
+    routes[route] = {
+      firstLoadJs: {
+        raw: chunks.reduce((sum, chunk) => sum + chunk.raw, 0),
+        gzip: chunks.reduce((sum, chunk) => sum + chunk.gzip, 0),
+      },
+      chunks: chunks.map(({ file, raw, gzip }) => ({ file, raw, gzip })),
+      packages: sortedBySize(packages),
+    };
+  }
+  for (const chunk of chunkCache.values()) addPackages(shipped, chunk.packages);
+  return { routes, packages: sortedBySize(shipped), sourceMaps: mapped };
+}
+
+// ---------------------------------------------------------------------------
+// Budgets and unused dependencies
+// ---------------------------------------------------------------------------
+
+function checkBudgets(routes, budgets) {
+  const limits = budgets.firstLoadJsKb || {};
+  const violations = [];
+  for (const [route, { firstLoadJs }] of Object.entries(routes)) {
+    const limit = limits[route] ?? limits['*'];
+    const kb = firstLoadJs.gzip / 1024;
+    if (limit !== undefined && kb > limit) {
+      violations.push(`${route} first-load JS ${kb.toFixed(1)} kB gzip > budget ${limit} kB`);
+    }
+  }
+  return violations;
+}
+
+function sourceFiles(entry, list = []) {
+  const full = path.join(ROOT, entry);
+  if (!fs.existsSync(full)) return list;
+  if (fs.statSync(full).isDirectory()) {
+    for (const name of fs.readdirSync(full)) sourceFiles(path.join(entry, name), list);
+  } else if (SOURCE_PATTERN.test(entry)) {
+    list.push(full);
+  }
+  return list;
+}
+
+function serverImports() {
+  const used = new Set();
+  for (const file of SERVER_SOURCES.flatMap((entry) => sourceFiles(entry))) {
+    for (const [, specifier] of fs.readFileSync(file, 'utf-8').matchAll(IMPORT_PATTERN)) {
+      const parts = specifier.split('/');
+      used.add(specifier.startsWith('@') ? parts.slice(0, 2).join('/') : parts[0]);
+    }
+  }
+  return used;
+}
+
+/** Runtime dependencies found neither in a client chunk nor in a server import */
+function unusedDependencies(shipped) {
+  const { dependencies = {} } = readJson(path.join(ROOT, 'package.json'), {});
+  const used = serverImports();
+  return Object.keys(dependencies)
+    .filter((name) => !name.startsWith('@types/') && !used.has(name) && !shipped[name])
+    .map((name) => ({ name, version: dependencies[name] }));
+}
+
+// ---------------------------------------------------------------------------
+// CLI
+// ---------------------------------------------------------------------------
+
+function gitCommit() {
+  try {
+    return execFileSync('git', ['rev-parse', '--short', 'HEAD'], {
+      cwd: ROOT,
+      encoding: 'utf-8',
+      stdio: ['ignore', 'pipe', 'ignore'],
+    }).trim();
+  } catch {
+    return null;
+  }
+}
+
+function parseArgs(argv) {
+  const args = { fail: true, json: DEFAULT_REPORT };
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === '--no-fail') args.fail = false;
+    else if (argv[i] === '--json') args.json = path.resolve(argv[++i]);
+  }
+  return args;
+}
+
+const kb = (bytes) => `${(bytes / 1024).toFixed(1)} kB`;
+
+function printReport(report) {
+  console.log('📦 First Load JS per route (gzip)\n');
+  for (const [route, data] of Object.entries(report.routes)) {
+    console.log(`   ${route.padEnd(24)} ${kb(data.firstLoadJs.gzip).padStart(10)}  (${kb(data.firstLoadJs.raw)} raw, ${data.chunks.length} chunks)`);
+  }
+  if (report.sourceMaps) {
+    console.log('\n📚 First-load JS by package (gzip, all routes)\n');
+    for (const [name, size] of Object.entries(report.packages).slice(0, 15)) {
+      console.log(`   ${name.padEnd(32)} ${kb(size.gzip).padStart(10)}`);
+    }
+  } else {
+    console.log('\n💡 No source maps in this build; build with ANALYZE_BUNDLE=true for per-package sizes');
+  }
+  if (report.unusedDependencies.length) {
+    console.log('\n⚠️  Runtime dependencies not shipped or imported anywhere:\n');
+    report.unusedDependencies.forEach(({ name, version }) => console.log(`   - ${name}@${version}`));
+    console.log(`\n   npm uninstall ${report.unusedDependencies.map(({ name }) => name).join(' ')}`);
+  }
+}
+
+function main() {
+  const args = parseArgs(process.argv.slice(2));
+  let analysis;
+  try {
+    analysis = analyzeRoutes();
+  } catch (error) {
+    console.error(`❌ ${error.message}`);
+    process.exit(1);
+  }
+  const budgets = readJson(BUDGETS_FILE, {});
+  const report = {
+    buildId: fs.readFileSync(path.join(NEXT_DIR, 'BUILD_ID'), 'utf-8').trim(),
+    commit: gitCommit(),
+    generatedAt: new Date().toISOString(),
+    ...analysis,
+    budgets: budgets.firstLoadJsKb || {},
+    violations: checkBudgets(analysis.routes, budgets),
+    unusedDependencies: unusedDependencies(analysis.packages),
+  };
+
+  printReport(report);
+  fs.mkdirSync(path.dirname(args.json), { recursive: true });
+  fs.writeFileSync(args.json, `${JSON.stringify(report, null, 2)}\n`);
+  console.log(`\n📝 Report written to ${path.relative(ROOT, args.json)}`);
+
+  if (report.violations.length) {
+    console.error('\n❌ First-load JS budgets exceeded:');
+    report.violations.forEach((violation) => console.error(`   - ${violation}`));
+    if (args.fail) process.exit(1);
+  } else {
+    console.log('✅ Every route is within its first-load JS budget');
+  }
+}
+
+if (require.main === module) {
+  main();
+}
+
+module.exports = { attribute, decodeSegment };
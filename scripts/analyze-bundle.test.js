@@ -0,0 +1,38 @@
+// Run with: node --test scripts/
+const test = require('node:test');
+const assert = require('node:assert');
+const { attribute } = require('./analyze-bundle');
+
+test('attributes bytes on a line from relative generated columns', () => {
+  // "aaabbbcccddd" with one segment every 3 columns, each from the next source:
+  // AAAA (col 0, src 0), GCAA (+3, +1), GCAA (+3, +1), GCAA (+3, +1)
+  const map = {
+    sources: [
+      'app/page.tsx',
+      'node_modules/a/index.js',
+      'node_modules/@scope/b/index.js',
+      'node_modules/c/index.js',
+    ],
+    mappings: 'AAAA,GCAA,GCAA,GCAA',
+  };
+  assert.deepStrictEqual(attribute('aaabbbcccddd', map), {
+    '(app)': 3,
+    a: 3,
+    '@scope/b': 3,
+    c: 3,
+  });
+});
+
+test('resets the column on every line and counts unmapped bytes', () => {
+  // Line 1: "xxab" with segments at col 2 (src 0) and col 3 (src 1);
+  // line 2: "cc" with one segment at col 0 back in src 0
+  const map = {
+    sources: ['node_modules/a/index.js', 'node_modules/b/index.js'],
+    mappings: 'EAAA,CCAA;ADAA',
+  };
+  assert.deepStrictEqual(attribute('xxab\ncc', map), {
+    '(webpack runtime / unmapped)': 2,
+    a: 1 + 2,
+    b: 2,
+  });
+});
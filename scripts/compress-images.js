@@ -1,128 +1,294 @@
 const sharp = require('sharp');
+const crypto = require('crypto');
 const fs = require('fs');
+const os = require('os');
 const path = require('path');
+const { isMainThread } = require('worker_threads');
+const { createPool, serveJobs } = require('./worker-pool');
 
-async function compressImage(inputPath, outputPath, options = {}) {
-  const { quality = 80, format = 'auto' } = options;
-  
+// Originals live outside public/; compressed copies are written to the same
+// relative path under public/
+const SOURCE_DIR = path.join(__dirname, '..', 'assets', 'images');
+const OUTPUT_DIR = path.join(__dirname, '..', 'public');
+const GALLERY = 'gallery';
+// Review portraits are turned into avatars by scripts/review-avatars.js
+const AVATARS = 'avatars';
+
+// Content hashes of processed sources, so unchanged images are skipped
+const CACHE_FILE = path.join(__dirname, '..', 'node_modules', '.cache', 'compress-images.json');
+// Bump when the encoder settings change to invalidate every cached entry
+const PIPELINE_VERSION = 1;
+
+const IMAGE_PATTERN = /\.(jpg|jpeg|png|webp)$/i;
+const COMPRESS_QUALITY = 80;
+
+// Widths of the responsive gallery variants, in pixels
+const VARIANT_WIDTHS = [320, 640, 960];
+const VARIANT_FORMATS = [
+  { format: 'avif', type: 'image/avif', options: { quality: 50 } },
+  { format: 'webp', type: 'image/webp', options: { quality: 75 } },
+];
+// Width of the inline blur placeholder
+const BLUR_WIDTH = 16;
+
+// ---------------------------------------------------------------------------
+// Worker side: every sharp job runs here, one job per worker at a time
+// ---------------------------------------------------------------------------
+
+// Write through a temporary file so public/ never holds a partial image
+async function writeAtomically(pipeline, outputPath) {
+  fs.mkdirSync(path.dirname(outputPath), { recursive: true });
+  const tempPath = `${outputPath}.${process.pid}.tmp`;
   try {
-    const image = sharp(inputPath);
-    const metadata = await image.metadata();
-    
-    let pipeline = image;
-    
-    // Determine format
-    let outputFormat = format;
-    if (format === 'auto') {
-      const ext = path.extname(inputPath).toLowerCase();
-      if (ext === '.png') {
-        outputFormat = 'png';
-      } else if (ext === '.jpg' || ext === '.jpeg') {
-        outputFormat = 'jpeg';
-      }
-    }
-    
-    // Apply compression based on format
-    if (outputFormat === 'jpeg') {
-      pipeline = pipeline.jpeg({ 
-        quality,
-        progressive: true,
-        mozjpeg: true
-      });
-    } else if (outputFormat === 'png') {
-      pipeline = pipeline.png({ 
-        quality,
-        compressionLevel: 9,
-        adaptiveFiltering: true
-      });
-    } else if (outputFormat === 'webp') {
-      pipeline = pipeline.webp({ quality });
-    }
-    
-    // Write to temporary file first, then replace original
-    const tempPath = outputPath + '.tmp';
     await pipeline.toFile(tempPath);
     fs.renameSync(tempPath, outputPath);
-    return true;
   } catch (error) {
-    console.error(`Error compressing ${inputPath}:`, error.message);
-    return false;
+    fs.rmSync(tempPath, { force: true });
+    throw error;
   }
 }
 
-async function compressImages() {
-  const publicDir = path.join(__dirname, '..', 'public');
-  const galleryDir = path.join(publicDir, 'gallery');
-  
-  console.log('🖼️  Starting image compression...\n');
-
-  // Compress gallery JPG images
-  if (fs.existsSync(galleryDir)) {
-    console.log('📸 Compressing gallery images...');
-    const files = fs.readdirSync(galleryDir).filter(f => 
-      /\.(jpg|jpeg)$/i.test(f)
-    );
-    
-    let compressed = 0;
-    for (const file of files) {
-      const inputPath = path.join(galleryDir, file);
-      const outputPath = path.join(galleryDir, file);
-      
-      // Create backup
-      const backupPath = path.join(galleryDir, `${file}.backup`);
-      if (!fs.existsSync(backupPath)) {
-        fs.copyFileSync(inputPath, backupPath);
-      }
-      
-      const success = await compressImage(inputPath, outputPath, { 
-        quality: 80,
-        format: 'jpeg'
-      });
-      
-      if (success) {
-        compressed++;
-        const stats = fs.statSync(outputPath);
-        const sizeKB = (stats.size / 1024).toFixed(2);
-        console.log(`   ✅ ${file}: ${sizeKB} KB`);
-      }
+async function compressImage(inputPath, outputPath, options = {}) {
+  const { quality = COMPRESS_QUALITY } = options;
+  const ext = path.extname(inputPath).toLowerCase();
+
+  let pipeline = sharp(inputPath);
+  if (ext === '.png') {
+    pipeline = pipeline.png({
+      quality,
+      compressionLevel: 9,
+      adaptiveFiltering: true
+    });
+  } else if (ext === '.webp') {
+    pipeline = pipeline.webp({ quality });
+  } else {
+    pipeline = pipeline.jpeg({
+      quality,
+      progressive: true,
+      mozjpeg: true
+    });
+  }
+
+  await writeAtomically(pipeline, outputPath);
+  return { outputs: [outputPath], size: fs.statSync(outputPath).size };
+}
+
+async function describeGalleryImage(inputPath, variantsDir) {
+  const file = path.basename(inputPath);
+  const name = file.replace(/\.[^/.]+$/, '');
+  const image = sharp(inputPath).rotate();
+
+  const metadata = await image.metadata();
+  // EXIF orientations 5-8 swap the displayed width and height
+  const rotated = (metadata.orientation || 1) >= 5;
+  const width = rotated ? metadata.height : metadata.width;
+  const height = rotated ? metadata.width : metadata.height;
+
+  const { dominant } = await image.clone().stats();
+  const color = '#' + [dominant.r, dominant.g, dominant.b]
+    .map(channel => channel.toString(16).padStart(2, '0'))
+    .join('');
+
+  const blur = await image
+    .clone()
+    .resize({ width: BLUR_WIDTH })
+    .webp({ quality: 40 })
+    .toBuffer();
+
+  // Never upscale: narrow images get one variant at their own width
+  const widths = VARIANT_WIDTHS.filter(w => w < width);
+  if (width <= VARIANT_WIDTHS[VARIANT_WIDTHS.length - 1]) {
+    widths.push(width);
+  }
+
+  const outputs = [];
+  const sources = [];
+  for (const variant of VARIANT_FORMATS) {
+    const srcSet = [];
+    for (const w of widths) {
+      const variantFile = `${name}-${w}.${variant.format}`;
+      const outputPath = path.join(variantsDir, variantFile);
+      await writeAtomically(
+        image.clone().resize({ width: w }).toFormat(variant.format, variant.options),
+        outputPath
+      );
+      outputs.push(outputPath);
+      srcSet.push(`/gallery/variants/${variantFile} ${w}w`);
     }
-    console.log(`✅ Compressed ${compressed}/${files.length} gallery images\n`);
+    sources.push({ type: variant.type, srcSet: srcSet.join(', ') });
+  }
+
+  return {
+    outputs,
+    entry: {
+      src: `/gallery/${file}`,
+      alt: `Gallery image ${name}`,
+      width,
+      height,
+      color,
+      blurDataURL: `data:image/webp;base64,${blur.toString('base64')}`,
+      sources,
+    },
+  };
+}
+
+function runJob(job) {
+  if (job.kind === 'compress') {
+    return compressImage(job.input, job.output);
+  }
+  return describeGalleryImage(job.input, job.variantsDir);
+}
+
+// ---------------------------------------------------------------------------
+// Main thread: plan jobs, skip cached ones, fan the rest out to the pool
+// ---------------------------------------------------------------------------
+
+function listImages(dir) {
+  if (!fs.existsSync(dir)) {
+    return [];
   }
+  return fs.readdirSync(dir, { withFileTypes: true })
+    .flatMap(entry => {
+      const entryPath = path.join(dir, entry.name);
+      if (entry.isDirectory()) {
+        return listImages(entryPath);
+      }
+      return IMAGE_PATTERN.test(entry.name) ? [entryPath] : [];
+    })
+    .sort();
+}
 
-  // Compress PNG images in public directory
-  console.log('🖼️  Compressing PNG images...');
-  const pngFiles = fs.readdirSync(publicDir).filter(f => 
-    /\.png$/i.test(f) && !f.includes('.backup')
-  );
-  
-  let compressedPng = 0;
-  for (const file of pngFiles) {
-    const inputPath = path.join(publicDir, file);
-    const outputPath = path.join(publicDir, file);
-    
-    // Create backup
-    const backupPath = path.join(publicDir, `${file}.backup`);
-    if (!fs.existsSync(backupPath)) {
-      fs.copyFileSync(inputPath, backupPath);
+function hashFile(filePath, job) {
+  return crypto.createHash('sha256')
+    .update(JSON.stringify({ version: PIPELINE_VERSION, kind: job.kind }))
+    .update(fs.readFileSync(filePath))
+    .digest('hex');
+}
+
+function loadCache() {
+  try {
+    return JSON.parse(fs.readFileSync(CACHE_FILE, 'utf8'));
+  } catch {
+    return {};
+  }
+}
+
+function writeJson(filePath, data) {
+  fs.mkdirSync(path.dirname(filePath), { recursive: true });
+  const tempPath = `${filePath}.${process.pid}.tmp`;
+  fs.writeFileSync(tempPath, JSON.stringify(data, null, 2) + '\n');
+  fs.renameSync(tempPath, filePath);
+}
+
+function planJobs(manifestOnly) {
+  const jobs = [];
+  const variantsDir = path.join(OUTPUT_DIR, GALLERY, 'variants');
+
+  for (const input of listImages(SOURCE_DIR)) {
+    const relative = path.relative(SOURCE_DIR, input);
+    if (relative.split(path.sep)[0] === AVATARS) {
+      continue;
+    }
+    if (!manifestOnly) {
+      jobs.push({ kind: 'compress', input, output: path.join(OUTPUT_DIR, relative) });
+    }
+    if (path.dirname(relative) === GALLERY) {
+      jobs.push({ kind: 'describe', input, variantsDir });
     }
-    
-    const success = await compressImage(inputPath, outputPath, { 
-      quality: 80,
-      format: 'png'
+  }
+  return jobs;
+}
+
+function sizeKB(bytes) {
+  return (bytes / 1024).toFixed(2);
+}
+
+async function compressImages() {
+  const manifestOnly = process.argv.includes('--manifest-only');
+  const cache = loadCache();
+  // A manifest-only run keeps the cached compress entries it did not revisit
+  const nextCache = manifestOnly ? { ...cache } : {};
+  const jobs = planJobs(manifestOnly);
+
+  if (jobs.length === 0) {
+    console.log(`⚠️  No source images found in ${path.relative(process.cwd(), SOURCE_DIR)}`);
+    return;
+  }
+
+  const poolSize = Math.min(jobs.length, os.availableParallelism ? os.availableParallelism() : os.cpus().length);
+  console.log(`🖼️  Processing ${jobs.length} image jobs on ${poolSize} workers...\n`);
+
+  const pool = createPool(poolSize, __filename);
+  let processed = 0;
+  let skipped = 0;
+  let failed = 0;
+
+  try {
+    const results = await Promise.all(jobs.map(async (job) => {
+      const key = `${job.kind}:${path.relative(SOURCE_DIR, job.input)}`;
+      const hash = hashFile(job.input, job);
+      const cached = cache[key];
+
+      if (cached && cached.hash === hash && cached.outputs.every(output => fs.existsSync(output))) {
+        nextCache[key] = cached;
+        skipped++;
+        return { job, result: cached };
+      }
+
+      try {
+        const result = await pool.run(job);
+        nextCache[key] = { hash, ...result };
+        processed++;
+        const label = path.relative(SOURCE_DIR, job.input);
+        if (job.kind === 'compress') {
+          console.log(`   ✅ ${label}: ${sizeKB(result.size)} KB`);
+        } else {
+          console.log(`   🗂️  ${label}: ${result.entry.width}x${result.entry.height} ${result.entry.color}`);
+        }
+        return { job, result };
+      } catch (error) {
+        failed++;
+        console.error(`Error processing ${job.input}:`, error.message);
+        return { job, result: null };
+      }
+    }));
+
+    // Rebuild the gallery manifest from fresh and cached descriptions alike
+    const described = results.filter(({ job, result }) => job.kind === 'describe' && result);
+    const galleryDir = path.join(OUTPUT_DIR, GALLERY);
+    writeJson(path.join(galleryDir, 'manifest.json'), {
+      images: described.map(({ result }) => result.entry),
     });
-    
-    if (success) {
-      compressedPng++;
-      const stats = fs.statSync(outputPath);
-      const sizeKB = (stats.size / 1024).toFixed(2);
-      console.log(`   ✅ ${file}: ${sizeKB} KB`);
+
+    // Drop variants of images that no longer exist
+    const variantsDir = path.join(galleryDir, 'variants');
+    const keep = new Set(described.flatMap(({ result }) => result.outputs));
+    if (fs.existsSync(variantsDir)) {
+      for (const file of fs.readdirSync(variantsDir)) {
+        if (!keep.has(path.join(variantsDir, file))) {
+          fs.unlinkSync(path.join(variantsDir, file));
+        }
+      }
     }
+  } finally {
+    await pool.close();
+    writeJson(CACHE_FILE, nextCache);
   }
-  console.log(`✅ Compressed ${compressedPng}/${pngFiles.length} PNG images\n`);
 
-  console.log('✨ Image compression complete!');
-  console.log('\n💡 Note: Original files backed up with .backup extension');
-  console.log('   You can delete .backup files after verifying the compressed images look good.\n');
+  console.log(`\n✨ Processed ${processed}, skipped ${skipped} unchanged, ${failed} failed`);
+  if (failed > 0) {
+    process.exitCode = 1;
+  }
 }
 
-compressImages().catch(console.error);
+if (isMainThread) {
+  compressImages().catch((error) => {
+    console.error(error);
+    process.exitCode = 1;
+  });
+} else {
+  // Parallelism comes from the pool; one libvips thread per worker avoids
+  // oversubscribing the CPU
+  sharp.concurrency(1);
+  serveJobs(runJob);
+}
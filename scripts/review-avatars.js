@@ -0,0 +1,163 @@
+const fs = require('fs');
+const path = require('path');
+
+// Turns the portrait of every review in app/constants/reviews.ts into one
+// small WebP per avatar under public/avatars/, so the carousel only loads the
+// avatars of the pages it shows, and writes the key -> URL map it reads.
+//
+// The portraits are the randomuser.me ones the carousel used to hotlink,
+// picked the same way. Their originals are committed in assets/images/avatars/;
+// the build never downloads anything. `npm run review-portraits` fetches the
+// originals missing there, e.g. after adding reviews, for you to commit.
+// Until a portrait is committed, its review keeps hotlinking the original.
+const REVIEWS_FILE = path.join(__dirname, '..', 'app', 'constants', 'reviews.ts');
+const PORTRAIT_DIR = path.join(__dirname, '..', 'assets', 'images', 'avatars');
+const OUTPUT_DIR = path.join(__dirname, '..', 'public', 'avatars');
+const MAP_FILE = path.join(__dirname, '..', 'app', 'constants', 'reviewAvatars.ts');
+
+const portraitUrl = (id) => `https://randomuser.me/api/portraits/men/${id}.jpg`;
+
+// Avatars show at up to 64 CSS pixels; twice that covers 2x screens
+const SIZE = 128;
+const WEBP_QUALITY = 75;
+// Number of portraits to pick from (men/1.jpg to men/99.jpg)
+const PORTRAITS = 99;
+
+// Must match the avatarKey() fallback in app/components/ReviewsCarousel.tsx;
+// an empty avatarId falls back to the name, as it does for the seed below
+function avatarKey(review) {
+  return review.avatarId || review.name.toLowerCase().replace(/[^a-z0-9]+/g, '-');
+}
+
+function readReviews() {
+  const source = fs.readFileSync(REVIEWS_FILE, 'utf8');
+  const reviews = [];
+  for (const [entry] of source.matchAll(/\{[^{}]*\bname:\s*"[^"]*"[^{}]*\}/g)) {
+    const name = entry.match(/\bname:\s*"([^"]*)"/)[1];
+    const avatarId = entry.match(/\bavatarId:\s*"([^"]*)"/)?.[1];
+    reviews.push({ name, avatarId });
+  }
+  return reviews;
+}
+
+// Same choice the carousel used to make on every render: a char-code seed
+// per review, probing onward when that portrait is already taken
+function assignPortraits(reviews) {
+  const used = new Set();
+  return reviews.map((review, index) => {
+    const seed = (review.avatarId || review.name)
+      .split('')
+      .reduce((acc, char) => acc + char.charCodeAt(0), 0);
+    let id = ((seed + index * 97) % PORTRAITS) + 1;
+    if (used.has(id)) {
+      for (let offset = 1; offset < PORTRAITS; offset++) {
+        id = ((id + offset - 1) % PORTRAITS) + 1;
+        if (!used.has(id)) {
+          break;
+        }
+      }
+    }
+    used.add(id);
+    return id;
+  });
+}
+
+const portraitFile = (id) => path.join(PORTRAIT_DIR, `${id}.jpg`);
+
+// Download the originals not in assets/images/avatars/ yet
+async function fetchPortraits(ids) {
+  const missing = [...new Set(ids)].filter((id) => !fs.existsSync(portraitFile(id)));
+  fs.mkdirSync(PORTRAIT_DIR, { recursive: true });
+  await Promise.all(missing.map(async (id) => {
+    const response = await fetch(portraitUrl(id));
+    if (!response.ok) {
+      throw new Error(`${portraitUrl(id)}: HTTP ${response.status}`);
+    }
+    fs.writeFileSync(portraitFile(id), Buffer.from(await response.arrayBuffer()));
+  }));
+  return missing.length;
+}
+
+function writeIfChanged(filePath, content) {
+  if (fs.existsSync(filePath) && fs.readFileSync(filePath).equals(Buffer.from(content))) {
+    return false;
+  }
+  fs.mkdirSync(path.dirname(filePath), { recursive: true });
+  const tempPath = `${filePath}.${process.pid}.tmp`;
+  fs.writeFileSync(tempPath, content);
+  fs.renameSync(tempPath, filePath);
+  return true;
+}
+
+function renderMap(avatars) {
+  const entries = Object.entries(avatars).map(([key, src]) => `  ${JSON.stringify(key)}: ${JSON.stringify(src)},`);
+  return [
+    '// Generated by scripts/review-avatars.js; do not edit',
+    'export const REVIEW_AVATARS: Record<string, string> = {',
+    ...entries,
+    '};',
+    '',
+  ].join('\n');
+}
+
+async function main() {
+  const reviews = readReviews();
+  if (reviews.length === 0) {
+    throw new Error(`No reviews found in ${path.relative(process.cwd(), REVIEWS_FILE)}`);
+  }
+  const ids = assignPortraits(reviews);
+
+  if (process.argv.includes('--fetch')) {
+    const fetched = await fetchPortraits(ids);
+    console.log(`⬇️  Downloaded ${fetched} portraits to ${path.relative(process.cwd(), PORTRAIT_DIR)}`);
+  }
+
+  const avatars = {};
+  const missing = [];
+  let written = 0;
+  let bytes = 0;
+  for (const [index, review] of reviews.entries()) {
+    const key = avatarKey(review);
+    if (key in avatars) {
+      throw new Error(`Duplicate avatar key "${key}" in ${path.relative(process.cwd(), REVIEWS_FILE)}`);
+    }
+    if (!fs.existsSync(portraitFile(ids[index]))) {
+      missing.push(ids[index]);
+      avatars[key] = portraitUrl(ids[index]);
+      continue;
+    }
+    // Only needed when there is something to encode
+    const sharp = require('sharp');
+    const webp = await sharp(portraitFile(ids[index]))
+      .resize(SIZE, SIZE, { fit: 'cover' })
+      .webp({ quality: WEBP_QUALITY })
+      .toBuffer();
+    written += writeIfChanged(path.join(OUTPUT_DIR, `${key}.webp`), webp) ? 1 : 0;
+    bytes += webp.length;
+    avatars[key] = `/avatars/${key}.webp`;
+  }
+
+  // Drop anything else in public/avatars/, such as avatars of removed reviews
+  const current = new Set(Object.values(avatars).map((src) => path.basename(src)));
+  if (fs.existsSync(OUTPUT_DIR)) {
+    for (const file of fs.readdirSync(OUTPUT_DIR)) {
+      if (!current.has(file)) {
+        fs.rmSync(path.join(OUTPUT_DIR, file));
+      }
+    }
+  }
+  writeIfChanged(MAP_FILE, renderMap(avatars));
+
+  const local = reviews.length - missing.length;
+  console.log(`🧑 ${local} review avatars in ${path.relative(process.cwd(), OUTPUT_DIR)} `
+    + `(${written} updated, ${(bytes / 1024).toFixed(2)} KB)`);
+  if (missing.length > 0) {
+    console.warn(`⚠️  ${missing.length} reviews have no portrait in ${path.relative(process.cwd(), PORTRAIT_DIR)} `
+      + `and hotlink randomuser.me (men/${missing.join(', ')}); run \`npm run review-portraits\` and commit them`);
+  }
+}
+
+main().catch((error) => {
+  console.error(error.message);
+  process.exitCode = 1;
+});
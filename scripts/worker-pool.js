@@ -0,0 +1,106 @@
+const { Worker, parentPort } = require('worker_threads');
+
+// A fixed set of worker threads running `file`, fed jobs one at a time per
+// worker. The worker side answers with serveJobs() below. A worker that
+// crashes fails the job it was running; once none are left, every queued
+// and later job fails too, so callers never wait on a dead pool.
+function createPool(size, file) {
+  const idle = [];
+  const queue = [];
+  const callbacks = new Map();
+  const running = new Map();
+  const workers = new Set();
+  let closing = false;
+  let nextId = 0;
+
+  const settle = (id, error, result) => {
+    const callback = callbacks.get(id);
+    if (!callback) {
+      return;
+    }
+    callbacks.delete(id);
+    if (error) {
+      callback.reject(error);
+    } else {
+      callback.resolve(result);
+    }
+  };
+
+  const dispatch = () => {
+    while (idle.length > 0 && queue.length > 0) {
+      const worker = idle.pop();
+      const { id, job } = queue.shift();
+      running.set(worker, id);
+      worker.postMessage({ id, job });
+    }
+  };
+
+  const retire = (worker, error) => {
+    if (!workers.delete(worker)) {
+      return;
+    }
+    const index = idle.indexOf(worker);
+    if (index !== -1) {
+      idle.splice(index, 1);
+    }
+    if (running.has(worker)) {
+      settle(running.get(worker), error);
+      running.delete(worker);
+    }
+    if (workers.size === 0) {
+      for (const { id } of queue.splice(0)) {
+        settle(id, new Error('All pool workers exited'));
+      }
+    }
+  };
+
+  for (let i = 0; i < size; i++) {
+    const worker = new Worker(file);
+    worker.on('message', ({ id, result, error }) => {
+      running.delete(worker);
+      idle.push(worker);
+      dispatch();
+      settle(id, error && new Error(error), result);
+    });
+    worker.on('error', (error) => retire(worker, error));
+    worker.on('exit', (code) => {
+      if (!closing) {
+        retire(worker, new Error(`Pool worker exited with code ${code}`));
+      }
+    });
+    workers.add(worker);
+    idle.push(worker);
+  }
+
+  return {
+    run(job) {
+      return new Promise((resolve, reject) => {
+        if (workers.size === 0) {
+          reject(new Error('All pool workers exited'));
+          return;
+        }
+        const id = nextId++;
+        callbacks.set(id, { resolve, reject });
+        queue.push({ id, job });
+        dispatch();
+      });
+    },
+    close() {
+      closing = true;
+      return Promise.all([...workers].map(worker => worker.terminate()));
+    },
+  };
+}
+
+// Worker side of createPool(): answer each job with `handler(job)`
+function serveJobs(handler) {
+  parentPort.on('message', async ({ id, job }) => {
+    try {
+      parentPort.postMessage({ id, result: await handler(job) });
+    } catch (error) {
+      parentPort.postMessage({ id, error: error.message });
+    }
+  });
+}
+
+module.exports = { createPool, serveJobs };
@@ -0,0 +1,44 @@
+// Run with: node --test scripts/
+const test = require('node:test');
+const assert = require('node:assert');
+const { isMainThread } = require('worker_threads');
+const { createPool, serveJobs } = require('./worker-pool');
+
+if (!isMainThread) {
+  // This file doubles as the pool's worker
+  serveJobs(async ({ kind, value }) => {
+    if (kind === 'throw') {
+      throw new Error(`bad ${value}`);
+    }
+    if (kind === 'crash') {
+      process.exit(3);
+    }
+    return value * 2;
+  });
+} else {
+  test('runs jobs and passes thrown errors back', async () => {
+    const pool = createPool(2, __filename);
+    try {
+      assert.deepStrictEqual(
+        await Promise.all([1, 2, 3].map(value => pool.run({ kind: 'double', value }))),
+        [2, 4, 6],
+      );
+      await assert.rejects(pool.run({ kind: 'throw', value: 7 }), /bad 7/);
+    } finally {
+      await pool.close();
+    }
+  });
+
+  test('a crashed worker fails its job and a dead pool fails the rest', async () => {
+    const pool = createPool(1, __filename);
+    try {
+      const crashed = pool.run({ kind: 'crash' });
+      const queued = pool.run({ kind: 'double', value: 1 });
+      await assert.rejects(crashed, /exited with code 3/);
+      await assert.rejects(queued, /All pool workers exited/);
+      await assert.rejects(pool.run({ kind: 'double', value: 1 }), /All pool workers exited/);
+    } finally {
+      await pool.close();
+    }
+  });
+}
@@ -0,0 +1,4 @@
+"""Load, throughput and render-profiling tools for the app.
+
+Run from ``testsprite_tests/``, e.g. ``python -m bench.booking_load --serve``.
+"""
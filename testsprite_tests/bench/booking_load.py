@@ -0,0 +1,211 @@
+"""Open-loop load generator for ``POST /api/booking``.
+
+Requests are fired on a fixed schedule at the target rate whether or not
+earlier ones have finished, so a slow server shows up as growing latency
+instead of silently lowering the offered load. Mail goes to a local
+:class:`~bench.smtp_sink.SmtpSink`; with ``--serve`` the tool also starts the
+production server pointed at that sink.
+
+    python -m bench.booking_load --serve --rps 20 --duration 30
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import shutil
+import sys
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+from runner.server import LOG_DIR, AppServer, PROJECT_ROOT, ServerError, ensure_build
+from runner.stats import percentile
+
+from .client import HttpClient
+from .smtp_sink import SmtpSink
+
+SERVICES_FILE = PROJECT_ROOT / "app" / "constants" / "services.ts"
+
+FIRST_NAMES = ("Adam", "Youssef", "Karim", "Omar", "Liam", "Noah", "Ethan", "Mehdi", "Lucas", "Sami")
+LAST_NAMES = ("Benali", "Smith", "Haddad", "Garcia", "Martin", "El Idrissi", "Brown", "Rossi")
+NOTES = ("", "", "First visit", "Please keep the sides short", "Running 10 minutes late maybe")
+
+
+def service_titles(path=SERVICES_FILE):
+    """Service names offered on the site, read from ``services.ts``."""
+    titles = re.findall(r'\{\s*title:\s*"([^"]+)",\s*price:', path.read_text(encoding="utf-8"))
+    return titles or ["Haircut"]
+
+
+def _slot(day, rng):
+    # Mirrors BookingForm: Saturday 10-16, weekdays 9-18, closed Sunday
+    first, last = (10, 16) if day.weekday() == 5 else (9, 18)
+    hour = rng.randrange(first, last)
+    return f"{hour:02d}:00-{hour + 1:02d}:00"
+
+
+def make_payload(services, rng=random):
+    day = date.today() + timedelta(days=rng.randint(0, 7))
+    if day.weekday() == 6:
+        day += timedelta(days=1)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "name": f"{first} {last}",
+        "phone": f"+1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}",
+        "email": f"{first}.{last.replace(' ', '')}{rng.randint(1, 999)}@example.com".lower(),
+        "preferredDate": day.isoformat(),
+        "preferredTime": _slot(day, rng),
+        "service": rng.choice(services),
+        "notes": rng.choice(NOTES),
+    }
+
+
+async def generate_load(client, rps, duration, services):
+    """Fire requests at ``rps`` for ``duration`` seconds; return (status, latency) pairs."""
+    outcomes = []
+
+    async def one():
+        body = json.dumps(make_payload(services)).encode("utf-8")
+        started = time.perf_counter()
+        try:
+            response = await client.request("POST", "/api/booking", body,
+                                            {"Content-Type": "application/json"})
+            status = response.status
+        except Exception as exc:
+            status = type(exc).__name__
+        outcomes.append((status, time.perf_counter() - started))
+
+    total = int(rps * duration)
+    start = time.perf_counter()
+    tasks = []
+    for index in range(total):
+        delay = start + index / rps - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one()))
+    await asyncio.gather(*tasks)
+    return outcomes
+
+
+def summarize(outcomes, elapsed, sink, sink_window):
+    latencies = [latency * 1000 for _, latency in outcomes]
+    statuses = Counter(status for status, _ in outcomes)
+    ok = sum(count for status, count in statuses.items() if status in (200, 202))
+    return {
+        "requests": len(outcomes),
+        "achieved_rps": len(outcomes) / elapsed if elapsed else 0.0,
+        "error_rate": 1 - ok / len(outcomes) if outcomes else 0.0,
+        "statuses": {str(status): count for status, count in sorted(statuses.items(), key=str)},
+        "latency_ms": {
+            "p50": percentile(latencies, 50),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "max": max(latencies, default=None),
+        },
+        "messages": sink.messages,
+        "smtp_connections": sink.connections,
+        "messages_per_s": sink.messages / sink_window if sink_window else 0.0,
+    }
+
+
+def print_report(report):
+    latency = report["latency_ms"]
+
+    def fmt(value):
+        return "-" if value is None else f"{value:.0f}ms"
+
+    print(f"\n📨 {report['requests']} booking requests at {report['achieved_rps']:.1f} req/s")
+    print(f"   latency p50 {fmt(latency['p50'])}  p90 {fmt(latency['p90'])}  "
+          f"p99 {fmt(latency['p99'])}  max {fmt(latency['max'])}")
+    print(f"   error rate {report['error_rate'] * 100:.1f}%  statuses {report['statuses']}")
+    print(f"   {report['messages']} message(s) over {report['smtp_connections']} SMTP connection(s), "
+          f"{report['messages_per_s']:.1f} msg/s")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench.booking_load", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rps", type=float, default=10.0, help="requests per second (default: 10)")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds of load (default: 20)")
+    parser.add_argument("--connections", type=int, default=64,
+                        help="maximum open HTTP connections (default: 64)")
+    parser.add_argument("--base-url", default="http://127.0.0.1:3100",
+                        help="booking API origin when not using --serve")
+    parser.add_argument("--serve", action="store_true",
+                        help="start 'next start' on --port with SMTP pointed at the sink")
+    parser.add_argument("--port", type=int, default=3100, help="port for --serve (default: 3100)")
+    parser.add_argument("--delivery", choices=("inline", "queue"), default="inline",
+                        help="BOOKING_DELIVERY mode for --serve (default: inline)")
+    parser.add_argument("--smtp-port", type=int, default=2525, help="sink port (default: 2525)")
+    parser.add_argument("--smtp-delay", type=float, default=0.0,
+                        help="seconds the sink waits before each reply, to mimic a remote relay")
+    parser.add_argument("--drain", type=float, default=10.0,
+                        help="seconds to wait for queued mail after the last response (default: 10)")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    return parser.parse_args(argv)
+
+
+async def _run(args, base_url, sink):
+    client = HttpClient(base_url, max_connections=args.connections)
+    services = service_titles()
+    started = time.perf_counter()
+    try:
+        outcomes = await generate_load(client, args.rps, args.duration, services)
+    finally:
+        await client.close()
+    elapsed = time.perf_counter() - started
+
+    # Deliveries may lag the responses when the API queues mail
+    expected = sum(1 for status, _ in outcomes if status in (200, 202))
+    deadline = time.perf_counter() + args.drain
+    while sink.messages < expected and time.perf_counter() < deadline:
+        await asyncio.sleep(0.1)
+    sink_window = (sink.delivered_at[-1] - started) if sink.delivered_at else 0.0
+    return summarize(outcomes, elapsed, sink, sink_window)
+
+
+async def _main(args):
+    async with SmtpSink(port=args.smtp_port, delay=args.smtp_delay) as sink:
+        server = None
+        if args.serve:
+            ensure_build()
+            # Start from an empty queue so leftovers do not inflate the count
+            queue_dir = LOG_DIR / f"booking-queue-{args.port}"
+            shutil.rmtree(queue_dir, ignore_errors=True)
+            server = AppServer(args.port, env={
+                "BREVO_SMTP_HOST": "127.0.0.1",
+                "BREVO_SMTP_PORT": str(sink.port),
+                "BREVO_SMTP_USER": "loadtest",
+                "BREVO_SMTP_PASSWORD": "loadtest",
+                "BARBERSHOP_OWNER_EMAIL": "owner@example.com",
+                "BOOKING_DELIVERY": args.delivery,
+                "BOOKING_QUEUE_DIR": str(queue_dir),
+            })
+        try:
+            if server:
+                server.start()
+                await asyncio.to_thread(server.wait_until_healthy)
+            return await _run(args, server.base_url if server else args.base_url, sink)
+        finally:
+            if server:
+                server.stop()
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        report = asyncio.run(_main(args))
+    except ServerError as exc:
+        print(f"❌ {exc}")
+        return 1
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
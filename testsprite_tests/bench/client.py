@@ -0,0 +1,136 @@
+"""Minimal asyncio HTTP/1.1 client with a keep-alive connection pool.
+
+Load tools need to control exactly how many connections are open and to
+reuse them between requests, which is what this client does; it
+understands ``Content-Length``, chunked and bodiless (HEAD, 204, 304)
+responses and nothing fancier.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+
+class HttpError(Exception):
+    """Raised for malformed responses or dropped connections."""
+
+
+@dataclass
+class Response:
+    status: int
+    headers: dict
+    body: bytes
+    elapsed: float
+    wire_bytes: int
+
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.reusable = True
+
+    def close(self):
+        self.writer.close()
+
+
+class HttpClient:
+    """Send requests to one origin over at most ``max_connections`` sockets."""
+
+    def __init__(self, base_url, max_connections=32, timeout=30.0):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.host_header = parts.netloc
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._idle = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def _acquire(self):
+        if self._idle:
+            return self._idle.pop()
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        self.connections_opened += 1
+        return _Connection(reader, writer)
+
+    def _release(self, connection):
+        if connection.reusable:
+            self._idle.append(connection)
+        else:
+            connection.close()
+
+    async def request(self, method, path, body=b"", headers=None):
+        async with self._slots:
+            connection = await self._acquire()
+            try:
+                return await asyncio.wait_for(
+                    self._exchange(connection, method, path, body, headers or {}), self.timeout)
+            except BaseException:
+                connection.reusable = False
+                raise
+            finally:
+                self._release(connection)
+
+    async def _exchange(self, connection, method, path, body, headers):
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host_header}",
+                 f"Content-Length: {len(body)}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        started = time.perf_counter()
+        connection.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await connection.writer.drain()
+
+        reader = connection.reader
+        wire = 0
+        # Interim 1xx responses (100 Continue, 103 Early Hints) precede the real one
+        status = 100
+        while 100 <= status < 200:
+            status_line = await reader.readline()
+            if not status_line:
+                raise HttpError("connection closed before the response")
+            wire += len(status_line)
+            try:
+                status = int(status_line.split()[1])
+            except (IndexError, ValueError) as exc:
+                raise HttpError(f"bad status line {status_line!r}") from exc
+
+            response_headers = {}
+            while True:
+                line = await reader.readline()
+                wire += len(line)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                response_headers[name.strip().lower()] = value.strip()
+
+        if method == "HEAD" or status in (204, 304):
+            # These never carry a body, whatever the headers announce
+            payload = b""
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size_line = await reader.readline()
+                wire += len(size_line)
+                size = int(size_line.split(b";")[0], 16)
+                chunk = await reader.readexactly(size + 2)
+                wire += len(chunk)
+                if size == 0:
+                    break
+                chunks.append(chunk[:-2])
+            payload = b"".join(chunks)
+        elif "content-length" in response_headers:
+            payload = await reader.readexactly(int(response_headers["content-length"]))
+            wire += len(payload)
+        else:
+            payload = await reader.read()
+            wire += len(payload)
+            connection.reusable = False
+
+        if response_headers.get("connection", "").lower() == "close":
+            connection.reusable = False
+        return Response(status, response_headers, payload, time.perf_counter() - started, wire)
+
+    async def close(self):
+        while self._idle:
+            self._idle.pop().close()
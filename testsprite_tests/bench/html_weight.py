@@ -0,0 +1,229 @@
+"""HTML weight and parse time of every page, compared across builds.
+
+For each target server and each static page of the build it fetches the
+HTML (identity encoding) and measures its size raw and gzipped, how many
+``data-editor-id`` attributes it carries and how many bytes they take, and
+whether it loads the visual editor's ``/editor.js``. It then loads each
+page ``--runs`` times in Chromium under a device profile and takes the
+median HTML parse time (``responseEnd`` to ``domInteractive``) and, when
+present, the bytes of ``editor.js``.
+
+Compare an editor build with a production build by labelling the targets;
+savings are reported against the first one:
+
+    python -m bench.html_weight --target editor=http://127.0.0.1:3200 --target prod=http://127.0.0.1:3100
+    python -m bench.html_weight --serve --require-clean
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import re
+import sys
+from pathlib import Path
+
+from playwright import async_api
+
+from runner.emulation import PROFILES, emulate
+from runner.server import AppServer, ServerError, ensure_build, route_paths, warm_up
+from runner.session import launch_browser
+from runner.stats import percentile
+
+from .client import HttpClient
+
+EDITOR_ATTRIBUTE = re.compile(rb'\sdata-editor-id="[^"]*"')
+EDITOR_SCRIPT = b"/editor.js"
+
+_PARSE_TIMING = """
+() => {
+  const nav = performance.getEntriesByType('navigation')[0];
+  const editor = performance.getEntriesByType('resource').find((r) => r.name.endsWith('/editor.js'));
+  return {
+    parse_ms: nav ? nav.domInteractive - nav.responseEnd : null,
+    editor_js_bytes: editor ? editor.decodedBodySize : 0,
+  };
+}
+"""
+
+
+def parse_target(value):
+    label, sep, url = value.partition("=")
+    if not sep:
+        label, url = value, value
+    return label, url.rstrip("/")
+
+
+def page_paths():
+    """Static HTML pages of the build: no API routes, internal pages or files like /sitemap.xml."""
+    return [path for path in route_paths()
+            if not path.startswith(("/api", "/_")) and "." not in path.rsplit("/", 1)[-1]]
+
+
+def weigh_html(html):
+    attributes = EDITOR_ATTRIBUTE.findall(html)
+    return {
+        "html_bytes": len(html),
+        "html_gzip_bytes": len(gzip.compress(html, 6)),
+        "editor_ids": len(attributes),
+        "editor_id_bytes": sum(len(attribute) for attribute in attributes),
+        "editor_script": EDITOR_SCRIPT in html,
+    }
+
+
+async def fetch_pages(base_url, paths):
+    client = HttpClient(base_url, max_connections=4)
+    try:
+        weights = {}
+        for path in paths:
+            response = await client.request("GET", path, headers={"Accept-Encoding": "identity"})
+            if response.status != 200:
+                raise ServerError(f"GET {base_url}{path} answered {response.status}")
+            weights[path] = weigh_html(response.body)
+        return weights
+    finally:
+        await client.close()
+
+
+async def time_parsing(browser, base_url, paths, profile, runs):
+    context = await browser.new_context(base_url=base_url)
+    try:
+        timings = {}
+        for path in paths:
+            samples = []
+            for _ in range(runs):
+                page = await context.new_page()
+                try:
+                    cdp = await context.new_cdp_session(page)
+                    await emulate(cdp, profile)
+                    await cdp.send("Network.enable")
+                    await cdp.send("Network.setCacheDisabled", {"cacheDisabled": True})
+                    await page.goto(path, wait_until="load")
+                    samples.append(await page.evaluate(_PARSE_TIMING))
+                finally:
+                    await page.close()
+            timings[path] = {
+                "parse_ms": percentile([s["parse_ms"] for s in samples], 50),
+                "editor_js_bytes": max(s["editor_js_bytes"] for s in samples),
+            }
+        return timings
+    finally:
+        await context.close()
+
+
+async def measure(targets, profile, runs, headless=True):
+    paths = page_paths()
+    report = {}
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, headless)
+        try:
+            for label, base_url in targets:
+                weights = await fetch_pages(base_url, paths)
+                timings = await time_parsing(browser, base_url, paths, profile, runs)
+                report[label] = {path: {**weights[path], **timings[path]} for path in paths}
+        finally:
+            await browser.close()
+    return report
+
+
+def savings(report):
+    """Per page, what every later target saves against the first one."""
+    labels = list(report)
+    baseline = report[labels[0]]
+    result = {}
+    for label in labels[1:]:
+        result[label] = {}
+        for path, m in report[label].items():
+            base = baseline.get(path)
+            if not base:
+                continue
+            result[label][path] = {
+                "html_bytes": base["html_bytes"] - m["html_bytes"],
+                "html_gzip_bytes": base["html_gzip_bytes"] - m["html_gzip_bytes"],
+                "editor_js_bytes": base["editor_js_bytes"] - m["editor_js_bytes"],
+                "parse_ms": (None if base["parse_ms"] is None or m["parse_ms"] is None
+                             else base["parse_ms"] - m["parse_ms"]),
+            }
+    return result
+
+
+def print_report(report, saved):
+    def fmt(value):
+        return "-" if value is None else f"{value:.1f}"
+
+    for label, pages in report.items():
+        print(f"\n📄 {label}")
+        print(f"   {'page':<16} {'HTML kB':>8} {'gzip kB':>8} {'editor ids':>10} {'ids kB':>7} "
+              f"{'editor.js kB':>12} {'parse ms':>9}")
+        for path, m in pages.items():
+            print(f"   {path:<16} {m['html_bytes'] / 1024:>8.1f} {m['html_gzip_bytes'] / 1024:>8.1f} "
+                  f"{m['editor_ids']:>10} {m['editor_id_bytes'] / 1024:>7.1f} "
+                  f"{m['editor_js_bytes'] / 1024:>12.1f} {fmt(m['parse_ms']):>9}")
+    baseline = next(iter(report), None)
+    for label, pages in saved.items():
+        print(f"\n💾 {label} vs {baseline}")
+        for path, s in pages.items():
+            print(f"   {path:<16} HTML -{s['html_bytes'] / 1024:.1f} kB "
+                  f"(gzip -{s['html_gzip_bytes'] / 1024:.1f} kB), editor.js -{s['editor_js_bytes'] / 1024:.1f} kB, "
+                  f"parse -{fmt(s['parse_ms'])} ms")
+
+
+def instrumented(report):
+    """Pages that still carry editor attributes or load editor.js."""
+    return [f"{label} {path}" for label, pages in report.items() for path, m in pages.items()
+            if m["editor_ids"] or m["editor_script"] or m["editor_js_bytes"]]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench.html_weight", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", action="append", type=parse_target, dest="targets",
+                        metavar="LABEL=URL", help="server to measure, repeatable; the first is the baseline")
+    parser.add_argument("--serve", action="store_true",
+                        help="build the app if needed and measure 'next start' on --port")
+    parser.add_argument("--port", type=int, default=3100, help="port for --serve (default: 3100)")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="mobile",
+                        help="device profile for the parse timings (default: mobile)")
+    parser.add_argument("--runs", type=int, default=5, help="loads per page and target (default: 5)")
+    parser.add_argument("--require-clean", action="store_true",
+                        help="exit with 1 when a page still carries editor attributes or editor.js")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    targets = list(args.targets or [])
+    server = None
+    try:
+        if args.serve:
+            ensure_build()
+            server = AppServer(args.port).start()
+            server.wait_until_healthy()
+            targets.append(("production", server.base_url))
+        if not targets:
+            targets = [("local", "http://127.0.0.1:3100")]
+        warm_up([url for _, url in targets])
+        report = asyncio.run(measure(targets, args.profile, args.runs, not args.headed))
+    except ServerError as exc:
+        print(f"❌ {exc}")
+        return 1
+    finally:
+        if server:
+            server.stop()
+    saved = savings(report)
+    print_report(report, saved)
+    if args.json:
+        Path(args.json).write_text(json.dumps({"pages": report, "savings": saved}, indent=2),
+                                   encoding="utf-8")
+    if args.require_clean:
+        dirty = instrumented(report)
+        if dirty:
+            print("❌ Editor instrumentation shipped on: " + ", ".join(dirty))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
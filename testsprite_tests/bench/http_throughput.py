@@ -0,0 +1,309 @@
+"""Closed-loop HTTP throughput of pages, static assets and API routes.
+
+Like ``wrk``: ``--connections`` keep-alive connections each send their next
+request as soon as the previous response arrives, for ``--duration``
+seconds after ``--warmup`` seconds that are not counted. Every path group
+(``/``, ``/api/health``, ``/api/gallery`` and the gallery JPEGs by
+default) is measured on its own, once per ``Accept-Encoding``, and
+reported as requests/s, latency percentiles and histogram, and wire
+bytes/s.
+
+Requesting ``identity`` turns Next's response compression off for that
+run, so the two encodings compare ``compress: true`` against no
+compression on the same server. Other configurations are compared as
+labelled targets; the first one is the baseline. ``--serve`` runs the
+standalone ``server.js`` of the current build, and ``--variant`` also
+builds and serves a copy of the app with a piece of it removed:
+
+    python -m bench.http_throughput --serve --variant no-middleware
+    python -m bench.http_throughput --target a=http://127.0.0.1:3100 --target b=http://127.0.0.1:3101
+    python -m bench.http_throughput --serve --path / --path '/gallery/*.jpg' --connections 64
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import shutil
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from runner.server import (LOG_DIR, PROJECT_ROOT, ServerError, StandaloneServer, build_id,
+                           ensure_build, warm_up)
+from runner.stats import percentile
+
+from .client import HttpClient, HttpError
+
+DEFAULT_PATHS = ("/", "/api/health", "/api/gallery", "/gallery/*.jpg")
+PUBLIC_DIR = PROJECT_ROOT / "public"
+
+ENCODINGS = {"gzip": "gzip", "identity": "identity"}
+
+# Files left out of each variant's copy of the app
+VARIANTS = {"no-middleware": ("middleware.ts",)}
+VARIANT_DIR = LOG_DIR / "variants"
+_VARIANT_IGNORE = shutil.ignore_patterns("node_modules", ".next", ".git", "testsprite_tests",
+                                         ".booking-queue")
+
+# Upper bounds of the latency histogram buckets, in ms; the last bucket is open
+HISTOGRAM_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+def parse_target(value):
+    label, sep, url = value.partition("=")
+    if not sep:
+        label, url = value, value
+    return label, url.rstrip("/")
+
+
+def path_groups(patterns):
+    """(name, paths) per pattern; globs are expanded against ``public/``."""
+    groups = []
+    for pattern in patterns:
+        if not any(char in pattern for char in "*?["):
+            groups.append((pattern, [pattern]))
+            continue
+        paths = sorted("/" + path.relative_to(PUBLIC_DIR).as_posix()
+                       for path in PUBLIC_DIR.glob(pattern.lstrip("/")) if path.is_file())
+        if not paths:
+            raise ServerError(f"no file under {PUBLIC_DIR} matches {pattern}")
+        groups.append((pattern, paths))
+    return groups
+
+
+def build_variant(name):
+    """Build a copy of the app without the files of ``VARIANTS[name]``; return its root.
+
+    The copy shares ``node_modules`` with the app and is rebuilt whenever
+    the app's own build changes.
+    """
+    root = VARIANT_DIR / name
+    stamp = root / ".source-build"
+    source_build = ensure_build()
+    if build_id(root) and stamp.exists() and stamp.read_text(encoding="utf-8") == source_build:
+        return root
+    print(f"🔨 Building the {name} variant...", flush=True)
+    shutil.rmtree(root, ignore_errors=True)
+    shutil.copytree(PROJECT_ROOT, root, ignore=_VARIANT_IGNORE)
+    for relative in VARIANTS[name]:
+        (root / relative).unlink(missing_ok=True)
+    (root / "node_modules").symlink_to(PROJECT_ROOT / "node_modules", target_is_directory=True)
+    ensure_build(root, rebuild=True)
+    stamp.write_text(source_build, encoding="utf-8")
+    return root
+
+
+async def hammer(client, paths, connections, seconds, headers):
+    """Keep ``connections`` requests in flight for ``seconds``; return (samples, elapsed).
+
+    A sample is ``(status, latency_s, wire_bytes)``; failed requests carry
+    the exception name as status and no latency.
+    """
+    samples = []
+    deadline = time.perf_counter() + seconds
+
+    async def worker(offset):
+        index = offset
+        while time.perf_counter() < deadline:
+            path = paths[index % len(paths)]
+            index += 1
+            try:
+                response = await client.request("GET", path, headers=headers)
+                samples.append((response.status, response.elapsed, response.wire_bytes))
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                    ValueError, HttpError) as exc:
+                samples.append((type(exc).__name__, None, 0))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(connections)))
+    return samples, time.perf_counter() - started
+
+
+def histogram(latencies_ms):
+    counts = [0] * (len(HISTOGRAM_MS) + 1)
+    for latency in latencies_ms:
+        counts[bisect.bisect_left(HISTOGRAM_MS, latency)] += 1
+    labels = [f"<={bound}ms" for bound in HISTOGRAM_MS] + [f">{HISTOGRAM_MS[-1]}ms"]
+    return dict(zip(labels, counts, strict=True))
+
+
+def summarize(samples, elapsed, connections_opened):
+    latencies = [latency * 1000 for _, latency, _ in samples if latency is not None]
+    statuses = Counter(status for status, _, _ in samples)
+    ok = sum(count for status, count in statuses.items() if isinstance(status, int) and status < 400)
+    wire = sum(wire_bytes for _, _, wire_bytes in samples)
+    return {
+        "requests": len(samples),
+        "errors": len(samples) - ok,
+        "statuses": {str(status): count for status, count in sorted(statuses.items(), key=str)},
+        "rps": len(samples) / elapsed if elapsed else 0.0,
+        "bytes_per_s": wire / elapsed if elapsed else 0.0,
+        "bytes_per_response": wire / len(samples) if samples else 0.0,
+        "connections_opened": connections_opened,
+        "latency_ms": {
+            "p50": percentile(latencies, 50),
+            "p75": percentile(latencies, 75),
+            "p90": percentile(latencies, 90),
+            "p99": percentile(latencies, 99),
+            "max": max(latencies, default=None),
+        },
+        "histogram": histogram(latencies),
+    }
+
+
+async def measure(targets, groups, encodings, connections, duration, warmup):
+    """label -> encoding -> path group -> summary."""
+    report = {}
+    for label, base_url in targets:
+        report[label] = {}
+        for encoding in encodings:
+            headers = {"Accept-Encoding": ENCODINGS[encoding]}
+            report[label][encoding] = {}
+            for name, paths in groups:
+                client = HttpClient(base_url, max_connections=connections)
+                try:
+                    if warmup > 0:
+                        await hammer(client, paths, connections, warmup, headers)
+                    samples, elapsed = await hammer(client, paths, connections, duration, headers)
+                finally:
+                    await client.close()
+                report[label][encoding][name] = summarize(samples, elapsed, client.connections_opened)
+    return report
+
+
+def _change(new, old):
+    if new is None or not old:
+        return None
+    return (new - old) / old * 100
+
+
+def compare(report):
+    """Every later target against the first, and identity against gzip per target."""
+    labels = list(report)
+    baseline = report[labels[0]]
+    result = {"targets": {}, "compression": {}}
+    for label in labels[1:]:
+        result["targets"][label] = {
+            encoding: {
+                name: {
+                    "rps_pct": _change(s["rps"], baseline[encoding][name]["rps"]),
+                    "p99_pct": _change(s["latency_ms"]["p99"], baseline[encoding][name]["latency_ms"]["p99"]),
+                }
+                for name, s in groups.items() if name in baseline.get(encoding, {})
+            }
+            for encoding, groups in report[label].items()
+        }
+    for label, encodings in report.items():
+        if "gzip" not in encodings or "identity" not in encodings:
+            continue
+        result["compression"][label] = {
+            name: {
+                "rps_pct": _change(encodings["gzip"][name]["rps"], s["rps"]),
+                "p50_pct": _change(encodings["gzip"][name]["latency_ms"]["p50"], s["latency_ms"]["p50"]),
+                "bytes_per_response_pct": _change(encodings["gzip"][name]["bytes_per_response"],
+                                                  s["bytes_per_response"]),
+            }
+            for name, s in encodings["identity"].items()
+        }
+    return result
+
+
+def print_report(report, comparison, connections, duration):
+    def fmt(value, unit=""):
+        return "-" if value is None else f"{value:.1f}{unit}"
+
+    def pct(value):
+        return "-" if value is None else f"{value:+.1f}%"
+
+    for label, encodings in report.items():
+        for encoding, groups in encodings.items():
+            print(f"\n🚀 {label} ({encoding}), {connections} connections for {duration:.0f}s")
+            print(f"   {'path':<18} {'req/s':>9} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} "
+                  f"{'max ms':>8} {'MB/s':>7} {'errors':>7}")
+            for name, s in groups.items():
+                latency = s["latency_ms"]
+                print(f"   {name:<18} {s['rps']:>9.0f} {fmt(latency['p50']):>8} {fmt(latency['p90']):>8} "
+                      f"{fmt(latency['p99']):>8} {fmt(latency['max']):>8} "
+                      f"{s['bytes_per_s'] / 1e6:>7.2f} {s['errors']:>7}")
+            for name, s in groups.items():
+                total = sum(s["histogram"].values())
+                buckets = "  ".join(f"{bucket} {count / total * 100:.0f}%"
+                                    for bucket, count in s["histogram"].items() if count)
+                print(f"   {name:<18} {buckets or '-'}")
+    baseline = next(iter(report), None)
+    for label, encodings in comparison["targets"].items():
+        print(f"\n⚖️  {label} vs {baseline}")
+        for encoding, groups in encodings.items():
+            for name, c in groups.items():
+                print(f"   {encoding:<8} {name:<18} req/s {pct(c['rps_pct'])}  p99 {pct(c['p99_pct'])}")
+    for label, groups in comparison["compression"].items():
+        print(f"\n🗜️  {label}: gzip vs identity")
+        for name, c in groups.items():
+            print(f"   {name:<18} req/s {pct(c['rps_pct'])}  p50 {pct(c['p50_pct'])}  "
+                  f"bytes/response {pct(c['bytes_per_response_pct'])}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench.http_throughput", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", action="append", type=parse_target, dest="targets",
+                        metavar="LABEL=URL", help="server to measure, repeatable; the first is the baseline")
+    parser.add_argument("--serve", action="store_true",
+                        help="build the app if needed and measure its standalone server on --port")
+    parser.add_argument("--variant", action="append", choices=sorted(VARIANTS), dest="variants",
+                        help="also build and serve this variant of the app on the next free port, repeatable")
+    parser.add_argument("--port", type=int, default=3100, help="first port for served apps (default: 3100)")
+    parser.add_argument("--path", action="append", dest="paths", metavar="PATH",
+                        help="path or glob under public/ to measure, repeatable "
+                             f"(default: {' '.join(DEFAULT_PATHS)})")
+    parser.add_argument("--encoding", action="append", choices=sorted(ENCODINGS), dest="encodings",
+                        help="Accept-Encoding to request, repeatable (default: gzip and identity)")
+    parser.add_argument("--connections", type=int, default=16,
+                        help="concurrent keep-alive connections (default: 16)")
+    parser.add_argument("--duration", type=float, default=10.0,
+                        help="measured seconds per path and encoding (default: 10)")
+    parser.add_argument("--warmup", type=float, default=2.0,
+                        help="unmeasured seconds before each measurement (default: 2)")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    targets = list(args.targets or [])
+    servers = []
+    try:
+        groups = path_groups(args.paths or DEFAULT_PATHS)
+        if args.serve or args.variants:
+            ensure_build()
+            roots = [("standalone", PROJECT_ROOT)] if args.serve else []
+            roots += [(name, build_variant(name)) for name in args.variants or []]
+            for offset, (label, root) in enumerate(roots):
+                servers.append((label, StandaloneServer(args.port + offset, root).start()))
+            for label, server in servers:
+                server.wait_until_healthy()
+                targets.append((label, server.base_url))
+        if not targets:
+            targets = [("local", "http://127.0.0.1:3100")]
+        warm_up([url for _, url in targets], [paths[0] for _, paths in groups])
+        encodings = args.encodings or list(ENCODINGS)
+        report = asyncio.run(measure(targets, groups, encodings, args.connections,
+                                     args.duration, args.warmup))
+    except ServerError as exc:
+        print(f"❌ {exc}")
+        return 1
+    finally:
+        for _, server in servers:
+            server.stop()
+    comparison = compare(report)
+    print_report(report, comparison, args.connections, args.duration)
+    if args.json:
+        Path(args.json).write_text(json.dumps({"results": report, "comparison": comparison}, indent=2),
+                                   encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
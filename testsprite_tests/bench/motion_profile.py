@@ -0,0 +1,343 @@
+"""Render-performance profile of the homepage's framer-motion sections.
+
+Loads the homepage under a device profile (CPU throttling included),
+records a Chromium trace through CDP ``Tracing`` and scrolls through every
+section with wheel input, one frame per step, then opens and closes the
+services modal. Every section gets its own window in the trace, bracketed
+by ``performance.mark`` calls, and the report gives per section:
+
+* frames: rAF intervals, dropped frames (longer than two frame budgets) and
+  the p95 and longest frame;
+* long tasks (main-thread tasks over 50 ms) and the blocking time they add;
+* style recalculations and layouts, and how many of them were forced
+  synchronously by script (a stack trace on the trace event), with the
+  scripts that forced the most.
+
+    python -m bench.motion_profile --profile mobile --runs 3
+    python -m bench.motion_profile --serve --profile mobile --profile desktop --json tmp/motion.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+from playwright import async_api
+
+from runner.emulation import PROFILES, emulate
+from runner.readiness import wait_for_animations, wait_for_network_idle
+from runner.server import AppServer, ServerError, ensure_build, warm_up
+from runner.session import launch_browser, new_case_context
+from runner.snapshots import SnapshotCache
+from runner.stats import percentile
+from runner.timing import start_log
+
+# Section anchors in page order and the component that renders each
+SECTIONS = {
+    "home": "Hero",
+    "about": "page.tsx (about)",
+    "services": "page.tsx (services)",
+    "gallery": "GalleryGrid",
+    "reviews": "ReviewsCarousel",
+    "booking": "BookingForm",
+    "contact": "MapEmbed",
+    "faq": "FAQAccordion",
+}
+MODAL = "services-modal"
+MODAL_COMPONENT = "ServiceCategoryModal"
+
+TRACE_CATEGORIES = [
+    "toplevel",
+    "blink.user_timing",
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "disabled-by-default-devtools.timeline.stack",
+]
+
+FRAME_BUDGET_MS = 1000 / 60
+
+# Frames longer than this many budgets count as dropped
+DROPPED_FRAME_BUDGETS = 2
+
+LONG_TASK_MS = 50
+
+# Pixels scrolled per wheel event; one event per frame
+WHEEL_STEP = 120
+
+# Give up on reaching a section after this many wheel events, or after this
+# many in a row that did not move the page (a scroll lock or overlay)
+MAX_WHEEL_STEPS = 200
+MAX_STALLED_STEPS = 5
+
+_MARK_PREFIX = "motion-profile:"
+
+# Timestamps of every animation frame, in the page's performance.now() clock
+_FRAME_RECORDER = """
+(() => {
+  const frames = (window.__frames = []);
+  const tick = (time) => { frames.push(time); requestAnimationFrame(tick); };
+  requestAnimationFrame(tick);
+})();
+"""
+
+_MARK = """
+(name) => { performance.mark(name); return performance.now(); }
+"""
+
+_FRAMES_BETWEEN = """
+([start, end]) => window.__frames.filter((time) => time >= start && time <= end)
+"""
+
+# Distance from the viewport top to the section, and whether the page can scroll further
+_SCROLL_STATE = """
+(selector) => {
+  const el = document.querySelector(selector);
+  const bottom = window.scrollY + window.innerHeight >= document.documentElement.scrollHeight - 1;
+  return { top: el ? el.getBoundingClientRect().top : 0, bottom, scrollY: window.scrollY };
+}
+"""
+
+_NEXT_FRAME = "() => new Promise((resolve) => requestAnimationFrame(() => resolve()))"
+
+_STYLE_EVENTS = ("UpdateLayoutTree", "RecalculateStyles")
+
+
+async def _scroll_to(page, selector):
+    last_y, stalled = None, 0
+    for _ in range(MAX_WHEEL_STEPS):
+        state = await page.evaluate(_SCROLL_STATE, selector)
+        if state["top"] <= 1 or state["bottom"]:
+            return
+        stalled = stalled + 1 if state["scrollY"] == last_y else 0
+        if stalled >= MAX_STALLED_STEPS:
+            return
+        last_y = state["scrollY"]
+        await page.mouse.wheel(0, min(WHEEL_STEP, state["top"]))
+        await page.evaluate(_NEXT_FRAME)
+
+
+async def _window(page, name, action):
+    start = await page.evaluate(_MARK, f"{_MARK_PREFIX}{name}:start")
+    await action()
+    end = await page.evaluate(_MARK, f"{_MARK_PREFIX}{name}:end")
+    return name, await page.evaluate(_FRAMES_BETWEEN, [start, end])
+
+
+async def _toggle_modal(page):
+    await page.locator("#services button").first.click()
+    close = page.locator("button[aria-label='Close modal']")
+    await close.wait_for()
+    await wait_for_animations(page, ".pointer-events-none.fixed")
+    await page.keyboard.press("Escape")
+    await close.wait_for(state="hidden")
+
+
+async def _walk(page):
+    """Scroll through every section and the modal; return frame times per window."""
+    frames = {}
+    for section in SECTIONS:
+        async def visit(selector=f"#{section}"):
+            await _scroll_to(page, selector)
+            await wait_for_animations(page, selector)
+        name, times = await _window(page, section, visit)
+        frames[name] = times
+        if section == "services":
+            name, times = await _window(page, MODAL, lambda: _toggle_modal(page))
+            frames[name] = times
+    return frames
+
+
+def _stack_source(event):
+    stack = (event.get("args", {}).get("beginData") or {}).get("stackTrace") or []
+    if not stack:
+        return None
+    frame = stack[0]
+    url = frame.get("url", "").rsplit("/", 1)[-1] or "(inline)"
+    return f"{frame.get('functionName') or '(anonymous)'} {url}:{frame.get('lineNumber', 0)}"
+
+
+def analyze_trace(events, frames):
+    """Turn trace events and per-window frame times into per-section metrics."""
+    marks = {e["name"][len(_MARK_PREFIX):]: e for e in events
+             if e.get("name", "").startswith(_MARK_PREFIX)}
+    main_thread = next(((e["pid"], e["tid"]) for e in marks.values()), None)
+    tasks = [e for e in events if e.get("ph") == "X" and (e.get("pid"), e.get("tid")) == main_thread]
+
+    report = {}
+    for name, times in frames.items():
+        start, end = marks.get(f"{name}:start"), marks.get(f"{name}:end")
+        if not start or not end:
+            continue
+        inside = [e for e in tasks if start["ts"] <= e["ts"] <= end["ts"]]
+        intervals = [b - a for a, b in zip(times, times[1:], strict=False)]
+        long_tasks = [e["dur"] / 1000 for e in inside
+                      if e["name"] == "RunTask" and e.get("dur", 0) / 1000 > LONG_TASK_MS]
+        styles = [e for e in inside if e["name"] in _STYLE_EVENTS]
+        layouts = [e for e in inside if e["name"] == "Layout"]
+        forced = [e for e in styles + layouts if _stack_source(e)]
+        report[name] = {
+            "component": SECTIONS.get(name, MODAL_COMPONENT),
+            "duration_ms": (end["ts"] - start["ts"]) / 1000,
+            "frames": len(intervals),
+            "dropped_frames": sum(1 for i in intervals if i > FRAME_BUDGET_MS * DROPPED_FRAME_BUDGETS),
+            "p95_frame_ms": percentile(intervals, 95),
+            "max_frame_ms": max(intervals, default=None),
+            "long_tasks": len(long_tasks),
+            "blocking_ms": sum(duration - LONG_TASK_MS for duration in long_tasks),
+            "style_recalcs": len(styles),
+            "style_ms": sum(e.get("dur", 0) for e in styles) / 1000,
+            "layouts": len(layouts),
+            "layout_ms": sum(e.get("dur", 0) for e in layouts) / 1000,
+            "forced_reflows": len(forced),
+            "forced_ms": sum(e.get("dur", 0) for e in forced) / 1000,
+            "forced_by": dict(Counter(_stack_source(e) for e in forced).most_common(3)),
+        }
+    return report
+
+
+async def profile_once(browser, base_url, profile, storage_state=None):
+    """One cold load and walk under ``profile``; returns the per-section report."""
+    start_log()  # keep the readiness waits out of the console
+    context = await new_case_context(browser, base_url, storage_state)
+    try:
+        page = await context.new_page()
+        cdp = await context.new_cdp_session(page)
+        await emulate(cdp, profile)
+        await page.add_init_script(_FRAME_RECORDER)
+        await page.goto("/", wait_until="load")
+        await wait_for_network_idle(page)
+        await wait_for_animations(page, "#home")
+        size = PROFILES[profile]
+        await page.mouse.move(size["width"] / 2, size["height"] / 2)
+
+        await browser.start_tracing(page=page, categories=TRACE_CATEGORIES)
+        try:
+            frames = await _walk(page)
+        finally:
+            trace = json.loads(await browser.stop_tracing())
+        events = trace["traceEvents"] if isinstance(trace, dict) else trace
+        return analyze_trace(events, frames)
+    finally:
+        await context.close()
+
+
+def aggregate(runs):
+    """Median of every numeric metric across runs, per section."""
+    merged = {}
+    for name in runs[0]:
+        samples = [run[name] for run in runs if name in run]
+        merged[name] = {"component": samples[0]["component"], "runs": len(samples)}
+        # A metric may be None in some runs (too few frames for a p95), so
+        # take every key any run measured; percentile() skips the Nones
+        metrics = dict.fromkeys(key for sample in samples for key, value in sample.items()
+                                if value is None or isinstance(value, (int, float)))
+        for key in metrics:
+            merged[name][key] = percentile([sample.get(key) for sample in samples], 50)
+        forced_by = Counter()
+        for sample in samples:
+            forced_by.update(sample["forced_by"])
+        merged[name]["forced_by"] = dict(forced_by.most_common(3))
+    return merged
+
+
+async def run_profiles(base_url, profiles, runs, headless=True):
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, headless)
+        try:
+            storage_state = await SnapshotCache(browser).path_for("consent-accepted", base_url)
+            report = {}
+            for profile in profiles:
+                samples = [await profile_once(browser, base_url, profile, storage_state)
+                           for _ in range(runs)]
+                report[profile] = aggregate(samples)
+            return report
+        finally:
+            await browser.close()
+
+
+def print_report(report):
+    def fmt(value):
+        return "-" if value is None else f"{value:.0f}"
+
+    for profile, sections in report.items():
+        rate = PROFILES[profile]["cpuThrottling"]
+        print(f"\n🎞  {profile} ({rate}x CPU throttling)")
+        print(f"   {'section':<16} {'component':<22} {'frames':>6} {'dropped':>7} {'p95':>5} "
+              f"{'max':>5} {'long':>4} {'TBT':>5} {'styles':>6} {'layout':>6} {'forced':>6}")
+        for name, m in sections.items():
+            print(f"   {name:<16} {m['component']:<22} {fmt(m['frames']):>6} "
+                  f"{fmt(m['dropped_frames']):>7} {fmt(m['p95_frame_ms']):>5} {fmt(m['max_frame_ms']):>5} "
+                  f"{fmt(m['long_tasks']):>4} {fmt(m['blocking_ms']):>5} "
+                  f"{fmt(m['style_ms']):>6} {fmt(m['layout_ms']):>6} {fmt(m['forced_reflows']):>6}")
+        for name, m in sections.items():
+            if m["forced_by"]:
+                culprits = ", ".join(f"{source} ×{count}" for source, count in m["forced_by"].items())
+                print(f"   forced in {name}: {culprits}")
+    print("\n   frame times and TBT in ms; styles/layout = ms of style recalculation and layout")
+
+
+def jank_violations(report, max_dropped):
+    """Sections whose share of dropped frames exceeds ``max_dropped`` (0..1)."""
+    violations = []
+    for profile, sections in report.items():
+        for name, m in sections.items():
+            if m["frames"] and m["dropped_frames"] / m["frames"] > max_dropped:
+                violations.append(f"{profile} {name}: {m['dropped_frames']:.0f} of "
+                                  f"{m['frames']:.0f} frames dropped")
+    return violations
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m bench.motion_profile", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile", action="append", choices=sorted(PROFILES), dest="profiles",
+                        help="device profile, repeatable (default: mobile)")
+    parser.add_argument("--runs", type=int, default=3,
+                        help="cold loads per profile; the report shows medians (default: 3)")
+    parser.add_argument("--base-url", default="http://127.0.0.1:3100",
+                        help="app origin when not using --serve")
+    parser.add_argument("--serve", action="store_true",
+                        help="build the app if needed and start 'next start' on --port")
+    parser.add_argument("--port", type=int, default=3100, help="port for --serve (default: 3100)")
+    parser.add_argument("--max-dropped", type=float, metavar="SHARE",
+                        help="exit with 1 when a section drops more than this share of frames, e.g. 0.1")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    profiles = args.profiles or ["mobile"]
+    server = None
+    try:
+        if args.serve:
+            ensure_build()
+            server = AppServer(args.port).start()
+            server.wait_until_healthy()
+            base_url = server.base_url
+        else:
+            base_url = args.base_url
+        warm_up([base_url])
+        report = asyncio.run(run_profiles(base_url, profiles, args.runs, not args.headed))
+    except ServerError as exc:
+        print(f"❌ {exc}")
+        return 1
+    finally:
+        if server:
+            server.stop()
+    print_report(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.max_dropped is not None:
+        violations = jank_violations(report, args.max_dropped)
+        if violations:
+            print("❌ Jank budget exceeded: " + "; ".join(violations))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Local SMTP stand-in that accepts and counts every message.
+
+It speaks just enough ESMTP for nodemailer (EHLO, AUTH PLAIN/LOGIN with any
+credentials, MAIL/RCPT/DATA, RSET, NOOP, QUIT) so ``/api/booking`` can be
+load tested without sending real mail. An optional delay per command
+approximates the round trips of a remote provider.
+"""
+
+import asyncio
+import time
+
+
+class SmtpSink:
+    def __init__(self, host="127.0.0.1", port=2525, delay=0.0):
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.messages = 0
+        self.connections = 0
+        self.delivered_at = []
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._session, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def _reply(self, writer, text):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        writer.write(text.encode("ascii") + b"\r\n")
+        await writer.drain()
+
+    async def _session(self, reader, writer):
+        self.connections += 1
+        try:
+            await self._reply(writer, "220 localhost ESMTP sink")
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                command = line.decode("utf-8", "replace").strip()
+                verb = command.split(" ", 1)[0].upper()
+                if verb == "EHLO":
+                    await self._reply(writer, "250-localhost\r\n250-AUTH PLAIN LOGIN\r\n"
+                                              "250-8BITMIME\r\n250 SIZE 10485760")
+                elif verb == "HELO":
+                    await self._reply(writer, "250 localhost")
+                elif verb == "AUTH":
+                    await self._auth(reader, writer, command.split()[1:])
+                elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                    await self._reply(writer, "250 OK")
+                elif verb == "DATA":
+                    await self._reply(writer, "354 End data with <CR><LF>.<CR><LF>")
+                    while (await reader.readline()) not in (b".\r\n", b".\n", b""):
+                        pass
+                    self.messages += 1
+                    self.delivered_at.append(time.perf_counter())
+                    await self._reply(writer, f"250 OK queued as {self.messages}")
+                elif verb == "QUIT":
+                    await self._reply(writer, "221 Bye")
+                    return
+                else:
+                    await self._reply(writer, "502 Command not implemented")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _auth(self, reader, writer, args):
+        mechanism = args[0].upper() if args else ""
+        if mechanism == "PLAIN" and len(args) < 2:
+            await self._reply(writer, "334 ")
+            await reader.readline()
+        elif mechanism == "LOGIN":
+            if len(args) < 2:
+                await self._reply(writer, "334 VXNlcm5hbWU6")
+                await reader.readline()
+            await self._reply(writer, "334 UGFzc3dvcmQ6")
+            await reader.readline()
+        await self._reply(writer, "235 Authentication successful")
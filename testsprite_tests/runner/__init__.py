@@ -0,0 +1,68 @@
+"""Shared-browser runner for the TestSprite Playwright cases.
+
+Run from ``testsprite_tests/``::
+
+    python -m runner                 # every TC0xx case
+    python -m runner TC001 TC005 -j 2
+    python -m runner --shards 4      # one process per shard
+    python -m runner --serve --servers 2
+    python -m runner --capture       # keep traces of failed/slow cases
+    python -m runner --last-failed --retries 2
+    python -m runner --changed main  # only cases the changes touch
+"""
+
+from .artifacts import ArtifactStore
+from .assertions import CheckResult, assert_all, check_all
+from .asset_cache import AssetCache
+from .cases import Case, CaseLoadError, discover_cases, load_case, plan_case
+from .plan import PlanError, run_plan
+from .pool import CaseResult, run_case, run_cases
+from .readiness import (
+    ASSERT_TIMEOUT_MS,
+    wait_for_animations,
+    wait_for_health,
+    wait_for_network_idle,
+    wait_for_sections,
+    wait_until_ready,
+)
+from .results import write_results
+from .server import AppServer, ServerError, ServerPool, build_id, warm_up
+from .session import run_standalone
+from .sharding import balance, run_sharded
+from .snapshots import RECIPES, SnapshotCache, SnapshotError
+
+__all__ = [
+    "ASSERT_TIMEOUT_MS",
+    "AppServer",
+    "ArtifactStore",
+    "AssetCache",
+    "Case",
+    "CaseLoadError",
+    "CaseResult",
+    "CheckResult",
+    "PlanError",
+    "RECIPES",
+    "ServerError",
+    "ServerPool",
+    "SnapshotCache",
+    "SnapshotError",
+    "assert_all",
+    "balance",
+    "build_id",
+    "check_all",
+    "discover_cases",
+    "load_case",
+    "plan_case",
+    "run_case",
+    "run_cases",
+    "run_plan",
+    "run_sharded",
+    "run_standalone",
+    "wait_for_animations",
+    "wait_for_health",
+    "wait_for_network_idle",
+    "wait_for_sections",
+    "wait_until_ready",
+    "warm_up",
+    "write_results",
+]
@@ -0,0 +1,225 @@
+"""Command line entry point: ``python -m runner [TC001 TC005 ...]``."""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import sys
+import time
+
+from .artifacts import DEFAULT_MAX_BYTES, DEFAULT_SLOW_AFTER, ArtifactStore
+from .asset_cache import merge_stats
+from .cases import discover_cases
+from .history import History, order_longest_first
+from .impact import ImpactError, analyze
+from .pool import DEFAULT_CASE_TIMEOUT, run_cases
+from .report import print_result, print_summary
+from .results import write_results
+from .server import ServerError, ServerPool, warm_up
+from .session import DEFAULT_BASE_URL
+from .sharding import balance, run_sharded
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m runner", description=__doc__)
+    parser.add_argument("ids", nargs="*", help="case ids to run (default: all)")
+    parser.add_argument("-j", "--concurrency", type=int, default=4,
+                        help="cases running at the same time per shard (default: 4)")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="browsers to launch per shard; slots are spread over them (default: 1)")
+    parser.add_argument("-s", "--shards", type=int, default=0,
+                        help="split the suite across N worker processes, balanced on past "
+                             f"durations (0 = run in this process, max useful: {os.cpu_count()})")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL,
+                        help=f"app under test when not using --serve (default: {DEFAULT_BASE_URL})")
+    parser.add_argument("--serve", action="store_true",
+                        help="build the app if needed and run it with 'next start' for this run")
+    parser.add_argument("--servers", type=int, default=1,
+                        help="with --serve, number of server instances to spread workers over")
+    parser.add_argument("--port", type=int, default=3100,
+                        help="with --serve, port of the first server instance (default: 3100)")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="with --serve, rebuild even if a production build exists")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_CASE_TIMEOUT,
+                        help=f"per-case timeout in seconds (default: {DEFAULT_CASE_TIMEOUT})")
+    parser.add_argument("--retries", type=int, default=0,
+                        help="rerun failed cases up to N more times; a pass on retry counts "
+                             "towards the case's flakiness score (default: 0)")
+    parser.add_argument("--last-failed", action="store_true",
+                        help="only run the cases that failed in the last recorded run")
+    parser.add_argument("--changed", nargs="?", const="HEAD", metavar="REF",
+                        help="only run the cases whose features touch files changed against REF "
+                             "(default: HEAD, i.e. uncommitted changes); shared files such as "
+                             "app/layout.tsx select the full suite")
+    parser.add_argument("--no-quarantine", dest="quarantine", action="store_false",
+                        help="run flaky cases with the others instead of in a separate pass "
+                             "whose failures do not fail the run")
+    parser.add_argument("--no-asset-cache", dest="asset_cache", action="store_false",
+                        help="let every context download static assets from the server")
+    parser.add_argument("--capture", action="store_true",
+                        help="record a trace, HAR and CPU profile per case; keep them for "
+                             "failed or slow cases under tmp/artifacts")
+    parser.add_argument("--capture-slow", type=float, default=DEFAULT_SLOW_AFTER, metavar="SECONDS",
+                        help="with --capture, also keep passing cases slower than this "
+                             f"(default: {DEFAULT_SLOW_AFTER:.0f})")
+    parser.add_argument("--capture-budget", type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        metavar="MB", help="with --capture, disk budget for kept artifacts; oldest "
+                                           f"are deleted first (default: {DEFAULT_MAX_BYTES // 1024 // 1024})")
+    parser.add_argument("--headed", action="store_true", help="show the browser windows")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = discover_cases(args.ids)
+    if args.last_failed:
+        failed = History().last_failed()
+        cases = [case for case in cases if case.id in failed]
+        if not cases:
+            print("No case failed in the last recorded run.")
+            return 0
+    if args.changed and cases:
+        try:
+            impact = analyze(cases, args.changed)
+        except ImpactError as exc:
+            print(f"❌ Cannot select cases by changes: {exc}")
+            return 1
+        if impact.full_suite:
+            print(f"🔎 {len(impact.changed)} changed file(s); {impact.reason}, running every case")
+        else:
+            print(f"🔎 {len(impact.changed)} changed file(s) touch "
+                  f"{', '.join(impact.features) or 'no feature'}")
+        cases = impact.cases
+        if not cases:
+            print("No case is affected by the changes.")
+            return 0
+    if not cases:
+        print("No matching cases found.")
+        return 1
+
+    with contextlib.ExitStack() as stack:
+        try:
+            if args.serve:
+                pool = stack.enter_context(ServerPool(args.servers, args.port, rebuild=args.rebuild))
+                base_urls = pool.base_urls
+            else:
+                base_urls = [args.base_url]
+            warmed = warm_up(base_urls)
+        except ServerError as exc:
+            print(f"❌ App server not ready: {exc}")
+            return 1
+        for url, timings in warmed.items():
+            print(f"🔥 Warmed {url}: {len(timings)} route(s) in {sum(timings.values()):.1f}s")
+        servers = {url: {"started": args.serve, "routes": len(timings),
+                         "warmup": round(sum(timings.values()), 3)}
+                   for url, timings in warmed.items()}
+        return run(args, cases, base_urls, servers)
+
+
+def _execute(args, cases, options, durations, cache_stats):
+    if args.shards > 1:
+        groups = balance([case.id for case in cases], args.shards, durations)
+        print(f"▶ Running {len(cases)} case(s) in {len(groups)} shard(s):")
+        for index, group in enumerate(groups, 1):
+            estimate = sum(durations.get(case_id, 0.0) for case_id in group)
+            print(f"   shard {index}: {' '.join(group)} (~{estimate:.0f}s recorded)")
+        print()
+        return run_sharded(cases, args.shards, durations, cache_stats, **options)
+    print(f"▶ Running {len(cases)} case(s) with concurrency {args.concurrency} "
+          f"on {args.workers} browser(s)\n")
+    return asyncio.run(run_cases(cases, on_result=print_result, cache_stats=cache_stats, **options))
+
+
+def _retry(args, cases, results, options, cache_stats):
+    # Failed cases run again in this process; the last attempt's result counts
+    by_id = {case.id: case for case in cases}
+    for attempt in range(2, args.retries + 2):
+        failed = [by_id[result.case_id] for result in results if not result.passed]
+        if not failed:
+            break
+        print(f"\n↻ Retrying {len(failed)} failed case(s), attempt {attempt}")
+        retried = asyncio.run(run_cases(failed, on_result=print_result, cache_stats=cache_stats,
+                                        **options))
+        for result in retried:
+            result.attempts = attempt
+        by_result = {result.case_id: result for result in retried}
+        results = [by_result.get(result.case_id, result) for result in results]
+    return results
+
+
+def _exclusive(cases, options, cache_stats):
+    # One case at a time, each in a browser of its own, with nothing else running
+    options = {**options, "concurrency": 1, "workers": 1}
+    results = []
+    for case in cases:
+        results += asyncio.run(run_cases([case], on_result=print_result,
+                                         cache_stats=cache_stats, **options))
+    return results, options
+
+
+def _run_pass(args, cases, options, cache_stats, execute):
+    shared = [case for case in cases if not case.exclusive]
+    exclusive = [case for case in cases if case.exclusive]
+    results = []
+    if shared:
+        results = _retry(args, shared, execute(shared), options, cache_stats)
+    if exclusive:
+        print(f"\n▶ Exclusive pass for {' '.join(case.id for case in exclusive)}, "
+              "one case per browser with nothing else running\n")
+        exclusive_results, exclusive_options = _exclusive(exclusive, options, cache_stats)
+        results += _retry(args, exclusive, exclusive_results, exclusive_options, cache_stats)
+    return results
+
+
+def run(args, cases, base_urls, servers=None):
+    artifacts = None
+    if args.capture:
+        artifacts = ArtifactStore(slow_after=args.capture_slow,
+                                  max_bytes=int(args.capture_budget * 1024 * 1024))
+    options = {
+        "concurrency": args.concurrency,
+        "workers": args.workers,
+        "base_url": base_urls,
+        "headless": not args.headed,
+        "timeout": args.timeout,
+        "asset_cache": args.asset_cache,
+        "artifacts": artifacts,
+    }
+    history = History()
+    durations = history.durations()
+    cases = order_longest_first(cases, durations)
+    quarantined = history.flaky() & {case.id for case in cases} if args.quarantine else set()
+    regular = [case for case in cases if case.id not in quarantined]
+    flaky = [case for case in cases if case.id in quarantined]
+
+    cache_stats = []
+    started = time.perf_counter()
+    results = []
+    if regular:
+        results = _run_pass(args, regular, options, cache_stats,
+                            lambda group: _execute(args, group, options, durations, cache_stats))
+    flaky_results = []
+    if flaky:
+        print(f"\n▶ Quarantine pass for flaky case(s) {' '.join(case.id for case in flaky)}; "
+              "their failures do not fail the run\n")
+        flaky_results = _run_pass(args, flaky, options, cache_stats,
+                                  lambda group: asyncio.run(run_cases(group, on_result=print_result,
+                                                                      cache_stats=cache_stats, **options)))
+    wall = time.perf_counter() - started
+
+    all_results = results + flaky_results
+    test_ids = write_results(all_results, cases)
+    history.record_run(all_results, servers, test_ids=test_ids, quarantined=quarantined, options={
+        "ids": [case.id for case in cases], "concurrency": args.concurrency,
+        "workers": args.workers, "shards": args.shards, "retries": args.retries,
+        "asset_cache": args.asset_cache, "capture": args.capture,
+    })
+    print_summary(all_results, wall, merge_stats(cache_stats))
+    ignored = [result.case_id for result in flaky_results if not result.passed]
+    if ignored:
+        print(f"Quarantined failures not counted: {' '.join(ignored)}")
+    return 0 if all(result.passed for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Trace, HAR and CPU-profile capture for failing or slow cases.
+
+With capture enabled every case records a Playwright trace, a HAR of its
+network traffic and a Chromium CPU profile per page into a staging
+directory. When the case finishes the artifacts are kept only if it failed
+or ran longer than ``slow_after`` seconds; kept runs form a ring buffer
+under ``tmp/artifacts`` whose oldest entries are deleted once the total
+size exceeds ``max_bytes``.
+
+Open the results with ``playwright show-trace trace.zip``, any HAR viewer,
+and the DevTools Performance panel for ``*.cpuprofile``.
+"""
+
+import asyncio
+import json
+import shutil
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from playwright import async_api
+
+from .cases import CASES_DIR
+
+ARTIFACTS_DIR = CASES_DIR / "tmp" / "artifacts"
+
+# Cases at least this slow keep their artifacts even when they pass
+DEFAULT_SLOW_AFTER = 20.0
+
+# Disk budget for kept artifacts, oldest runs deleted first
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+
+_STAGING = ".staging"
+
+
+def _size(path):
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+@dataclass(frozen=True)
+class ArtifactStore:
+    """Where and when to keep artifacts; plain data so shards can pickle it."""
+
+    root: Path = ARTIFACTS_DIR
+    slow_after: float = DEFAULT_SLOW_AFTER
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    def begin(self, case_id):
+        return CaseCapture(self, case_id)
+
+    def keep(self, result):
+        return not result.passed or result.duration >= self.slow_after
+
+    def prune(self, protect=None):
+        """Delete the oldest kept runs until the rest fit ``max_bytes``."""
+        runs = sorted((p for p in self.root.iterdir() if p.is_dir() and p.name != _STAGING),
+                      key=lambda p: p.stat().st_mtime)
+        sizes = {run: _size(run) for run in runs}
+        total = sum(sizes.values())
+        for run in runs:
+            if total <= self.max_bytes:
+                break
+            if run == protect:
+                continue
+            shutil.rmtree(run, ignore_errors=True)
+            total -= sizes[run]
+
+
+class CaseCapture:
+    """Artifacts of one case, recorded into a staging directory."""
+
+    def __init__(self, store, case_id):
+        self.store = store
+        self.case_id = case_id
+        self.staging = store.root / _STAGING / f"{case_id}-{uuid.uuid4().hex[:8]}"
+        self._profilers = []
+        self._pending = []
+
+    def context_options(self):
+        """Extra ``browser.new_context`` options; the HAR is written on close."""
+        self.staging.mkdir(parents=True, exist_ok=True)
+        return {"record_har_path": str(self.staging / "network.har"), "record_har_content": "omit"}
+
+    async def start(self, context):
+        await context.tracing.start(screenshots=True, snapshots=True)
+        context.on("page", lambda page: self._pending.append(
+            asyncio.ensure_future(self._profile(context, page))))
+
+    async def _profile(self, context, page):
+        # Starts as soon as the case opens the page, before it navigates
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Profiler.enable")
+        await cdp.send("Profiler.start")
+        self._profilers.append(cdp)
+
+    async def stop(self, context):
+        """Stop tracing and profiling; call before the context closes."""
+        await asyncio.gather(*self._pending, return_exceptions=True)
+        for index, cdp in enumerate(self._profilers, 1):
+            try:
+                profile = (await cdp.send("Profiler.stop"))["profile"]
+            except async_api.Error:
+                continue  # The page was closed by the case
+            (self.staging / f"page-{index}.cpuprofile").write_text(json.dumps(profile))
+        try:
+            await context.tracing.stop(path=self.staging / "trace.zip")
+        except async_api.Error:
+            pass
+
+    def finish(self, result):
+        """Keep or drop the artifacts once the context is closed.
+
+        Returns the kept directory, or ``None`` when the case was fast and
+        passed.
+        """
+        if not self.staging.exists():
+            return None  # The case failed before its context was created
+        if not self.store.keep(result):
+            shutil.rmtree(self.staging, ignore_errors=True)
+            return None
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        kept = self.store.root / f"{stamp}-{self.case_id}-{result.status.lower()}"
+        if kept.exists():
+            kept = kept.with_name(f"{kept.name}-{self.staging.name.rsplit('-', 1)[1]}")
+        self.staging.rename(kept)
+        self.store.prune(protect=kept)
+        return kept
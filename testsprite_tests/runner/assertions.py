@@ -0,0 +1,271 @@
+"""Batched DOM assertions: many checks, one round trip.
+
+``expect(locator)`` polls each locator over its own CDP round trips. These
+helpers instead inject a single script that runs the retry loop inside the
+page and returns once every check has passed or one has timed out::
+
+    await assert_all(page, [
+        {"selector": "#faq button[aria-expanded='true']", "count": 1},
+        {"selector": "footer a[aria-label='Instagram']", "visible": True},
+        ("Consent is stored", {"cookie": {"cookie-consent": "accepted"}}),
+    ])
+
+A check names a CSS ``selector`` plus element conditions (``visible``,
+``text``, ``attribute``, ``class``, ``style``, ``property``,
+``in_viewport``) and how many elements must meet them (at least one by
+default, ``count``, ``min_count``, ``every``; ``visible: False`` means
+none), or is a page-level ``local_storage``, ``cookie``, ``layout_shift``
+or ``script_bytes`` check.
+
+The last two measure the page: the layout shift score of shifts that moved
+elements ``within`` a selector, and the kB of JavaScript the page has
+loaded (encoded, as transferred). Either passes at or below its ``max``
+minus an optional ``drop``. ``max`` is a number or the name an earlier
+check in the same tab stored its measurement under with ``save``, so a
+returning visit can be held to the first one::
+
+    {"script_bytes": {"save": "first visit"}}
+    ...
+    {"script_bytes": {"max": "first visit", "drop": 2}}
+
+Checks hold in order, like consecutive ``expect`` calls: each one is polled
+once the checks before it have passed, with its own ``timeout`` (ms). The
+time every check waited is added to the case's timing log.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from playwright import async_api
+
+from .readiness import ASSERT_TIMEOUT_MS
+from .timing import record
+
+# Delay between two evaluations of a failing check inside the page, in milliseconds
+POLL_INTERVAL_MS = 50
+
+# Navigations a single check_all may ride out before giving up on the page
+MAX_RESTARTS = 5
+
+_CHECKS = """
+async ({ specs, pollMs }) => {
+  const isVisible = (el) => {
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+  };
+  const inViewport = (el) => {
+    const rect = el.getBoundingClientRect();
+    return rect.bottom > 0 && rect.right > 0 && rect.top < innerHeight && rect.left < innerWidth;
+  };
+  const show = (value) => JSON.stringify(value);
+
+  // Stored values are compared as strings, or field by field when the
+  // expected value is an object and the stored one is JSON
+  const checkEntries = (store, read, entries) => {
+    for (const [key, expected] of Object.entries(entries)) {
+      const raw = read(key);
+      if (expected === null || typeof expected !== 'object') {
+        if (raw !== expected) return `${store} ${key} is ${show(raw)}, expected ${show(expected)}`;
+        continue;
+      }
+      let parsed = null;
+      try { parsed = JSON.parse(raw); } catch (e) {}
+      for (const [field, value] of Object.entries(expected)) {
+        const actual = parsed ? parsed[field] : undefined;
+        if (actual !== value) return `${store} ${key}.${field} is ${show(actual)}, expected ${show(value)}`;
+      }
+    }
+    return null;
+  };
+
+  const readCookie = (name) => {
+    const pair = document.cookie.split('; ').find((cookie) => cookie.startsWith(name + '='));
+    return pair === undefined ? null : decodeURIComponent(pair.slice(name.length + 1));
+  };
+
+  // Measurements saved by earlier checks; sessionStorage outlives reloads
+  const SAVED_PREFIX = '__assertions:';
+  let measured = null;
+
+  const checkMeasure = (label, value, { save, max = 0, drop = 0 }, format) => {
+    measured = format(value);
+    if (save) {
+      sessionStorage.setItem(`${SAVED_PREFIX}${label}:${save}`, String(value));
+      return null;
+    }
+    let limit = max;
+    if (typeof max === 'string') {
+      const saved = sessionStorage.getItem(`${SAVED_PREFIX}${label}:${max}`);
+      if (saved === null) return `${label}: no measurement saved as ${show(max)}`;
+      limit = Number(saved);
+    }
+    limit -= drop;
+    return value <= limit ? null : `${label} is ${format(value)}, expected <= ${format(limit)}`;
+  };
+
+  const checkLayoutShift = (spec) => {
+    const root = document.querySelector(spec.within);
+    const total = (window.__layoutShifts || [])
+      .filter((shift) => root && shift.nodes.some((node) => root.contains(node)))
+      .reduce((sum, shift) => sum + shift.value, 0);
+    return checkMeasure(`layout shift within ${spec.within}`, total, spec, (value) => value.toFixed(4));
+  };
+
+  const checkScriptBytes = (spec) => {
+    const kb = performance.getEntriesByType('resource')
+      .filter((entry) => entry.initiatorType === 'script')
+      .reduce((sum, entry) => sum + entry.encodedBodySize, 0) / 1024;
+    return checkMeasure('script bytes', kb, spec, (value) => `${value.toFixed(1)} kB`);
+  };
+
+  const checkElements = (spec) => {
+    const all = Array.from(document.querySelectorAll(spec.selector));
+    const conditions = [];
+    if (spec.visible !== undefined) conditions.push(isVisible);
+    if (spec.text !== undefined) conditions.push((el) => el.textContent.includes(spec.text));
+    if (spec.attribute) conditions.push((el) => Object.entries(spec.attribute)
+      .every(([name, value]) => el.getAttribute(name) === value));
+    if (spec.class) conditions.push((el) => el.classList.contains(spec.class));
+    if (spec.style) conditions.push((el) => {
+      const style = getComputedStyle(el);
+      return Object.entries(spec.style).every(([name, value]) => style.getPropertyValue(name) === value);
+    });
+    if (spec.property) conditions.push((el) => Object.entries(spec.property)
+      .every(([name, value]) => el[name] === value));
+    if (spec.in_viewport !== undefined) conditions.push((el) => inViewport(el) === spec.in_viewport);
+
+    const matching = all.filter((el) => conditions.every((condition) => condition(el))).length;
+    const found = `${matching} of ${all.length} matched`;
+    if (spec.visible === false) {
+      return matching === 0 ? null : `${spec.selector}: expected none visible, ${found}`;
+    }
+    if (spec.every) {
+      return all.length > 0 && matching === all.length ? null : `${spec.selector}: expected all to match, ${found}`;
+    }
+    if (spec.count !== undefined) {
+      return matching === spec.count ? null : `${spec.selector}: expected exactly ${spec.count}, ${found}`;
+    }
+    const min = spec.min_count === undefined ? 1 : spec.min_count;
+    return matching >= min ? null : `${spec.selector}: expected at least ${min}, ${found}`;
+  };
+
+  const evaluate = (spec) => {
+    measured = null;
+    try {
+      return spec.local_storage ? checkEntries('localStorage', (key) => localStorage.getItem(key), spec.local_storage)
+        : spec.cookie ? checkEntries('cookie', readCookie, spec.cookie)
+        : spec.layout_shift ? checkLayoutShift(spec.layout_shift)
+        : spec.script_bytes ? checkScriptBytes(spec.script_bytes)
+        : checkElements(spec);
+    } catch (error) {
+      return String(error);
+    }
+  };
+
+  const results = [];
+  let since = performance.now();
+  for (const spec of specs) {
+    let detail = evaluate(spec);
+    while (detail !== null && performance.now() - since < spec.timeout) {
+      await new Promise((resolve) => setTimeout(resolve, pollMs));
+      detail = evaluate(spec);
+    }
+    const now = performance.now();
+    results.push({ detail, waited: now - since, reached: true, measured });
+    since = now;
+    if (detail !== null) break;
+  }
+  // Checks after a timed-out one are only evaluated once, for the report
+  for (const spec of specs.slice(results.length)) {
+    results.push({ detail: evaluate(spec), waited: 0, reached: false, measured });
+  }
+  return results;
+}
+"""
+
+
+@dataclass
+class CheckResult:
+    description: str
+    label: str
+    detail: Optional[str]
+    waited: float
+    reached: bool = True
+    measured: Optional[str] = None
+
+    @property
+    def passed(self):
+        return self.detail is None
+
+    @property
+    def name(self):
+        return self.label if self.measured is None else f"{self.label} = {self.measured}"
+
+    def __str__(self):
+        status = "ok" if self.passed else self.detail
+        return f"{self.name}: {status} ({self.waited * 1000:.0f}ms)"
+
+
+def _label(spec):
+    if "local_storage" in spec:
+        return "localStorage " + ", ".join(spec["local_storage"])
+    if "cookie" in spec:
+        return "cookie " + ", ".join(spec["cookie"])
+    if "layout_shift" in spec:
+        return f"layout shift within {spec['layout_shift']['within']}"
+    if "script_bytes" in spec:
+        return "script bytes"
+    if "text" in spec:
+        return f"{spec['selector']} \"{spec['text']}\""
+    return spec["selector"]
+
+
+def _normalize(checks, timeout):
+    normalized = []
+    for check in checks:
+        description, spec = check if isinstance(check, tuple) else (None, check)
+        spec = {"timeout": timeout, **spec}
+        normalized.append((description or _label(spec), spec))
+    return normalized
+
+
+async def check_all(page, checks, timeout=ASSERT_TIMEOUT_MS):
+    """Evaluate ``checks`` in one injected script and return a ``CheckResult`` each.
+
+    ``checks`` holds spec dicts or ``(description, spec)`` pairs; ``timeout``
+    applies to specs without their own.
+    """
+    checks = _normalize(checks, timeout)
+    specs = [spec for _, spec in checks]
+    for restart in range(MAX_RESTARTS + 1):
+        try:
+            outcomes = await page.evaluate(_CHECKS, {"specs": specs, "pollMs": POLL_INTERVAL_MS})
+            break
+        except async_api.Error as error:
+            # A navigation replaced the document mid-loop; start over on the new one,
+            # unless the page keeps navigating (a redirect or reload loop)
+            if "context was destroyed" not in str(error) or restart == MAX_RESTARTS:
+                raise
+            await page.wait_for_load_state("domcontentloaded")
+
+    results = []
+    for (description, spec), outcome in zip(checks, outcomes, strict=True):
+        result = CheckResult(description, _label(spec), outcome["detail"],
+                             outcome["waited"] / 1000, outcome["reached"], outcome["measured"])
+        if result.reached:
+            record(f"expect {result.name}", result.waited, ok=result.passed, kind="check")
+        results.append(result)
+    return results
+
+
+async def assert_all(page, checks, timeout=ASSERT_TIMEOUT_MS):
+    """Like :func:`check_all`, but raise ``AssertionError`` on the first failure."""
+    results = await check_all(page, checks, timeout)
+    failed = [result for result in results if not result.passed]
+    if failed:
+        first = failed[0]
+        message = f"Test case failed: {first.description} ({first.detail})"
+        if len(failed) > 1:
+            message += "; also failing: " + ", ".join(result.label for result in failed[1:])
+        raise AssertionError(message)
+    return results
@@ -0,0 +1,106 @@
+"""In-memory cache for static assets, shared by all contexts of a worker.
+
+Every case would otherwise re-download ``barber-background.png``, the gallery
+photos, fonts and JS chunks from the app server. The cache intercepts those
+requests with ``context.route`` and keeps the responses in a byte-bounded
+LRU keyed by site build and path, so each asset is fetched from the server
+once per worker and suite run. Assets of one build are identical on every
+server instance, so the origin is not part of the key.
+"""
+
+import asyncio
+import re
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+from .server import site_build_hash
+
+STATIC_ASSETS = re.compile(
+    r"/_next/static/|/_next/image\?|\.(?:png|jpe?g|webp|avif|gif|svg|ico|woff2?|ttf|otf)(?:\?|$)"
+)
+
+# Total size of cached bodies per worker, in bytes
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Bodies are served decoded, so transfer headers must not be replayed
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class AssetCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._entries = OrderedDict()
+        self._pending = {}
+
+    async def attach(self, context, base_url):
+        """Serve the static assets requested by ``context`` from this cache."""
+        build = await asyncio.to_thread(site_build_hash, base_url)
+
+        async def handle(route):
+            await self._handle(route, build)
+
+        await context.route(STATIC_ASSETS, handle)
+
+    async def _handle(self, route, build):
+        request = route.request
+        if request.method != "GET":
+            await route.fallback()
+            return
+        parts = urlsplit(request.url)
+        key = (build, parts.path + (f"?{parts.query}" if parts.query else ""))
+
+        entry = self._entries.get(key)
+        if entry is None and key in self._pending:
+            entry = await asyncio.shield(self._pending[key])
+        if entry is not None:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.hits += 1
+            self.bytes_saved += len(entry[2])
+            status, headers, body = entry
+            await route.fulfill(status=status, headers=headers, body=body)
+            return
+
+        self.misses += 1
+        pending = asyncio.get_running_loop().create_future()
+        self._pending[key] = pending
+        try:
+            response = await route.fetch()
+            body = await response.body()
+            headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+            entry = (response.status, headers, body)
+            if response.status == 200:
+                self._store(key, entry)
+            pending.set_result(entry if response.status == 200 else None)
+        except BaseException:
+            pending.set_result(None)
+            raise
+        finally:
+            del self._pending[key]
+        await route.fulfill(status=entry[0], headers=entry[1], body=entry[2])
+
+    def _store(self, key, entry):
+        size = len(entry[2])
+        if size > self.max_bytes // 4:
+            return
+        self._entries[key] = entry
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "bytes_saved": self.bytes_saved}
+
+
+def merge_stats(stats):
+    """Sum the ``stats()`` of several workers or shards."""
+    total = {"hits": 0, "misses": 0, "bytes_saved": 0}
+    for item in stats:
+        for key in total:
+            total[key] += item.get(key, 0)
+    return total
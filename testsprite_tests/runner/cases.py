@@ -0,0 +1,121 @@
+"""Discovery of the TC0xx cases.
+
+Most cases are data: every entry of ``testsprite_frontend_test_plan.json``
+whose steps all carry ``run``/``expect`` parts is executed by
+:mod:`runner.plan`. Cases that need custom code are scripts instead, and a
+script overrides the plan entry with the same id.
+
+Each script exposes an ``async def run_test(context)`` coroutine and only
+runs itself under ``if __name__ == "__main__"``, so importing it here never
+starts a browser. A script may also set ``START_STATE`` to the name of a
+storage snapshot (see :mod:`runner.snapshots`) its context should start from,
+``ASSET_CACHE = False`` to fetch static assets from the server itself,
+``EXCLUSIVE = True`` to run alone in its own browser after the other cases
+(for measurements that must not share the CPU or browser cache), and
+``TIMEOUT`` to replace the runner's per-case timeout, in seconds.
+``FEATURES`` (``features`` in a plan entry) names the features of
+``tmp/code_summary.json`` the case covers, for :mod:`runner.impact`.
+"""
+
+import importlib.util
+import inspect
+import json
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+CASES_DIR = Path(__file__).resolve().parent.parent
+CASE_GLOB = "TC[0-9][0-9][0-9]_*.py"
+TEST_PLAN = CASES_DIR / "testsprite_frontend_test_plan.json"
+
+
+class CaseLoadError(Exception):
+    """Raised when a case script does not expose a usable ``run_test``."""
+
+
+@dataclass(frozen=True)
+class Case:
+    id: str
+    title: str
+    path: Path
+    run: Callable[..., Awaitable[None]]
+    start_state: Optional[str] = None
+    asset_cache: bool = True
+    exclusive: bool = False
+    timeout: Optional[float] = None
+    features: tuple = ()
+    plan: Optional[dict] = field(default=None, compare=False)
+
+    def source(self):
+        """The code behind the case: its script, or its plan entry as JSON."""
+        if self.plan is not None:
+            return json.dumps(self.plan, indent=2, ensure_ascii=False)
+        return self.path.read_text(encoding="utf-8")
+
+
+def _load_plan():
+    try:
+        return json.loads(TEST_PLAN.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+
+
+def plan_case(entry):
+    """Wrap an executable plan entry so it runs like a script case."""
+    from .plan import run_plan  # runner.plan imports this module via runner.vitals
+
+    return Case(
+        id=entry["id"],
+        title=entry["title"],
+        path=TEST_PLAN,
+        run=partial(run_plan, entry),
+        start_state=entry.get("start_state"),
+        asset_cache=entry.get("asset_cache", True),
+        exclusive=entry.get("exclusive", False),
+        timeout=entry.get("timeout"),
+        features=tuple(entry.get("features", ())),
+        plan=entry,
+    )
+
+
+def load_case(path, titles=None):
+    """Import a case script without running it and wrap its coroutine."""
+    path = Path(path)
+    spec = importlib.util.spec_from_file_location(f"testsprite_cases.{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    run_test = getattr(module, "run_test", None)
+    if not inspect.iscoroutinefunction(run_test):
+        raise CaseLoadError(f"{path.name} does not define 'async def run_test(context)'")
+
+    case_id, _, slug = path.stem.partition("_")
+    title = (titles or {}).get(case_id) or slug.replace("_", " ")
+    return Case(
+        id=case_id,
+        title=title,
+        path=path,
+        run=run_test,
+        start_state=getattr(module, "START_STATE", None),
+        asset_cache=getattr(module, "ASSET_CACHE", True),
+        exclusive=getattr(module, "EXCLUSIVE", False),
+        timeout=getattr(module, "TIMEOUT", None),
+        features=tuple(getattr(module, "FEATURES", ())),
+    )
+
+
+def discover_cases(ids=None, directory=CASES_DIR):
+    """Load every plan and script case, optionally restricted to ``ids``."""
+    from .plan import is_executable  # runner.plan imports this module via runner.vitals
+
+    wanted = {i.upper() for i in ids} if ids else None
+    plan = _load_plan()
+    titles = {entry["id"]: entry["title"] for entry in plan}
+    cases = {entry["id"]: plan_case(entry) for entry in plan
+             if is_executable(entry) and (wanted is None or entry["id"] in wanted)}
+    for path in sorted(Path(directory).glob(CASE_GLOB)):
+        case_id = path.stem.partition("_")[0]
+        if wanted is None or case_id in wanted:
+            cases[case_id] = load_case(path, titles)
+    return [cases[case_id] for case_id in sorted(cases)]
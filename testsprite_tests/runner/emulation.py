@@ -0,0 +1,91 @@
+"""Device profiles applied to a page through CDP ``Emulation`` commands.
+
+Switching metrics on an existing page avoids creating a context per device.
+"""
+
+# Resolves after the next two frames, once resize handlers have run and the
+# new layout has been painted
+_NEXT_FRAMES = """
+() => new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)))
+"""
+
+# Performance.getMetrics counters that measure layout work, in seconds
+_LAYOUT_METRICS = ("RecalcStyleDuration", "LayoutDuration")
+
+PROFILES = {
+    "desktop": {
+        "width": 1280,
+        "height": 720,
+        "deviceScaleFactor": 1,
+        "mobile": False,
+        "userAgent": None,
+        "cpuThrottling": 1,
+    },
+    # iPad Mini metrics
+    "tablet": {
+        "width": 768,
+        "height": 1024,
+        "deviceScaleFactor": 2,
+        "mobile": True,
+        "userAgent": (
+            "Mozilla/5.0 (iPad; CPU OS 17_0 like Mac OS X) AppleWebKit/605.1.15 "
+            "(KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1"
+        ),
+        "cpuThrottling": 2,
+    },
+    # Pixel 5 metrics with a mid-range phone's CPU (4x slower than the host)
+    "mobile": {
+        "width": 393,
+        "height": 851,
+        "deviceScaleFactor": 2.75,
+        "mobile": True,
+        "userAgent": (
+            "Mozilla/5.0 (Linux; Android 11; Pixel 5) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"
+        ),
+        "cpuThrottling": 4,
+    },
+}
+
+
+async def emulate(cdp, name, throttle=True):
+    """Apply profile ``name`` to the page behind the CDP session ``cdp``.
+
+    With ``throttle=False`` only the device metrics change and the CPU runs
+    at full speed.
+    """
+    profile = PROFILES[name]
+    await cdp.send("Emulation.setDeviceMetricsOverride", {
+        "width": profile["width"],
+        "height": profile["height"],
+        "deviceScaleFactor": profile["deviceScaleFactor"],
+        "mobile": profile["mobile"],
+    })
+    await cdp.send("Emulation.setTouchEmulationEnabled", {"enabled": profile["mobile"]})
+    # An override stays until replaced, so profiles without their own user
+    # agent put the browser's default back
+    user_agent = profile["userAgent"] or (await cdp.send("Browser.getVersion"))["userAgent"]
+    await cdp.send("Emulation.setUserAgentOverride", {"userAgent": user_agent})
+    rate = profile["cpuThrottling"] if throttle else 1
+    await cdp.send("Emulation.setCPUThrottlingRate", {"rate": rate})
+    return profile
+
+
+async def layout_work(cdp):
+    """Seconds the page has spent on style recalculation and layout so far.
+
+    Needs ``Performance.enable`` on ``cdp``.
+    """
+    metrics = (await cdp.send("Performance.getMetrics"))["metrics"]
+    return sum(m["value"] for m in metrics if m["name"] in _LAYOUT_METRICS)
+
+
+async def switch_viewport(cdp, page, name):
+    """Re-lay out the loaded ``page`` as device ``name``.
+
+    Returns the style and layout time the switch cost, in seconds.
+    """
+    before = await layout_work(cdp)
+    await emulate(cdp, name, throttle=False)
+    await page.evaluate(_NEXT_FRAMES)
+    return await layout_work(cdp) - before
@@ -0,0 +1,208 @@
+"""Run history in a local SQLite store, and the flakiness and trends drawn from it.
+
+Every run of the runner is appended to ``tmp/history.sqlite3``: the servers
+it ran against and how long warming them took, then per case its final
+status, duration, number of attempts, whether it ran in quarantine, and the
+timing log of its last attempt (readiness waits, plan steps and assertion
+checks).
+
+From the last ``WINDOW`` runs of each case the store derives:
+
+* a flakiness score, the share of runs whose outcome was unstable: the case
+  only passed after a retry, or its status differs from the run before;
+* a duration trend, the least-squares slope of its duration in seconds per
+  run, next to the median duration.
+
+The runner uses the medians to start long cases first and balance shards,
+runs cases whose score reaches ``FLAKY_THRESHOLD`` in a separate quarantine
+pass, and can select the cases that failed in the last run.
+
+Print the current scores with ``python -m runner.history``.
+"""
+
+import json
+import sqlite3
+import statistics
+from contextlib import closing
+from datetime import datetime, timezone
+
+from .cases import CASES_DIR
+from .vitals import git_commit
+
+HISTORY_FILE = CASES_DIR / "tmp" / "history.sqlite3"
+
+# Number of recent runs per case that scores and trends are computed over
+WINDOW = 20
+
+# Cases at or above this flakiness score are quarantined...
+FLAKY_THRESHOLD = 0.3
+
+# ...once they have at least this many recorded runs
+MIN_RUNS = 5
+
+# Recent passing runs whose median duration orders and balances the cases
+DURATION_RUNS = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    git_commit TEXT,
+    options TEXT NOT NULL,
+    servers TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS case_runs (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    case_id TEXT NOT NULL,
+    test_id TEXT,
+    status TEXT NOT NULL,
+    error TEXT NOT NULL,
+    duration REAL NOT NULL,
+    attempts INTEGER NOT NULL,
+    quarantined INTEGER NOT NULL,
+    PRIMARY KEY (run_id, case_id)
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    case_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    duration REAL NOT NULL,
+    ok INTEGER NOT NULL,
+    PRIMARY KEY (run_id, case_id, position)
+);
+CREATE INDEX IF NOT EXISTS case_runs_by_case ON case_runs (case_id, run_id);
+"""
+
+
+def _slope(values):
+    # Least-squares slope of values against their position
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_x = (n - 1) / 2
+    mean_y = sum(values) / n
+    num = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    den = sum((x - mean_x) ** 2 for x in range(n))
+    return num / den
+
+
+def _unstable_runs(rows):
+    # rows: (status, attempts) oldest first
+    unstable = 0
+    previous = None
+    for status, attempts in rows:
+        if (status == "PASSED" and attempts > 1) or (previous is not None and status != previous):
+            unstable += 1
+        previous = status
+    return unstable
+
+
+class History:
+    """Read and append runs; one short-lived connection per call."""
+
+    def __init__(self, path=HISTORY_FILE):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    def _connect(self):
+        # closing() closes the connection; the inner "with db" commits
+        return closing(sqlite3.connect(self.path))
+
+    def record_run(self, results, servers=None, options=None, test_ids=None, quarantined=()):
+        """Append one run; ``results`` are final ``CaseResult``\\ s, one per case."""
+        with self._connect() as db, db:
+            cursor = db.execute(
+                "INSERT INTO runs (started_at, git_commit, options, servers) VALUES (?, ?, ?, ?)",
+                (datetime.now(timezone.utc).isoformat(timespec="seconds"), git_commit(),
+                 json.dumps(options or {}), json.dumps(servers or {})),
+            )
+            run_id = cursor.lastrowid
+            for result in results:
+                db.execute(
+                    "INSERT INTO case_runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (run_id, result.case_id, (test_ids or {}).get(result.case_id), result.status,
+                     result.error, result.duration, result.attempts,
+                     int(result.case_id in quarantined)),
+                )
+                db.executemany(
+                    "INSERT INTO timings VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(run_id, result.case_id, position, timing.kind, timing.name,
+                      timing.duration, int(timing.ok))
+                     for position, timing in enumerate(result.waits)],
+                )
+        return run_id
+
+    def _recent(self, db, case_id, limit, where=""):
+        rows = db.execute(
+            f"SELECT status, attempts, duration FROM case_runs WHERE case_id = ? {where} "
+            "ORDER BY run_id DESC LIMIT ?", (case_id, limit),
+        ).fetchall()
+        return rows[::-1]
+
+    def _case_ids(self, db):
+        return [row[0] for row in db.execute("SELECT DISTINCT case_id FROM case_runs ORDER BY case_id")]
+
+    def durations(self):
+        """Median duration of each case over its recent passing runs, in seconds."""
+        with self._connect() as db:
+            durations = {}
+            for case_id in self._case_ids(db):
+                rows = self._recent(db, case_id, DURATION_RUNS, "AND status = 'PASSED'")
+                rows = rows or self._recent(db, case_id, DURATION_RUNS)
+                durations[case_id] = statistics.median(duration for _, _, duration in rows)
+            return durations
+
+    def stats(self):
+        """Flakiness score, duration trend and last status of every recorded case."""
+        with self._connect() as db:
+            stats = {}
+            for case_id in self._case_ids(db):
+                rows = self._recent(db, case_id, WINDOW)
+                durations = [duration for _, _, duration in rows]
+                stats[case_id] = {
+                    "runs": len(rows),
+                    "flakiness": _unstable_runs([(s, a) for s, a, _ in rows]) / len(rows),
+                    "median": statistics.median(durations),
+                    "trend": _slope(durations),
+                    "last": rows[-1][0],
+                }
+            return stats
+
+    def flaky(self, threshold=FLAKY_THRESHOLD, min_runs=MIN_RUNS):
+        """Ids of the cases to quarantine."""
+        return {case_id for case_id, stat in self.stats().items()
+                if stat["runs"] >= min_runs and stat["flakiness"] >= threshold}
+
+    def last_failed(self):
+        """Ids of the cases that failed in the most recent run that included them."""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT case_id, status FROM case_runs AS c WHERE run_id = "
+                "(SELECT MAX(run_id) FROM case_runs WHERE case_id = c.case_id)"
+            ).fetchall()
+        return {case_id for case_id, status in rows if status != "PASSED"}
+
+
+def order_longest_first(cases, durations):
+    """Sort ``cases`` by recorded duration, unknown cases first, ties by id."""
+    return sorted(cases, key=lambda case: (-durations.get(case.id, float("inf")), case.id))
+
+
+def main():
+    stats = History().stats()
+    if not stats:
+        print("No runs recorded yet.")
+        return
+    print(f"{'case':<8} {'runs':>4} {'flaky':>6} {'median':>8} {'trend':>10}  last")
+    for case_id, stat in stats.items():
+        mark = " ⚠" if stat["runs"] >= MIN_RUNS and stat["flakiness"] >= FLAKY_THRESHOLD else ""
+        print(f"{case_id:<8} {stat['runs']:>4} {stat['flakiness']:>6.2f} {stat['median']:>7.1f}s "
+              f"{stat['trend']:>+8.2f}s/run  {stat['last']}{mark}")
+
+
+if __name__ == "__main__":
+    main()
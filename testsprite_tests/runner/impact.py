@@ -0,0 +1,238 @@
+"""Test impact analysis: select the cases whose features touch changed files.
+
+``tmp/code_summary.json`` maps every feature of the app to its source files,
+and every case names the features it covers (``features`` in its plan entry,
+``FEATURES`` in a script). The files changed against a base ref are taken
+from ``git diff`` plus untracked files, and each feature is widened to
+everything its files import, following the TS/TSX import graph from the app
+entry points (``app/page.tsx``, ``app/layout.tsx`` and the API routes).
+``app/page.tsx`` composes every section, so its own closure stops at files
+another feature owns.
+
+A case runs when one of its features is affected or its own script or plan
+entry changed; a case that names no features covers the whole app and runs
+whenever any feature is affected. The full suite runs instead when a file
+in ``SHARED_FILES`` changed, an imported file no feature covers, or any
+other file outside the import graph (build scripts, config, assets) that is
+neither part of the test suite nor documentation.
+
+Print the analysis without running anything with
+``python -m runner.impact [REF]``.
+"""
+
+import json
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+from .cases import CASES_DIR, TEST_PLAN, discover_cases
+
+ROOT = CASES_DIR.parent
+CODE_SUMMARY = CASES_DIR / "tmp" / "code_summary.json"
+
+# The page every section is composed into
+PAGE = "app/page.tsx"
+
+# Files every case depends on; a change to any of them runs the full suite.
+# Entries ending in "/" match everything below them.
+SHARED_FILES = (
+    "app/layout.tsx",
+    "app/globals.css",
+    "middleware.ts",
+    "next.config.ts",
+    "postcss.config.mjs",
+    "tsconfig.json",
+    "package.json",
+    "package-lock.json",
+    "public/",
+    "testsprite_tests/runner/",
+)
+
+# Changes that cannot affect the app: the suite itself (its cases select
+# themselves) and documentation
+TEST_DIR = "testsprite_tests/"
+DOC_SUFFIXES = (".md",)
+
+_IMPORT = re.compile(
+    r"""(?:\bimport|\bexport)\s[^'"`;]*?\bfrom\s*['"]([^'"]+)['"]"""
+    r"""|\bimport\s*\(?\s*['"]([^'"]+)['"]"""
+)
+_EXTENSIONS = ("", ".ts", ".tsx", ".js", ".jsx", ".mjs", "/index.ts", "/index.tsx")
+
+
+class ImpactError(Exception):
+    """Raised when the changed files cannot be determined."""
+
+
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout
+    except (OSError, subprocess.CalledProcessError) as exc:
+        detail = getattr(exc, "stderr", "") or exc
+        raise ImpactError(f"git {' '.join(args)} failed: {str(detail).strip()}") from exc
+
+
+def changed_files(base="HEAD"):
+    """Repository paths that differ between ``base`` and the working tree."""
+    changed = _git("diff", "--name-only", base, "--").splitlines()
+    changed += _git("ls-files", "--others", "--exclude-standard").splitlines()
+    return sorted(set(filter(None, changed)))
+
+
+def _resolve(importer, spec):
+    if spec.startswith("@/"):
+        base = ROOT / spec[2:]
+    elif spec.startswith("."):
+        base = (ROOT / importer).parent / spec
+    else:
+        return None  # a package; package.json is a shared file
+    for extension in _EXTENSIONS:
+        candidate = base.parent / (base.name + extension)
+        if candidate.is_file():
+            return candidate.resolve().relative_to(ROOT).as_posix()
+    return None
+
+
+def entry_points():
+    """The files Next.js loads by convention: the page, the layout and the API routes."""
+    routes = sorted(path.relative_to(ROOT).as_posix() for path in (ROOT / "app").rglob("route.ts"))
+    return [PAGE, "app/layout.tsx", *routes]
+
+
+def import_graph(entries=None):
+    """Map every file reachable from ``entries`` to the local files it imports."""
+    graph = {}
+    pending = list(entries or entry_points())
+    while pending:
+        path = pending.pop()
+        if path in graph or not (ROOT / path).is_file():
+            continue
+        imports = set()
+        if path.endswith((".ts", ".tsx", ".js", ".jsx", ".mjs")):
+            source = (ROOT / path).read_text(encoding="utf-8")
+            for match in _IMPORT.finditer(source):
+                resolved = _resolve(path, match.group(1) or match.group(2))
+                if resolved:
+                    imports.add(resolved)
+        graph[path] = imports
+        pending.extend(imports - graph.keys())
+    return graph
+
+
+def _closure(graph, start, stop=frozenset()):
+    seen = {start}
+    pending = [start]
+    while pending:
+        for imported in graph.get(pending.pop(), ()):
+            if imported not in seen and imported not in stop:
+                seen.add(imported)
+                pending.append(imported)
+    return seen
+
+
+def load_features(path=CODE_SUMMARY):
+    """Feature name -> source files, from the TestSprite code summary."""
+    summary = json.loads(path.read_text(encoding="utf-8"))
+    return {feature["name"]: feature["files"] for feature in summary["features"]}
+
+
+def feature_files(features, graph):
+    """Widen every feature's files to everything they import."""
+    owned = {path for files in features.values() for path in files}
+    widened = {}
+    for name, files in features.items():
+        reach = set()
+        for path in files:
+            stop = owned - set(files) if path == PAGE else frozenset()
+            reach |= _closure(graph, path, stop)
+        widened[name] = reach
+    return widened
+
+
+def _shared(path):
+    return any(path == shared or (shared.endswith("/") and path.startswith(shared))
+               for shared in SHARED_FILES)
+
+
+def _outside_app(path):
+    return path.startswith(TEST_DIR) or path.endswith(DOC_SUFFIXES)
+
+
+def _changed_entries(base):
+    # Plan entries whose JSON differs from the one at ``base``
+    plan_path = TEST_PLAN.relative_to(ROOT).as_posix()
+    try:
+        before = json.loads(_git("show", f"{base}:{plan_path}"))
+    except (ImpactError, ValueError):
+        before = []
+    after = json.loads(TEST_PLAN.read_text(encoding="utf-8"))
+    old = {entry["id"]: entry for entry in before}
+    return {entry["id"] for entry in after if old.get(entry["id"]) != entry}
+
+
+@dataclass
+class Impact:
+    changed: list
+    cases: list
+    features: list = field(default_factory=list)
+    reason: str = ""
+
+    @property
+    def full_suite(self):
+        return bool(self.reason)
+
+
+def analyze(cases, base="HEAD"):
+    """Select the ``cases`` affected by the files changed against ``base``."""
+    changed = changed_files(base)
+    shared = [path for path in changed if _shared(path)]
+    if shared:
+        return Impact(changed, list(cases), reason=f"shared file {shared[0]} changed")
+
+    graph = import_graph()
+    widened = feature_files(load_features(), graph)
+    covered = set().union(*widened.values())
+    uncovered = [path for path in changed if path in graph and path not in covered]
+    if uncovered:
+        return Impact(changed, list(cases), reason=f"{uncovered[0]} is not part of any feature")
+    unknown = [path for path in changed if path not in graph and not _outside_app(path)]
+    if unknown:
+        return Impact(changed, list(cases), reason=f"{unknown[0]} is outside the import graph")
+
+    changed_set = set(changed)
+    features = sorted(name for name, files in widened.items() if files & changed_set)
+    edited = set()
+    if TEST_PLAN.relative_to(ROOT).as_posix() in changed_set:
+        edited = _changed_entries(base)
+    selected = []
+    for case in cases:
+        own_file = case.plan is None and case.path.relative_to(ROOT).as_posix() in changed_set
+        covers = set(case.features) & set(features) if case.features else features
+        if covers or own_file or case.id in edited:
+            selected.append(case)
+    return Impact(changed, selected, features)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    base = argv[0] if argv else "HEAD"
+    try:
+        impact = analyze(discover_cases(), base)
+    except ImpactError as exc:
+        print(f"❌ {exc}")
+        return 1
+    print(f"{len(impact.changed)} file(s) changed against {base}")
+    for path in impact.changed:
+        print(f"   {path}")
+    if impact.full_suite:
+        print(f"Full suite: {impact.reason}")
+    else:
+        print(f"Affected features: {', '.join(impact.features) or 'none'}")
+    print(f"Cases: {' '.join(case.id for case in impact.cases) or 'none'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
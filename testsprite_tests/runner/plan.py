@@ -0,0 +1,158 @@
+"""Interpreter for the declarative cases in ``testsprite_frontend_test_plan.json``.
+
+Every plan step keeps its ``type`` and human ``description`` and adds a
+machine-readable part the interpreter executes on one page per case:
+
+* action steps carry ``run``: one operation or a list of them, such as
+  ``{"goto": "/"}``, ``{"ready": ["#faq"]}``, ``{"click": "#faq button"}``,
+  ``{"fill": "#name", "value": "Sam"}``, ``{"select": "#service", "value": "..."}``,
+  ``{"press": "Enter", "on": "..."}``, ``{"viewport": [390, 844]}``,
+  ``{"reload": true}``, ``{"scroll": "..."}``, ``{"hover": "..."}``,
+  ``{"focus": "..."}``, ``{"wait_for": "...", "state": "hidden"}``,
+  ``{"mock": "**/api/booking", "status": 200, "json": {...}}``,
+  ``{"clear_storage": true}`` or ``{"observe_layout_shifts": true}`` (before
+  the first ``goto``). Element operations act on the first match, or the
+  last one with ``"last": true``;
+* assertion steps carry ``expect``: one check or a list of them, in the
+  format of :mod:`runner.assertions`.
+
+Adjacent assertion steps are batched: the checks of all of them go to a
+single :func:`runner.assertions.assert_all` call, so they are retried inside
+the page and cost one round trip. A plan entry may also set ``start_state``,
+``asset_cache``, ``exclusive`` and ``timeout`` like a script's
+``START_STATE``/``ASSET_CACHE``/``EXCLUSIVE``/``TIMEOUT``.
+
+An entry with ``viewports`` (names from :data:`runner.emulation.PROFILES`)
+runs as a matrix from a single page load: its first step loads the page
+once, then for each device the page is re-laid out through CDP
+``Emulation.setDeviceMetricsOverride`` and the remaining steps run again.
+A step limited to some devices lists them in its own ``viewports``. Every
+device gets its own result, and the timing log records the layout work
+each switch cost and how long its steps took.
+"""
+
+import time
+
+from .assertions import assert_all
+from .emulation import switch_viewport
+from .readiness import wait_until_ready
+from .timing import record
+from .vitals import observe_layout_shifts
+
+# Navigation timeout for "goto" and "reload", in milliseconds
+NAVIGATION_TIMEOUT_MS = 10000
+
+
+class PlanError(Exception):
+    """Raised when a plan step cannot be interpreted."""
+
+
+def _as_list(value):
+    return value if isinstance(value, list) else [value]
+
+
+def is_executable(entry):
+    """True when every step of a plan entry has a machine-readable part."""
+    steps = entry.get("steps") or []
+    return bool(steps) and all(
+        ("run" if step.get("type") == "action" else "expect") in step for step in steps
+    )
+
+
+def _locate(page, operation, key):
+    locator = page.locator(operation[key])
+    return locator.last if operation.get("last") else locator.first
+
+
+async def _fulfill(route, operation):
+    await route.fulfill(status=operation.get("status", 200), json=operation.get("json", {}))
+
+
+async def _perform(page, operation):
+    if "goto" in operation:
+        await page.goto(operation["goto"], wait_until="commit", timeout=NAVIGATION_TIMEOUT_MS)
+    elif "reload" in operation:
+        await page.reload(wait_until="commit", timeout=NAVIGATION_TIMEOUT_MS)
+    elif "ready" in operation:
+        await wait_until_ready(page, *_as_list(operation["ready"]))
+    elif "click" in operation:
+        await _locate(page, operation, "click").click()
+    elif "hover" in operation:
+        await _locate(page, operation, "hover").hover()
+    elif "focus" in operation:
+        await _locate(page, operation, "focus").focus()
+    elif "scroll" in operation:
+        await _locate(page, operation, "scroll").scroll_into_view_if_needed()
+    elif "fill" in operation:
+        await _locate(page, operation, "fill").fill(operation.get("value", ""))
+    elif "select" in operation:
+        await _locate(page, operation, "select").select_option(operation["value"])
+    elif "press" in operation:
+        if "on" in operation:
+            await _locate(page, operation, "on").press(operation["press"])
+        else:
+            await page.keyboard.press(operation["press"])
+    elif "viewport" in operation:
+        width, height = operation["viewport"]
+        await page.set_viewport_size({"width": width, "height": height})
+    elif "wait_for" in operation:
+        await _locate(page, operation, "wait_for").wait_for(state=operation.get("state", "visible"))
+    elif "mock" in operation:
+        # Answers matching requests locally, e.g. API calls with side effects
+        await page.route(operation["mock"], lambda route: _fulfill(route, operation))
+    elif "clear_storage" in operation:
+        await page.context.clear_cookies()
+        if page.url != "about:blank":
+            await page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+    elif "observe_layout_shifts" in operation:
+        await observe_layout_shifts(page)
+    else:
+        raise PlanError(f"Unknown plan operation: {operation}")
+
+
+async def _run_steps(page, steps, device=None):
+    pending = []
+    for step in steps:
+        if step.get("type") == "action":
+            if pending:
+                await assert_all(page, pending)
+                pending = []
+            started = time.perf_counter()
+            for operation in _as_list(step["run"]):
+                await _perform(page, operation)
+            name = step["description"] if device is None else f"{device}: {step['description']}"
+            record(name, time.perf_counter() - started, kind="step")
+        else:
+            pending.extend((step["description"], spec) for spec in _as_list(step["expect"]))
+    if pending:
+        await assert_all(page, pending)
+
+
+async def _run_matrix(page, entry):
+    load, *steps = entry["steps"]
+    await _run_steps(page, [load])
+
+    cdp = await page.context.new_cdp_session(page)
+    await cdp.send("Performance.enable")
+    failures = []
+    for name in entry["viewports"]:
+        record(f"{name} layout", await switch_viewport(cdp, page, name))
+        started = time.perf_counter()
+        try:
+            await _run_steps(page, [step for step in steps if name in step.get("viewports", [name])], name)
+        except AssertionError as error:
+            failures.append(f"{name}: {str(error).removeprefix('Test case failed: ')}")
+            record(f"{name} steps", time.perf_counter() - started, ok=False)
+        else:
+            record(f"{name} steps", time.perf_counter() - started)
+    if failures:
+        raise AssertionError("Test case failed on " + "; on ".join(failures))
+
+
+async def run_plan(entry, context):
+    """Execute one plan entry in ``context``; assertion failures raise."""
+    page = await context.new_page()
+    if entry.get("viewports"):
+        await _run_matrix(page, entry)
+    else:
+        await _run_steps(page, entry["steps"])
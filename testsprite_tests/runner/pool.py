@@ -0,0 +1,144 @@
+"""Asyncio worker pool that runs cases concurrently in shared browsers.
+
+Every worker owns one Chromium instance. The pool opens ``concurrency`` slots
+spread round-robin over those browsers; each slot pulls the next case from a
+shared queue and runs it in a fresh ``BrowserContext``, so the suite pays the
+browser cold start once per worker instead of once per case.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+from playwright import async_api
+
+from .asset_cache import AssetCache
+from .session import DEFAULT_BASE_URL, launch_browser, new_case_context
+from .snapshots import SnapshotCache
+from .timing import start_log
+
+PASSED = "PASSED"
+FAILED = "FAILED"
+
+# Upper bound for a single case, in seconds
+DEFAULT_CASE_TIMEOUT = 120
+
+
+@dataclass
+class CaseResult:
+    case_id: str
+    title: str
+    status: str
+    error: str = ""
+    duration: float = 0.0
+    waits: list = field(default_factory=list)
+    artifacts: str = ""
+    attempts: int = 1
+
+    @property
+    def passed(self):
+        return self.status == PASSED
+
+
+def _describe(error):
+    if isinstance(error, AssertionError):
+        return str(error)
+    return f"{type(error).__name__}: {error}"
+
+
+async def run_case(browser, case, base_url=DEFAULT_BASE_URL, timeout=DEFAULT_CASE_TIMEOUT,
+                   snapshots=None, assets=None, artifacts=None):
+    """Run one case in its own context and turn the outcome into a result.
+
+    ``timeout`` applies unless the case sets its own. With an
+    :class:`ArtifactStore` the case is traced and profiled, and the
+    artifacts are kept when it fails or is slow.
+    """
+    timeout = case.timeout or timeout
+    waits = start_log()
+    started = time.perf_counter()
+    context = None
+    capture = artifacts.begin(case.id) if artifacts is not None else None
+    try:
+        storage_state = None
+        if case.start_state:
+            snapshots = snapshots or SnapshotCache(browser)
+            storage_state = await snapshots.path_for(case.start_state, base_url)
+        options = capture.context_options() if capture else {}
+        context = await new_case_context(browser, base_url, storage_state, **options)
+        if capture:
+            await capture.start(context)
+        if assets is not None and case.asset_cache:
+            await assets.attach(context, base_url)
+        await asyncio.wait_for(case.run(context), timeout)
+    except asyncio.TimeoutError:
+        status, error = FAILED, f"Timed out after {timeout}s"
+    except Exception as exc:
+        status, error = FAILED, _describe(exc)
+    else:
+        status, error = PASSED, ""
+    finally:
+        if context is not None:
+            try:
+                if capture:
+                    await capture.stop(context)
+            finally:
+                try:
+                    await context.close()
+                except async_api.Error:
+                    pass
+    result = CaseResult(case.id, case.title, status, error, time.perf_counter() - started, waits)
+    if capture:
+        kept = capture.finish(result)
+        result.artifacts = str(kept) if kept else ""
+    return result
+
+
+async def run_cases(cases, concurrency=4, workers=1, base_url=DEFAULT_BASE_URL,
+                    headless=True, timeout=DEFAULT_CASE_TIMEOUT, on_result=None,
+                    asset_cache=True, cache_stats=None, artifacts=None):
+    """Run ``cases`` on the pool and return their results in input order.
+
+    ``base_url`` may be a list of server URLs, in which case the slots are
+    spread across them round-robin. With ``asset_cache`` every worker serves
+    static assets from its own :class:`AssetCache`; the caches' statistics
+    are appended to ``cache_stats`` when a list is given. ``artifacts`` is
+    an optional :class:`ArtifactStore` that captures traces for every case.
+    """
+    if not cases:
+        return []
+    base_urls = [base_url] if isinstance(base_url, str) else list(base_url)
+    workers = max(1, min(workers, len(cases)))
+    concurrency = max(workers, min(concurrency, len(cases)))
+
+    queue = asyncio.Queue()
+    for index, case in enumerate(cases):
+        queue.put_nowait((index, case))
+    results = [None] * len(cases)
+
+    async def slot(browser, snapshots, assets, url):
+        while True:
+            try:
+                index, case = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            result = await run_case(browser, case, url, timeout, snapshots, assets, artifacts)
+            results[index] = result
+            if on_result:
+                on_result(result)
+
+    async with async_api.async_playwright() as pw:
+        browsers = await asyncio.gather(*(launch_browser(pw, headless) for _ in range(workers)))
+        snapshots = [SnapshotCache(browser) for browser in browsers]
+        assets = [AssetCache() if asset_cache else None for _ in browsers]
+        try:
+            await asyncio.gather(*(
+                slot(browsers[i % workers], snapshots[i % workers], assets[i % workers],
+                     base_urls[i % len(base_urls)])
+                for i in range(concurrency)
+            ))
+        finally:
+            await asyncio.gather(*(browser.close() for browser in browsers), return_exceptions=True)
+    if cache_stats is not None:
+        cache_stats.extend(cache.stats() for cache in assets if cache is not None)
+    return results
@@ -0,0 +1,128 @@
+"""Event-driven readiness waits used by every case.
+
+These replace the fixed ``asyncio.sleep(5)`` and 30 s ``expect`` timeouts:
+each helper returns as soon as its signal fires and records how long that
+took, so a slow page shows up in the report rather than hiding in a sleep.
+"""
+
+import asyncio
+import time
+
+from playwright import async_api
+
+from .timing import record
+
+# Timeout for assertions once the page is known to be ready, in milliseconds
+ASSERT_TIMEOUT_MS = 2000
+
+# Upper bound for each individual readiness signal, in milliseconds
+READY_TIMEOUT_MS = 15000
+
+# An element whose inline style has been still for this long is settled
+ANIMATION_QUIET_MS = 150
+
+# Elements that keep changing for longer than this are treated as looping
+# animations (e.g. the hero scroll indicator) and ignored
+ANIMATION_LOOP_MS = 3000
+
+_ANIMATIONS_SETTLED = """
+({ selector, quietMs, loopMs }) => {
+  const root = selector ? document.querySelector(selector) : document.body;
+  if (!root) return false;
+  const state = (window.__readinessStyles ||= new WeakMap());
+  const now = performance.now();
+  let busy = false;
+  for (const el of root.querySelectorAll('[style]')) {
+    const style = el.getAttribute('style');
+    const seen = state.get(el);
+    if (!seen) {
+      state.set(el, { style, first: now, last: now });
+      busy = true;
+      continue;
+    }
+    if (seen.style !== style) {
+      if (now - seen.last > quietMs) seen.first = now;
+      seen.style = style;
+      seen.last = now;
+    }
+    if (now - seen.last < quietMs && now - seen.first < loopMs) busy = true;
+  }
+  const running = document.getAnimations().some((a) =>
+    a.playState === 'running' &&
+    a.effect && a.effect.getTiming().iterations !== Infinity &&
+    root.contains(a.effect.target));
+  return !busy && !running;
+}
+"""
+
+
+async def _timed(name, waiter, required=True):
+    started = time.perf_counter()
+    try:
+        await waiter
+    except async_api.TimeoutError:
+        record(name, time.perf_counter() - started, ok=False)
+        if required:
+            raise
+        return False
+    record(name, time.perf_counter() - started)
+    return True
+
+
+async def _poll_health(page, path, timeout):
+    deadline = time.monotonic() + timeout / 1000
+    delay = 0.05
+    while True:
+        try:
+            response = await page.request.get(path, timeout=timeout)
+            if response.ok and (await response.json()).get("status") == "ok":
+                return
+        except (async_api.Error, ValueError):
+            pass
+        if time.monotonic() + delay > deadline:
+            raise async_api.TimeoutError(f"{path} did not report ok within {timeout}ms")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
+async def wait_for_health(page, path="/api/health", timeout=READY_TIMEOUT_MS):
+    """Wait until the app's health endpoint answers ``{"status": "ok"}``."""
+    return await _timed(path, _poll_health(page, path, timeout))
+
+
+async def wait_for_network_idle(page, timeout=READY_TIMEOUT_MS):
+    """Wait for 500 ms without network traffic; a busy page is not fatal."""
+    return await _timed("network idle", page.wait_for_load_state("networkidle", timeout=timeout),
+                        required=False)
+
+
+async def wait_for_sections(page, *selectors, timeout=READY_TIMEOUT_MS):
+    """Wait until every section anchor (``#services``, ``#gallery``...) is visible."""
+    await asyncio.gather(*(
+        _timed(selector, page.wait_for_selector(selector, state="visible", timeout=timeout))
+        for selector in selectors
+    ))
+
+
+async def wait_for_animations(page, selector=None, timeout=READY_TIMEOUT_MS):
+    """Wait for framer-motion / CSS entrance animations under ``selector`` to end."""
+    arg = {"selector": selector, "quietMs": ANIMATION_QUIET_MS, "loopMs": ANIMATION_LOOP_MS}
+    waiter = page.wait_for_function(_ANIMATIONS_SETTLED, arg=arg, polling="raf", timeout=timeout)
+    return await _timed(f"animations {selector or 'page'}", waiter, required=False)
+
+
+async def wait_until_ready(page, *sections, health=True, network=True, animations=True):
+    """Run the standard readiness sequence after navigating to a page.
+
+    Health and section waits raise on timeout; network idle and animation
+    waits only record the timeout, since a page can be usable without them.
+    """
+    if health:
+        await wait_for_health(page)
+    if network:
+        await wait_for_network_idle(page)
+    if sections:
+        await wait_for_sections(page, *sections)
+    if animations:
+        for section in sections or (None,):
+            await wait_for_animations(page, section)
@@ -0,0 +1,46 @@
+"""Console reporting shared by the in-process and sharded runs."""
+
+
+def _format_waits(waits):
+    # Batched assertions record one timing per check; fold them into one
+    # entry. Plan step timings are only kept in the history store.
+    checks = [w for w in waits if w.kind == "check"]
+    parts = [str(w) for w in waits if w.kind == "wait"]
+    if checks:
+        slowest = max(checks, key=lambda w: w.duration)
+        total = sum(w.duration for w in checks)
+        parts.append(f"{len(checks)} checks {total * 1000:.0f}ms (slowest {slowest})")
+    return ", ".join(parts)
+
+
+def print_result(result, prefix=""):
+    mark = "✅" if result.passed else "❌"
+    print(f"{prefix}{mark} {result.case_id} {result.title} ({result.duration:.1f}s)", flush=True)
+    waits = _format_waits(result.waits)
+    if waits:
+        print(f"{prefix}   waits: {waits}", flush=True)
+    if result.error:
+        print(f"{prefix}   {result.error}", flush=True)
+    if result.artifacts:
+        print(f"{prefix}   artifacts: {result.artifacts}", flush=True)
+
+
+def print_summary(results, wall, cache_stats=None):
+    failed = [r for r in results if not r.passed]
+    serial = sum(r.duration for r in results)
+    print(f"\n{len(results) - len(failed)} passed, {len(failed)} failed "
+          f"in {wall:.1f}s (cases took {serial:.1f}s back to back)")
+
+    waits = sorted(((w, r.case_id) for r in results for w in r.waits if w.kind == "wait"),
+                   key=lambda item: item[0].duration, reverse=True)
+    if waits:
+        print("Slowest waits: " + ", ".join(f"{case_id} {w}" for w, case_id in waits[:3]))
+
+    if cache_stats and cache_stats["hits"] + cache_stats["misses"]:
+        print(f"Asset cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+              f"{cache_stats['bytes_saved'] / 1024 / 1024:.1f} MB not re-served")
+
+    kept = [r for r in results if r.artifacts]
+    if kept:
+        print(f"Traces, HARs and CPU profiles kept for {len(kept)} case(s): "
+              + ", ".join(r.case_id for r in kept))
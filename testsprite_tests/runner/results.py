@@ -0,0 +1,69 @@
+"""Persistence of run results.
+
+Results are merged into ``tmp/test_results.json`` using the schema TestSprite
+already writes there (``testId``, ``testStatus``, ``testError``...), matching
+records by the ``TC0xx`` prefix of their title. The full run history lives
+in :mod:`runner.history`.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone
+
+from .cases import CASES_DIR, TEST_PLAN
+
+RESULTS_FILE = CASES_DIR / "tmp" / "test_results.json"
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _read_json(path, default):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return default
+
+
+def _write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def write_results(results, cases, path=RESULTS_FILE):
+    """Merge ``results`` into the TestSprite results file at ``path``.
+
+    Returns the ``testId`` of every case in ``results``.
+    """
+    records = _read_json(path, [])
+    by_id = {record.get("title", "").partition("-")[0]: record for record in records}
+    descriptions = {entry["id"]: entry.get("description", "") for entry in _read_json(TEST_PLAN, [])}
+    by_case = {case.id: case for case in cases}
+    now = _now()
+
+    for result in results:
+        record = by_id.get(result.case_id)
+        if record is None:
+            record = {
+                "testId": str(uuid.uuid4()),
+                "title": f"{result.case_id}-{result.title}",
+                "description": descriptions.get(result.case_id, ""),
+                "testType": "FRONTEND",
+                "createFrom": "runner",
+                "created": now,
+            }
+            records.append(record)
+            by_id[result.case_id] = record
+        case = by_case.get(result.case_id)
+        if case is not None:
+            record["code"] = case.source()
+        record["testStatus"] = result.status
+        record["testError"] = result.error
+        record["modified"] = now
+
+    records.sort(key=lambda record: record.get("title", ""))
+    _write_json(path, records)
+    return {result.case_id: by_id[result.case_id]["testId"] for result in results}
@@ -0,0 +1,271 @@
+"""App server lifecycle for test runs.
+
+Instead of firing cases at whatever is (or is still compiling) on
+localhost:3000, the runner can build the app once, start one or more
+``next start`` instances on their own ports, wait for ``/api/health`` to
+answer and pre-warm every route before the first case is dispatched.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from .cases import CASES_DIR
+
+PROJECT_ROOT = CASES_DIR.parent
+NEXT_DIR = PROJECT_ROOT / ".next"
+LOG_DIR = CASES_DIR / "tmp"
+
+HEALTH_PATH = "/api/health"
+
+# Warmed when the build has no route manifest to read them from
+DEFAULT_WARM_PATHS = ("/", "/api/gallery", HEALTH_PATH)
+
+# How long a freshly started server may take to answer the health check, in seconds
+STARTUP_TIMEOUT = 60.0
+
+_CHUNK_PATTERN = re.compile(rb"/_next/static/[^\"'\s]+\.(?:js|css)")
+# The build id in the page's flight data: "b":"<id>", escaped inside a script
+_BUILD_ID_PATTERN = re.compile(rb'\\?"b\\?":\\?"([\w-]+)')
+# What next dev serves instead of a build id
+_DEV_BUILD_ID = b"development"
+# What next dev compiles the pages from
+_SOURCE_PATHS = ("app", "public", "middleware.ts", "next.config.ts")
+
+
+class ServerError(Exception):
+    """Raised when an app server cannot be built, started or reached."""
+
+
+def _npm(*args):
+    return [shutil.which("npm") or "npm", *args]
+
+
+def _next(root, *args):
+    # Call the local next binary directly so terminate() reaches the server
+    # itself rather than an npm wrapper process
+    local = shutil.which("next", path=str(root / "node_modules" / ".bin"))
+    if local:
+        return [local, *args]
+    return [shutil.which("npx") or "npx", "next", *args]
+
+
+def build_id(root=PROJECT_ROOT):
+    """Return the id of the current production build, or None if unbuilt."""
+    try:
+        return (root / ".next" / "BUILD_ID").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def ensure_build(root=PROJECT_ROOT, rebuild=False):
+    """Run ``npm run build`` unless a production build already exists."""
+    if build_id(root) and not rebuild:
+        return build_id(root)
+    print("🔨 Building the app for production...", flush=True)
+    completed = subprocess.run(_npm("run", "build"), cwd=root)
+    if completed.returncode != 0 or not build_id(root):
+        raise ServerError("next build failed")
+    return build_id(root)
+
+
+@functools.lru_cache(maxsize=None)
+def site_build_hash(base_url):
+    """Fingerprint the build served at ``base_url``.
+
+    A production build is identified by its build id and its content hashed
+    chunk names. ``next dev`` serves neither, so for a dev server the value
+    also covers the sources in this checkout, which the server is assumed to
+    run from. It is computed once per process.
+    """
+    with urllib.request.urlopen(base_url + "/", timeout=10) as response:
+        html = response.read()
+    match = _BUILD_ID_PATTERN.search(html)
+    served_id = match.group(1) if match else _DEV_BUILD_ID
+    parts = [served_id, *sorted(set(_CHUNK_PATTERN.findall(html)))]
+    if served_id == _DEV_BUILD_ID:
+        parts.append(_source_fingerprint().encode())
+    return hashlib.sha256(b"\n".join(parts)).hexdigest()[:16]
+
+
+def _source_fingerprint(root=PROJECT_ROOT):
+    digest = hashlib.sha256()
+    for name in _SOURCE_PATHS:
+        path = root / name
+        files = sorted(path.rglob("*")) if path.is_dir() else [path]
+        for file in files:
+            try:
+                info = file.stat()
+            except OSError:
+                continue
+            if file.is_file():
+                digest.update(f"{file.relative_to(root)}\0{info.st_size}\0{info.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def route_paths(root=PROJECT_ROOT):
+    """Every static route of the build, read from Next's app route manifest."""
+    try:
+        manifest = json.loads((root / ".next" / "app-path-routes-manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return list(DEFAULT_WARM_PATHS)
+    paths = {route for route in manifest.values() if "[" not in route}
+    paths.update(DEFAULT_WARM_PATHS)
+    return sorted(paths)
+
+
+def _get(url, timeout=10.0):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return response.status, response.read()
+
+
+def wait_until_healthy(base_url, timeout=STARTUP_TIMEOUT, process=None):
+    """Poll the health endpoint of ``base_url`` until it reports ok."""
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while True:
+        if process is not None and process.poll() is not None:
+            raise ServerError(f"server for {base_url} exited with code {process.returncode}")
+        try:
+            status, body = _get(base_url + HEALTH_PATH, timeout=5.0)
+            if status == 200 and json.loads(body).get("status") == "ok":
+                return
+        except (OSError, ValueError):
+            pass
+        if time.monotonic() + delay > deadline:
+            raise ServerError(f"{base_url}{HEALTH_PATH} did not answer within {timeout:.0f}s")
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
+def prewarm(base_url, paths):
+    """Request every path once so route compilation and caches are hot."""
+    timings = {}
+    for path in paths:
+        started = time.perf_counter()
+        try:
+            _get(base_url + path)
+        except urllib.error.HTTPError:
+            pass  # e.g. 405 from POST-only routes: the handler is loaded all the same
+        except OSError as exc:
+            raise ServerError(f"warming {base_url}{path} failed: {exc}") from exc
+        timings[path] = time.perf_counter() - started
+    return timings
+
+
+class AppServer:
+    """One ``next start`` process serving the production build on ``port``."""
+
+    def __init__(self, port, root=PROJECT_ROOT, env=None):
+        self.port = port
+        self.root = root
+        self.env = env or {}
+        self.process = None
+        self.log_path = LOG_DIR / f"server-{port}.log"
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def _command(self):
+        return _next(self.root, "start", "-p", str(self.port)), self.root, {}
+
+    def start(self):
+        command, cwd, env = self._command()
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        log = open(self.log_path, "w", encoding="utf-8")
+        env = {**os.environ, **env, **self.env}
+        self.process = subprocess.Popen(
+            command, cwd=cwd, env=env, stdout=log, stderr=subprocess.STDOUT,
+        )
+        log.close()
+        return self
+
+    def wait_until_healthy(self, timeout=STARTUP_TIMEOUT):
+        try:
+            wait_until_healthy(self.base_url, timeout, self.process)
+        except ServerError as exc:
+            raise ServerError(f"{exc} (see {self.log_path})") from exc
+
+    def stop(self):
+        if self.process is None or self.process.poll() is not None:
+            return
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+
+
+class StandaloneServer(AppServer):
+    """The self-contained ``server.js`` a build with ``output: "standalone"`` emits.
+
+    ``next build`` leaves ``public/`` and ``.next/static`` out of the
+    standalone folder; they are copied in before the server starts.
+    """
+
+    def _command(self):
+        standalone = self.root / ".next" / "standalone"
+        if not (standalone / "server.js").exists():
+            raise ServerError(f"{standalone / 'server.js'} is missing; is output set to 'standalone'?")
+        for source, target in ((self.root / "public", standalone / "public"),
+                               (self.root / ".next" / "static", standalone / ".next" / "static")):
+            if source.exists():
+                shutil.copytree(source, target, dirs_exist_ok=True)
+        node = shutil.which("node") or "node"
+        return [node, "server.js"], standalone, {"PORT": str(self.port), "HOSTNAME": "127.0.0.1"}
+
+
+class ServerPool:
+    """Start ``count`` servers on consecutive ports and gate on their health.
+
+    Used as a context manager; ``base_urls`` lists the ready instances and the
+    runner spreads its browser workers across them.
+    """
+
+    def __init__(self, count=1, first_port=3100, root=PROJECT_ROOT, rebuild=False, env=None):
+        self.root = root
+        self.rebuild = rebuild
+        self.servers = [AppServer(first_port + i, root, env) for i in range(max(1, count))]
+        self.build_id = None
+
+    @property
+    def base_urls(self):
+        return [server.base_url for server in self.servers]
+
+    def __enter__(self):
+        self.build_id = ensure_build(self.root, self.rebuild)
+        try:
+            for server in self.servers:
+                server.start()
+            with ThreadPoolExecutor(max_workers=len(self.servers)) as executor:
+                list(executor.map(lambda server: server.wait_until_healthy(), self.servers))
+        except BaseException:
+            self.stop()
+            raise
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def stop(self):
+        for server in self.servers:
+            server.stop()
+
+
+def warm_up(base_urls, paths=None, timeout=STARTUP_TIMEOUT):
+    """Readiness gate: wait for every server's health check, then pre-warm it."""
+    paths = paths or route_paths()
+    with ThreadPoolExecutor(max_workers=len(base_urls)) as executor:
+        list(executor.map(lambda url: wait_until_healthy(url, timeout), base_urls))
+        timings = list(executor.map(lambda url: prewarm(url, paths), base_urls))
+    return dict(zip(base_urls, timings, strict=True))
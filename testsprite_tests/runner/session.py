@@ -0,0 +1,53 @@
+"""Browser and context setup shared by the runner and the standalone scripts."""
+
+import os
+
+from playwright import async_api
+
+from .snapshots import SnapshotCache
+
+DEFAULT_BASE_URL = os.environ.get("TESTSPRITE_BASE_URL", "http://localhost:3000")
+
+# Default timeout for every action in a case context, in milliseconds
+DEFAULT_TIMEOUT_MS = 5000
+
+# No "--single-process": it pins the whole browser (and every context it
+# hosts) to one core, which defeats running cases and shards in parallel
+BROWSER_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+]
+
+
+async def launch_browser(pw, headless=True):
+    """Launch the Chromium instance a worker shares between its cases."""
+    return await pw.chromium.launch(headless=headless, args=BROWSER_ARGS)
+
+
+async def new_case_context(browser, base_url=DEFAULT_BASE_URL, storage_state=None, **options):
+    """Create an isolated context (like an incognito window) for one case."""
+    context = await browser.new_context(base_url=base_url, storage_state=storage_state, **options)
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    return context
+
+
+async def run_standalone(run_test, start_state=None, base_url=DEFAULT_BASE_URL):
+    """Run a single case with its own Playwright session and browser.
+
+    This keeps ``python TC00x_*.py`` working exactly as before; the runner
+    uses :func:`runner.pool.run_cases` instead.
+    """
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw)
+        try:
+            storage_state = None
+            if start_state:
+                storage_state = await SnapshotCache(browser).path_for(start_state, base_url)
+            context = await new_case_context(browser, base_url, storage_state)
+            try:
+                await run_test(context)
+            finally:
+                await context.close()
+        finally:
+            await browser.close()
@@ -0,0 +1,73 @@
+"""Process-pool sharding of the suite across CPU cores.
+
+Cases are split into shards with the longest-processing-time-first rule:
+taking cases from slowest to fastest (by the durations recorded from past
+runs), each goes to the shard with the least total work so far. Every shard
+is a separate process running its own browser pool, so the browsers are no
+longer confined to the runner's single event loop and core.
+"""
+
+import asyncio
+import heapq
+import multiprocessing
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+from .cases import discover_cases
+from .pool import run_cases
+from .report import print_result
+
+# Assumed duration of a case that has never been recorded, in seconds
+DEFAULT_DURATION = 30.0
+
+
+def balance(case_ids, shards, durations):
+    """Split ``case_ids`` into at most ``shards`` groups of similar total duration."""
+    known = [durations[i] for i in case_ids if i in durations]
+    fallback = statistics.median(known) if known else DEFAULT_DURATION
+    estimate = {i: durations.get(i, fallback) for i in case_ids}
+
+    shards = max(1, min(shards, len(case_ids)))
+    heap = [(0.0, index) for index in range(shards)]
+    groups = [[] for _ in range(shards)]
+    for case_id in sorted(case_ids, key=lambda i: (-estimate[i], i)):
+        total, index = heapq.heappop(heap)
+        groups[index].append(case_id)
+        heapq.heappush(heap, (total + estimate[case_id], index))
+    return [group for group in groups if group]
+
+
+def _run_shard(index, case_ids, options):
+    # Runs in a child process: case modules are re-imported here because
+    # their coroutines cannot be pickled across the process boundary
+    cases = discover_cases(case_ids)
+    prefix = f"[shard {index + 1}] "
+    cache_stats = []
+    results = asyncio.run(run_cases(cases, on_result=lambda r: print_result(r, prefix),
+                                    cache_stats=cache_stats, **options))
+    return results, cache_stats
+
+
+def _shard_options(options, index):
+    # With several app servers, start each shard on a different one
+    base_url = options.get("base_url")
+    if base_url is None or isinstance(base_url, str):
+        return options
+    offset = index % len(base_url)
+    return {**options, "base_url": base_url[offset:] + base_url[:offset]}
+
+
+def run_sharded(cases, shards, durations, cache_stats=None, **options):
+    """Run ``cases`` across ``shards`` worker processes and merge the results."""
+    groups = balance([case.id for case in cases], shards, durations)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(groups), mp_context=context) as executor:
+        futures = [executor.submit(_run_shard, index, group, _shard_options(options, index))
+                   for index, group in enumerate(groups)]
+        by_id = {}
+        for future in futures:
+            results, stats = future.result()
+            by_id.update((result.case_id, result) for result in results)
+            if cache_stats is not None:
+                cache_stats.extend(stats)
+    return [by_id[case.id] for case in cases]
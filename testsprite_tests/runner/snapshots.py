@@ -0,0 +1,104 @@
+"""Cache of Playwright ``storage_state`` snapshots cases can start from.
+
+Most cases do not care about the cookie banner, yet every fresh context runs
+into it. A case declares ``START_STATE = "consent-accepted"`` (or any other
+recipe below) and the runner hands it a context restored from a snapshot
+captured once per origin and site build. When the served build changes, the
+snapshots of the old build are dropped and captured again.
+"""
+
+import asyncio
+import os
+import re
+import shutil
+import time
+
+from .cases import CASES_DIR
+from .server import site_build_hash
+from .timing import record
+
+SNAPSHOT_DIR = CASES_DIR / "tmp" / "storage_states"
+
+
+class SnapshotError(Exception):
+    """Raised for an unknown snapshot name or a failed capture."""
+
+
+async def _set_consent(page, button):
+    await page.goto("/", wait_until="domcontentloaded")
+    await page.get_by_role("button", name=button, exact=True).click()
+    # The consent cookie is what makes the server leave the banner out
+    await page.wait_for_function("() => document.cookie.split('; ').some((c) => c.startsWith('cookie-consent='))")
+
+
+async def _consent_accepted(page):
+    await _set_consent(page, "Accept")
+
+
+async def _consent_declined(page):
+    await _set_consent(page, "Decline")
+
+
+RECIPES = {
+    "consent-accepted": _consent_accepted,
+    "consent-declined": _consent_declined,
+}
+
+
+def _origin_key(base_url):
+    return re.sub(r"[^A-Za-z0-9]+", "_", base_url).strip("_")
+
+
+class SnapshotCache:
+    """Per-worker cache that captures each snapshot at most once per origin."""
+
+    def __init__(self, browser, directory=SNAPSHOT_DIR):
+        self.browser = browser
+        self.directory = directory
+        self._locks = {}
+
+    async def path_for(self, name, base_url):
+        """Return the storage state file for ``name``, capturing it if needed."""
+        if name not in RECIPES:
+            raise SnapshotError(f"unknown start state {name!r} (known: {', '.join(RECIPES)})")
+        build = await asyncio.to_thread(site_build_hash, base_url)
+        path = self.directory / build / _origin_key(base_url) / f"{name}.json"
+        lock = self._locks.setdefault((name, base_url), asyncio.Lock())
+        async with lock:
+            if not path.exists():
+                await self._capture(name, base_url, path)
+        return path
+
+    async def _capture(self, name, base_url, path):
+        started = time.perf_counter()
+        self._prune(path.parent.parent)
+        context = await self.browser.new_context(base_url=base_url)
+        try:
+            page = await context.new_page()
+            try:
+                await RECIPES[name](page)
+            except Exception as exc:
+                raise SnapshotError(f"capturing {name!r} on {base_url} failed: {exc}") from exc
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Other workers and shards may capture the same snapshot at once
+            tmp = path.with_name(f"{path.stem}.{os.getpid()}.{id(self):x}.tmp")
+            await context.storage_state(path=str(tmp))
+            try:
+                tmp.replace(path)
+            except FileNotFoundError:
+                # Only fatal if nobody else got a snapshot into place either
+                if not path.exists():
+                    raise
+            finally:
+                tmp.unlink(missing_ok=True)
+        finally:
+            await context.close()
+        record(f"snapshot {name}", time.perf_counter() - started)
+
+    def _prune(self, current_build_dir):
+        # Snapshots of other builds are stale once the site has been rebuilt
+        if not self.directory.exists():
+            return
+        for child in self.directory.iterdir():
+            if child.is_dir() and child != current_build_dir:
+                shutil.rmtree(child, ignore_errors=True)
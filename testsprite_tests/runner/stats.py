@@ -0,0 +1,26 @@
+"""Small summary statistics for benchmark samples."""
+
+import math
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of ``values`` (``pct`` in 0..100)."""
+    ordered = sorted(v for v in values if v is not None)
+    if not ordered:
+        return None
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values):
+    present = [v for v in values if v is not None]
+    if not present:
+        return {"median": None, "p95": None, "min": None, "max": None, "samples": 0}
+    return {
+        "median": percentile(present, 50),
+        "p95": percentile(present, 95),
+        "min": min(present),
+        "max": max(present),
+        "samples": len(present),
+    }
@@ -0,0 +1,43 @@
+"""Per-case timing log.
+
+The runner opens a fresh log before each case; helpers such as the readiness
+waits append to whatever log is active. Outside the runner (a case script run
+on its own) there is no log, so entries are printed as they happen instead.
+
+Entries have a ``kind``: ``"wait"`` for readiness and layout waits,
+``"check"`` for batched assertions and ``"step"`` for plan steps.
+"""
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+_log = ContextVar("runner_timing_log", default=None)
+
+
+@dataclass
+class Timing:
+    name: str
+    duration: float
+    ok: bool = True
+    kind: str = "wait"
+
+    def __str__(self):
+        suffix = "" if self.ok else " (timed out)"
+        return f"{self.name} {self.duration * 1000:.0f}ms{suffix}"
+
+
+def start_log():
+    """Activate and return a new timing log for the current task."""
+    log = []
+    _log.set(log)
+    return log
+
+
+def record(name, duration, ok=True, kind="wait"):
+    timing = Timing(name, duration, ok, kind)
+    log = _log.get()
+    if log is None:
+        print(f"⏱  {timing}")
+    else:
+        log.append(timing)
+    return timing
@@ -0,0 +1,195 @@
+"""Core Web Vitals collection for the performance benchmark (TC012).
+
+Each sample is one cold load of a page under a device profile: LCP, CLS,
+TBT and INP come from ``PerformanceObserver`` entries recorded by an init
+script, TTFB from the navigation timing entry and the JS heap from CDP
+``Performance.getMetrics``. Samples are summarised as median and p95 and
+checked against the budgets in ``perf_budgets.json``. When
+``scripts/analyze-bundle.js`` has reported on the same build, its per-route
+first-load JS is recorded next to them.
+"""
+
+import json
+import subprocess
+from datetime import datetime, timezone
+
+from .cases import CASES_DIR
+from .emulation import emulate
+from .readiness import wait_for_network_idle
+from .server import build_id
+from .stats import summarize
+
+BUDGETS_FILE = CASES_DIR / "perf_budgets.json"
+PERF_RESULTS_FILE = CASES_DIR / "tmp" / "perf_results.json"
+BUNDLE_REPORT_FILE = CASES_DIR / "tmp" / "bundle_report.json"
+
+# Runs kept in the results file, oldest dropped first
+MAX_RECORDED_RUNS = 200
+
+METRICS = ("lcp_ms", "cls", "tbt_ms", "inp_ms", "ttfb_ms", "js_heap_mb")
+
+_OBSERVERS = """
+(() => {
+  const vitals = { lcp: null, cls: 0, fcp: null, inp: null, longTasks: [] };
+  window.__vitals = vitals;
+  const observe = (type, callback, options = {}) => {
+    try {
+      new PerformanceObserver((list) => list.getEntries().forEach(callback))
+        .observe({ type, buffered: true, ...options });
+    } catch (e) {}
+  };
+  observe('largest-contentful-paint', (e) => { vitals.lcp = e.startTime; });
+  observe('paint', (e) => { if (e.name === 'first-contentful-paint') vitals.fcp = e.startTime; });
+  observe('longtask', (e) => { vitals.longTasks.push([e.startTime, e.duration]); });
+  observe('event', (e) => {
+    if (e.interactionId) vitals.inp = Math.max(vitals.inp || 0, e.duration);
+  }, { durationThreshold: 16 });
+  // CLS uses session windows: shifts less than 1 s apart, capped at 5 s
+  let session = 0, first = 0, last = 0;
+  observe('layout-shift', (e) => {
+    if (e.hadRecentInput) return;
+    if (session && e.startTime - last < 1000 && e.startTime - first < 5000) {
+      session += e.value;
+    } else {
+      session = e.value;
+      first = e.startTime;
+    }
+    last = e.startTime;
+    vitals.cls = Math.max(vitals.cls, session);
+  });
+})();
+"""
+
+_SNAPSHOT = """
+() => {
+  const v = window.__vitals;
+  const nav = performance.getEntriesByType('navigation')[0];
+  const tbt = v.longTasks
+    .filter(([start]) => v.fcp !== null && start >= v.fcp)
+    .reduce((total, [, duration]) => total + Math.max(0, duration - 50), 0);
+  return {
+    lcp_ms: v.lcp,
+    cls: v.cls,
+    tbt_ms: tbt,
+    inp_ms: v.inp,
+    ttfb_ms: nav ? nav.responseStart : null,
+  };
+}
+"""
+
+# Keeps every unexpected layout shift together with the elements it moved
+_SHIFT_LOG = """
+(() => {
+  window.__layoutShifts = [];
+  try {
+    new PerformanceObserver((list) => list.getEntries().forEach((e) => {
+      if (e.hadRecentInput) return;
+      const nodes = e.sources.map((source) => source.node).filter(Boolean);
+      window.__layoutShifts.push({ value: e.value, nodes });
+    })).observe({ type: 'layout-shift', buffered: true });
+  } catch (e) {}
+})();
+"""
+
+# Element clicked once per load so INP has an interaction and LCP is final
+INTERACTION_TARGET = "#about h2"
+
+
+async def measure_load(context, profile, path="/"):
+    """Load ``path`` once, cold, under ``profile`` and return its metrics."""
+    page = await context.new_page()
+    try:
+        cdp = await context.new_cdp_session(page)
+        await emulate(cdp, profile)
+        await cdp.send("Network.enable")
+        # Clears the cache of the whole browser, so callers must not share it
+        await cdp.send("Network.clearBrowserCache")
+        await cdp.send("Performance.enable")
+        await page.add_init_script(_OBSERVERS)
+
+        await page.goto(path, wait_until="load")
+        await wait_for_network_idle(page)
+        await page.locator(INTERACTION_TARGET).click()
+        await page.wait_for_timeout(100)
+
+        sample = await page.evaluate(_SNAPSHOT)
+        metrics = {m["name"]: m["value"] for m in (await cdp.send("Performance.getMetrics"))["metrics"]}
+        sample["js_heap_mb"] = metrics.get("JSHeapUsedSize", 0) / 1024 / 1024
+        return sample
+    finally:
+        await page.close()
+
+
+async def run_benchmark(context, profiles=("desktop", "mobile"), runs=5, path="/"):
+    """Measure ``runs`` loads per profile; return samples and their summary."""
+    report = {}
+    for profile in profiles:
+        samples = [await measure_load(context, profile, path) for _ in range(runs)]
+        report[profile] = {
+            "samples": samples,
+            "summary": {metric: summarize([s.get(metric) for s in samples]) for metric in METRICS},
+        }
+    return report
+
+
+async def observe_layout_shifts(page):
+    """Start logging layout shifts; call before the page navigates."""
+    await page.add_init_script(_SHIFT_LOG)
+
+
+def load_budgets(path=BUDGETS_FILE):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def check_budgets(report, budgets):
+    """Return a message for every summary statistic above its budget."""
+    violations = []
+    for profile, limits in budgets.items():
+        summary = report.get(profile, {}).get("summary", {})
+        for metric, stats in limits.items():
+            for stat, limit in stats.items():
+                value = summary.get(metric, {}).get(stat)
+                if value is not None and value > limit:
+                    violations.append(f"{profile} {metric} {stat} {value:.3g} > budget {limit}")
+    return violations
+
+
+def git_commit():
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=CASES_DIR,
+                                   capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def bundle_summary(path=BUNDLE_REPORT_FILE):
+    """First-load JS per route in kB gzip, if the bundle report matches the local build."""
+    try:
+        report = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if report.get("buildId") != build_id():
+        return None
+    return {
+        "build_id": report["buildId"],
+        "first_load_js_kb": {route: round(data["firstLoadJs"]["gzip"] / 1024, 1)
+                             for route, data in report.get("routes", {}).items()},
+    }
+
+
+def record_results(report, violations, path=PERF_RESULTS_FILE):
+    """Append this run's summaries to the per-commit history next to test_results.json."""
+    try:
+        history = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        history = []
+    history.append({
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "profiles": {profile: data["summary"] for profile, data in report.items()},
+        "violations": violations,
+        "bundle": bundle_summary(),
+    })
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history[-MAX_RECORDED_RUNS:], indent=2) + "\n", encoding="utf-8")